@@ -16,9 +16,9 @@ from pydantic import BaseModel
 from config import settings, STATIC_DIR, LOGGING_CONFIG
 from database.models import get_db, Job, SearchRun
 from database.db_manager import db_manager
-from scrapers.linkedin_scraper import LinkedInScraper, JobSearchParams
+from scrapers.linkedin_scraper_v2 import LinkedInScraper, JobSearchParams, close_shared_resources
 from services.google_sheets_service import GoogleSheetsService
-from services.resume_matcher import ResumeMatcherService, ResumeProfile
+from services.resume_matcher import ResumeMatcherService, ResumeProfile, close_ai_clients
 from models.job_model import JobListing, JobStatus
 
 # Configure logging
@@ -96,7 +96,9 @@ async def startup_event():
         # Initialize Google Sheets service
         if settings.google_sheets_id:
             google_sheets_service = GoogleSheetsService()
-            logger.info("Google Sheets service initialized")
+            # Authenticate now, off the event loop, instead of on the first job
+            if await asyncio.to_thread(lambda: google_sheets_service.service) is not None:
+                logger.info("Google Sheets service initialized")
         
         # Initialize resume matcher
         resume_matcher_service = ResumeMatcherService()
@@ -108,6 +110,19 @@ async def startup_event():
         logger.error(f"Failed to initialize services: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write any jobs still queued for Google Sheets and release scraper resources."""
+    if google_sheets_service:
+        try:
+            google_sheets_service.close()
+        except Exception as e:
+            logger.error(f"Failed to write queued jobs to Google Sheets: {e}")
+    # Browser sessions and HTTP clients belong to this event loop
+    await close_shared_resources()
+    await close_ai_clients()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main web interface."""
@@ -182,14 +197,12 @@ async def perform_job_search(search_id: str, params: Dict[str, Any]):
     try:
         logger.info(f"Starting job search {search_id}")
         
-        # Initialize scraper
-        scraper = LinkedInScraper()
-        
         # Create search parameters
         search_params = JobSearchParams(**params)
         
-        # Perform search
-        jobs = await scraper.search_jobs(search_params)
+        # Perform search; the scraper's browser is released on exit
+        async with LinkedInScraper() as scraper:
+            jobs = await scraper.search_jobs(search_params)
         
         # Update search run
         db_manager.update_search_run(
@@ -29,15 +29,35 @@ class Settings(BaseSettings):
         env="GOOGLE_SHEETS_CREDENTIALS_PATH"
     )
     google_sheets_id: Optional[str] = Field(default=None, env="GOOGLE_SHEETS_ID")
+    # Local index of job IDs already logged, so duplicate checks skip the sheet
+    dup_db_path: str = Field(default=".cache/sheets_seen_ids.db", env="DUP_DB_PATH")
+    # Sheets API requests per minute, kept within the per-user quotas
+    sheets_reads_per_minute: int = Field(default=60, env="SHEETS_READS_PER_MINUTE")
+    sheets_writes_per_minute: int = Field(default=60, env="SHEETS_WRITES_PER_MINUTE")
     
     # LinkedIn (Optional)
     linkedin_email: Optional[str] = Field(default=None, env="LINKEDIN_EMAIL")
     linkedin_password: Optional[str] = Field(default=None, env="LINKEDIN_PASSWORD")
     linkedin_url: str = Field(default="https://www.linkedin.com/login", env="LINKEDIN_URL")
+    # Saved cookies/localStorage reused across runs to skip the login flow
+    linkedin_storage_state_path: str = Field(
+        default="linkedin_state.json",
+        env="LINKEDIN_STORAGE_STATE_PATH"
+    )
     
     # Groq
     groq_api_key: Optional[str] = Field(default=None, env="GROQ_API_KEY")
     groq_model: str = Field(default="llama-3.3-70b-versatile", env="GROQ_MODEL")
+    # Job analyses sent to the LLM at once by batch_analyze_jobs
+    llm_concurrency: int = Field(default=16, env="LLM_CONCURRENCY")
+    # Send batch analyses through OpenAI's Batch API (half price, results within 24h)
+    use_batch_api: bool = Field(default=False, env="USE_BATCH_API")
+    # Job analyses reused while the resume, job and model are unchanged
+    analysis_cache_dir: str = Field(default=".cache/analysis", env="ANALYSIS_CACHE_DIR")
+    # Embedding model used to pre-rank jobs against the resume
+    embedding_model: str = Field(default="text-embedding-3-small", env="EMBEDDING_MODEL")
+    # Jobs whose resume cosine similarity falls below this skip the LLM (0 disables)
+    prefilter_min_similarity: float = Field(default=0.0, env="PREFILTER_MIN_SIMILARITY")
     
     # Database
     database_url: str = Field(
@@ -50,14 +70,25 @@ class Settings(BaseSettings):
     default_job_type: str = Field(default="full-time", env="DEFAULT_JOB_TYPE")
     max_results_per_search: int = Field(default=50, env="MAX_RESULTS_PER_SEARCH")
     search_delay_seconds: int = Field(default=5, env="SEARCH_DELAY_SECONDS")
+    max_concurrency: int = Field(default=5, env="MAX_CONCURRENCY")
+    # Ceiling on LinkedIn requests across all concurrent scrapes
+    max_rate_per_minute: int = Field(default=20, env="MAX_RATE_PER_MINUTE")
+    
+    # Scrape Cache
+    cache_dir: str = Field(default=".cache/linkedin", env="CACHE_DIR")
+    cache_ttl_hours: int = Field(default=24, env="CACHE_TTL_HOURS")
     
     # Resume Configuration
     resume_file_path: Optional[str] = Field(default=None, env="RESUME_FILE_PATH")
+    # Text extracted from resume files, reused while the file is unchanged
+    resume_cache_dir: str = Field(default=".cache/resume", env="RESUME_CACHE_DIR")
     user_skills: str = Field(default="", env="USER_SKILLS")
     
     # Browser Configuration
     browser_headless: bool = Field(default=False, env="BROWSER_HEADLESS")
     browser_timeout: int = Field(default=30000, env="BROWSER_TIMEOUT")
+    # Keep Playwright's per-call stack capture (useful for tracing, costly otherwise)
+    playwright_inspect_stack: bool = Field(default=False, env="PW_INSPECT_STACK")
     
     @property
     def skills_list(self) -> List[str]:
@@ -1,11 +1,37 @@
 """Pydantic models for job data."""
 
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, HttpUrl, validator
 from enum import Enum
 
 
+# Google Sheets columns, in order: GoogleSheetRow field and header text
+SHEET_COLUMNS = (
+    ("job_id", "Job ID"),
+    ("date", "Date"),
+    ("time", "Time"),
+    ("role", "Role"),
+    ("company", "Company"),
+    ("location", "Location"),
+    ("job_type", "Job Type"),
+    ("level", "Level"),
+    ("link", "Link"),
+    ("job_responsibilities", "Job Responsibilities"),
+    ("preferred_skills", "Preferred Skills"),
+    ("matching_skills", "Matching Skills"),
+    ("role_match", "Role Match %"),
+    ("salary", "Salary"),
+    ("posted", "Posted"),
+    ("number_of_applicants", "Number of Applicants"),
+)
+SHEET_FIELDS = tuple(field for field, _ in SHEET_COLUMNS)
+SHEET_HEADERS = tuple(header for _, header in SHEET_COLUMNS)
+_sheet_row_values = attrgetter(*SHEET_FIELDS)
+
+
 class JobType(str, Enum):
     """Job type enumeration."""
     FULL_TIME = "full-time"
@@ -85,6 +111,11 @@ class JobListing(BaseModel):
     notes: Optional[str] = Field(None, description="Personal notes about the job")
     tags: List[str] = Field(default_factory=list, description="Custom tags")
     
+    @cached_property
+    def search_text_lower(self) -> str:
+        """Lowercased title, description, requirements and qualifications, for keyword scans."""
+        return f"{self.title} {self.description} {' '.join(self.requirements)} {' '.join(self.qualifications)}".lower()
+
     @validator("resume_match_score")
     def validate_match_score(cls, v):
         """Ensure match score is between 0 and 100."""
@@ -197,6 +228,16 @@ class GoogleSheetRow(BaseModel):
     @classmethod
     def from_job_listing(cls, job: JobListing) -> "GoogleSheetRow":
         """Create Google Sheet row from job listing."""
+        return cls(**dict(zip(SHEET_FIELDS, cls.values_from_job_listing(job))))
+
+    @staticmethod
+    def values_from_job_listing(job: JobListing) -> List[Any]:
+        """
+        Build the spreadsheet values for a job listing, in column order.
+
+        Same values as from_job_listing(job).to_list(), without constructing
+        and validating a GoogleSheetRow on the bulk append path.
+        """
         scraped_dt = job.scraped_at
 
         # Format responsibilities for spreadsheet
@@ -250,64 +291,30 @@ class GoogleSheetRow(BaseModel):
             # Use extracted skills as matching skills
             matching_skills = ", ".join(job.skills[:5])
 
-        return cls(
-            job_id=job.job_id,
-            date=scraped_dt.strftime("%Y-%m-%d"),
-            time=scraped_dt.strftime("%H:%M:%S"),
-            role=job.title,
-            company=job.company,
-            location=job.location,
-            job_type=job_type_str,
-            level=level_text,
-            link=str(job.url) if job.url else "",
-            job_responsibilities=job_responsibilities,
-            preferred_skills=preferred_skills,
-            matching_skills=matching_skills,
-            role_match=job.resume_match_score or 0,
-            salary=job.salary_range or "Not specified",
-            posted=job.posted_date or "",
-            number_of_applicants=job.applicants_count or ""
-        )
+        return [
+            job.job_id,
+            scraped_dt.strftime("%Y-%m-%d"),
+            scraped_dt.strftime("%H:%M:%S"),
+            job.title,
+            job.company,
+            job.location,
+            job_type_str,
+            level_text,
+            str(job.url) if job.url else "",
+            job_responsibilities,
+            preferred_skills,
+            matching_skills,
+            float(job.resume_match_score or 0),
+            job.salary_range or "Not specified",
+            job.posted_date or "",
+            job.applicants_count or ""
+        ]
     
     def to_list(self) -> List[Any]:
         """Convert to list for Google Sheets API."""
-        return [
-            self.job_id,
-            self.date,
-            self.time,
-            self.role,
-            self.company,
-            self.location,
-            self.job_type,
-            self.level,
-            self.link,
-            self.job_responsibilities,
-            self.preferred_skills,
-            self.matching_skills,
-            self.role_match,
-            self.salary,
-            self.posted,
-            self.number_of_applicants
-        ]
+        return list(_sheet_row_values(self))
 
     @classmethod
     def get_headers(cls) -> List[str]:
         """Get headers for Google Sheets."""
-        return [
-            "Job ID",
-            "Date",
-            "Time",
-            "Role",
-            "Company",
-            "Location",
-            "Job Type",
-            "Level",
-            "Link",
-            "Job Responsibilities",
-            "Preferred Skills",
-            "Matching Skills",
-            "Role Match %",
-            "Salary",
-            "Posted",
-            "Number of Applicants"
-        ]
\ No newline at end of file
+        return list(SHEET_HEADERS)
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""Plain HTTP fetching for LinkedIn job pages that render server-side."""
+
+import asyncio
+import logging
+from typing import List, Dict, Optional, Any
+
+import httpx
+import orjson
+from bs4 import BeautifulSoup
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Status codes LinkedIn answers with when throttling a client
+RETRY_STATUSES = {403, 429}
+
+
+class RateLimitedError(Exception):
+    """Raised when LinkedIn throttles a request."""
+
+
+# Exponential backoff shared by every LinkedIn network call
+retry_rate_limited = retry(
+    retry=retry_if_exception_type(RateLimitedError),
+    wait=wait_exponential(min=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+async def _get(http: httpx.AsyncClient, url: str) -> str:
+    """GET a page, raising RateLimitedError on throttling responses."""
+    response = await http.get(url)
+    if response.status_code in RETRY_STATUSES:
+        raise RateLimitedError(f"{response.status_code} for {url}")
+    response.raise_for_status()
+    return response.text
+
+
+async def fetch_all_parallel(
+    urls: List[Optional[str]],
+    concurrency: int = 64,
+    client: Optional[httpx.AsyncClient] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    retry_throttled: bool = True
+) -> List[Optional[str]]:
+    """
+    Fetch pages concurrently over HTTP/2.
+
+    Args:
+        urls: URLs to fetch; falsy entries are skipped
+        concurrency: Maximum number of requests in flight
+        client: Client to reuse (a temporary one is created otherwise)
+        semaphore: Shared limiter to use instead of a new one sized by concurrency
+        retry_throttled: Back off and retry 403/429 responses; pass False when
+            the caller has a fallback and should not wait out the backoff
+
+    Returns:
+        Page HTML for each URL in input order, None where the fetch failed
+    """
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
+
+    async def get_in_slot(http: httpx.AsyncClient, url: str) -> str:
+        async with semaphore:
+            return await _get(http, url)
+
+    # Backoff waits happen outside the semaphore, so a throttled URL does
+    # not hold a slot the other fetches could use
+    get = retry_rate_limited(get_in_slot) if retry_throttled else get_in_slot
+
+    async def fetch(http: httpx.AsyncClient, url: Optional[str]) -> Optional[str]:
+        if not url:
+            return None
+        try:
+            return await get(http, url)
+        except (httpx.HTTPError, RateLimitedError) as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    if client is not None:
+        return await asyncio.gather(*(fetch(client, url) for url in urls))
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        timeout=10.0
+    ) as http:
+        return await asyncio.gather(*(fetch(http, url) for url in urls))
+
+
+def extract_job_posting(html: str) -> Optional[Dict[str, Any]]:
+    """Return the schema.org JobPosting embedded as JSON-LD in a page, if any."""
+    soup = BeautifulSoup(html, 'lxml')
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = orjson.loads(script.string or '')
+        except ValueError:
+            continue
+
+        items = data if isinstance(data, list) else data.get('@graph', [data]) if isinstance(data, dict) else []
+        for item in items:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                return item
+    return None
+
+
+def parse_job_cards(html: str) -> List[Dict[str, str]]:
+    """
+    Parse the job cards of a server-rendered (logged-out) search results page.
+
+    Returns:
+        One dict per card with title, company, location, posted_date, url and job_id
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    jobs = []
+    for card in soup.select('ul.jobs-search__results-list > li'):
+        title = card.select_one('h3.base-search-card__title')
+        link = card.select_one('a.base-card__full-link')
+        if not title or not link:
+            continue
+        company = card.select_one('h4.base-search-card__subtitle')
+        location = card.select_one('.job-search-card__location')
+        posted = card.select_one('time')
+        urn = card.select_one('[data-entity-urn]')
+        jobs.append({
+            'title': title.get_text(strip=True),
+            'company': company.get_text(strip=True) if company else '',
+            'location': location.get_text(strip=True) if location else '',
+            'posted_date': posted.get('datetime', '') if posted else '',
+            'url': link['href'].split('?', 1)[0],
+            'job_id': urn['data-entity-urn'].rsplit(':', 1)[-1] if urn else ''
+        })
+    return jobs
+
+
+def html_to_text(fragment: str) -> str:
+    """Convert an HTML fragment to text with one line per block element."""
+    return BeautifulSoup(fragment, 'lxml').get_text('\n', strip=True)
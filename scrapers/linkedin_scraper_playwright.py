@@ -1,16 +1,21 @@
 """LinkedIn job scraper using Playwright with login and URL parameter manipulation."""
 
 import asyncio
+import functools
+import inspect
 import logging
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Union
 from datetime import datetime
 import re
 import sys
 import random
+import types
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, Browser
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from playwright_stealth import Stealth
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+import orjson
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -19,12 +24,426 @@ from config import settings
 from services.resume_matcher import ResumeMatcherService, ResumeProfile
 from services.google_sheets_service import GoogleSheetsService
 from models.job_model import JobListing
+from scrapers.http_helper import (
+    RETRY_STATUSES, RateLimitedError, retry_rate_limited,
+    fetch_all_parallel, extract_job_posting, html_to_text
+)
+
+
+def _disable_playwright_stack_inspection():
+    """Stop Playwright from calling inspect.stack() on every API call.
+
+    Playwright captures the caller's stack for each call to report call
+    sites in traces; the frame walk is a large share of event-loop CPU when
+    scraping. PW_INSPECT_STACK=true keeps the original behaviour.
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return
+    shim = types.SimpleNamespace(**vars(inspect))
+    shim.stack = lambda *args, **kwargs: []
+    _connection.inspect = shim
+
+
+if not settings.playwright_inspect_stack:
+    _disable_playwright_stack_inspection()
 
 logger = logging.getLogger(__name__)
 
+# Fallback selector chains for job card fields. Each chain is joined into a
+# single CSS union so one query_selector_all call covers every alternative
+# instead of one round-trip per selector.
+TITLE_SELECTORS = ", ".join([
+    '.base-search-card__title',
+    'h3.base-search-card__title',
+    'a.job-card-list__title strong',
+    'div.job-card-container a strong',
+    'a.job-card-container__link span[aria-hidden="true"]'
+])
+
+COMPANY_SELECTORS = ", ".join([
+    'a[class*="subtitle"]',
+    'span[class*="subtitle"]',
+    '.base-search-card__subtitle > a',
+    '.base-search-card__subtitle',
+    '.artdeco-entity-lockup__subtitle',
+    '[data-test-job-card-company-name]',
+    'h4.job-card-container__company-name',
+    'span.job-card-container__primary-description'
+])
+
+APPLICANTS_SELECTORS = ", ".join([
+    'span:has-text("applicants")',
+    'span:has-text("applicant")',
+    '.job-card-container__applicant-count',
+    'span.job-card-container__footer-item'
+])
+
+SALARY_SELECTORS = ", ".join([
+    'span:has-text("$")',
+    '.job-card-container__salary-info',
+    'span.job-card-container__metadata-item:has-text("$")'
+])
+
+SNIPPET_SELECTORS = ", ".join([
+    '.job-card-list__snippet',
+    '.job-card-search__body',
+    '.job-card-container__benefits',
+    'ul.job-card-container__benefits li',
+    '.base-search-card__metadata',
+    '[class*="snippet"]',
+    '[class*="description"]'
+])
+
+METADATA_SELECTORS = ", ".join([
+    '.job-card-container__metadata-item',
+    'span.job-card-search__badge',
+    '.base-search-card__metadata span',
+    'li.result-benefits__text',
+    '[class*="job-type"]',
+    '[class*="employment"]',
+    '[class*="seniority"]',
+    '.job-card-container__footer-item'
+])
+
+# Detail panel selectors, most specific first. The description lookup walks
+# them in priority order inside the page, so it stays a single round-trip.
+DETAIL_DESCRIPTION_SELECTORS = [
+    # Most common current selectors
+    'div[class*="jobs-description"]',
+    'div[class*="job-details"]',
+    'section[class*="jobs-description"]',
+    'div.jobs-unified-description__content',
+    'div#job-details',
+
+    # Try broader selectors
+    'article[class*="jobs"]',
+    'div[class*="description-content"]',
+    '[data-job-description]',
+
+    # Very broad but specific to job content
+    'div.scaffold-layout__detail',
+    'div.jobs-search__job-details',
+    'div.jobs-view-layout',
+
+    # Legacy selectors
+    '.jobs-description-content',
+    '.details-pane__content'
+]
+DETAIL_PANEL_SELECTOR = ", ".join(DETAIL_DESCRIPTION_SELECTORS)
+
+# Detail panel heading, used to confirm the panel shows the card just clicked
+DETAIL_TITLE_SELECTORS = ", ".join([
+    '.job-details-jobs-unified-top-card__job-title',
+    '.jobs-unified-top-card__job-title',
+    '.jobs-details-top-card__job-title',
+    '.top-card-layout__title'
+])
+
+# Tried one at a time in priority order: a union would return the first
+# match in document order instead
+DETAIL_JOB_TYPE_SELECTORS = (
+    '.jobs-unified-top-card__job-insight span:has-text("Full-time")',
+    '.jobs-unified-top-card__job-insight span:has-text("Part-time")',
+    '.jobs-unified-top-card__job-insight span:has-text("Contract")',
+    '.jobs-unified-top-card__job-insight',
+    '.job-details-jobs-unified-top-card__job-insight'
+)
+
+DETAIL_APPLICANTS_SELECTORS = ", ".join([
+    'span:has-text("applicant")',
+    'span:has-text("applicants")',
+    '.jobs-unified-top-card__applicant-count',
+    'figcaption:has-text("applicant")'
+])
+
+DETAIL_POSTED_SELECTORS = ", ".join([
+    '.jobs-unified-top-card__posted-date',
+    'span:has-text("ago")',
+    'span.tvm__text:has-text("ago")',
+    '.job-details-jobs-unified-top-card__posted-date'
+])
+
+# Returns the text of the first selector (in list order) whose element has
+# more than 100 characters of text.
+_FIRST_LONG_TEXT_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el && el.innerText && el.innerText.length > 100) {
+            return el.innerText;
+        }
+    }
+    return "";
+}"""
+
+# True once the detail panel is rendered for the given job: the URL's
+# currentJobId matches the card's ID, or the panel heading matches its title.
+# The panel containers stay in the DOM between clicks, so their presence alone
+# does not mean the previous job's details have been replaced.
+_PANEL_SHOWS_JOB_JS = """({jobId, title, panelSelector, titleSelector}) => {
+    if (!document.querySelector(panelSelector)) return false;
+    if (jobId && new URL(location.href).searchParams.get('currentJobId') === jobId) return true;
+    const heading = document.querySelector(titleSelector);
+    const text = heading ? (heading.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+    return !!(title && text) && (text.includes(title) || title.includes(text));
+}"""
+
+# textContent skips the layout pass innerText forces; whitespace from the
+# markup is collapsed so short fields read the same as their rendered text.
+_TEXT_CONTENT_JS = "(e) => (e.textContent || '').replace(/\\s+/g, ' ').trim()"
+
+
+# Placeholder for fields a job did not set in the columnar job store
+_MISSING = object()
+
+
+async def _text_content(elem) -> str:
+    """Return an element's whitespace-normalized textContent."""
+    return await elem.evaluate(_TEXT_CONTENT_JS)
+
+
+async def _first_text(root, selector: str, predicate=None) -> str:
+    """
+    Return the first non-empty text among elements matching a selector union.
+
+    Args:
+        root: Page or element handle to query from
+        selector: Comma-separated CSS selector union
+        predicate: Optional filter applied to the stripped text
+
+    Returns:
+        Stripped text of the first accepted element, or an empty string
+    """
+    for elem in await root.query_selector_all(selector):
+        try:
+            text = await _text_content(elem)
+        except Exception:
+            continue
+        if text and (predicate is None or predicate(text)):
+            return text
+    return ""
+
+
+# Patterns for years of experience, tried in order (first group is the lower bound)
+YEARS_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
+    r'(\d+)\s*-\s*(\d+)\s*years?\s*(?:of\s*)?(?:experience|exp)',  # Take lower bound
+    r'minimum\s*(?:of\s*)?(\d+)\s*years?',
+    r'at\s*least\s*(\d+)\s*years?',
+    r'(\d+)\s*years?\s*minimum',
+    r'requires?\s*(\d+)\s*years?',
+    r'(\d+)\s*years?\s*required',
+    r'(\d+)\s*years?\s*preferred'
+))
+
+ENTRY_LEVEL_TERMS = ('entry level', 'entry-level', '0-2 years', 'fresh graduate', 'new graduate')
+
+# Section headers that open/close the responsibilities and requirements lists
+RESPONSIBILITIES_START = (
+    'responsibilities:', 'what you\'ll do:', 'you will:',
+    'your responsibilities:', 'key responsibilities:', 'duties:'
+)
+RESPONSIBILITIES_END = (
+    'requirements:', 'qualifications:', 'skills:', 'what we need:',
+    'about you:', 'experience:', 'education:', 'benefits:'
+)
+REQUIREMENTS_START = ('requirements:', 'qualifications:', 'must have:', 'required:')
+REQUIREMENTS_END = ('responsibilities:', 'benefits:', 'nice to have:', 'preferred:')
+
+
+def _any_of(needles: Tuple[str, ...]) -> re.Pattern:
+    """Compile literal needles into one alternation so a line is scanned once."""
+    return re.compile("|".join(re.escape(needle) for needle in needles))
+
+
+ENTRY_LEVEL_RE = _any_of(ENTRY_LEVEL_TERMS)
+RESPONSIBILITIES_START_RE = _any_of(RESPONSIBILITIES_START)
+RESPONSIBILITIES_END_RE = _any_of(RESPONSIBILITIES_END)
+REQUIREMENTS_START_RE = _any_of(REQUIREMENTS_START)
+REQUIREMENTS_END_RE = _any_of(REQUIREMENTS_END)
+
+# Leading bullets/numbering stripped from section lines
+BULLET_PREFIX_RE = re.compile(r'^[\s•\-\*\d\.]+')
+
+# Maximum number of categories searched concurrently (one page each)
+MAX_PARALLEL_PAGES = 3
+
+SEARCH_BASE_URL = "https://www.linkedin.com/jobs/search/"
+
+
+@functools.lru_cache(maxsize=256)
+def _build_search_url(keywords: str, seconds: Optional[int] = None) -> str:
+    """Build a canonical job search URL, optionally limited to the last `seconds`."""
+    query = {"keywords": keywords}
+    if seconds:
+        query["f_TPR"] = f"r{seconds}"
+    return f"{SEARCH_BASE_URL}?{urlencode(query)}"
+
+
+@functools.lru_cache(maxsize=256)
+def _with_time_filter(url: str, seconds: int) -> str:
+    """Return url with its f_TPR time filter set to `seconds`, query keys sorted."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query["f_TPR"] = f"r{seconds}"
+    return urlunsplit(parts._replace(query=urlencode(sorted(query.items()))))
+
+
+# URL fragments LinkedIn redirects to when a session is not logged in
+LOGIN_REDIRECT_MARKERS = ('/login', '/authwall', '/checkpoint', '/uas/')
+
+# Maximum LinkedIn requests in flight per scraper (navigations + HTTP fetches)
+MAX_NETWORK_CONCURRENCY = 20
+
+# Random delay (seconds) before each page navigation
+NAVIGATION_JITTER = (0.5, 1.5)
+
+# Google Sheets upload pipeline: bounded queue, appended in batches
+SHEETS_QUEUE_SIZE = 200
+SHEETS_BATCH_SIZE = 50
+
+
+class _SkillMatcher:
+    """Find skills from a fixed list in text with one precompiled regex scan."""
+
+    def __init__(self, skills: List[str]):
+        self.skills = skills
+        lowered = [skill.lower() for skill in skills]
+        # Longest alternatives first so "spring boot" wins over "spring"
+        alternatives = sorted(set(lowered), key=len, reverse=True)
+        self.pattern = re.compile(
+            "|".join(self._word(skill) for skill in alternatives),
+            re.IGNORECASE
+        )
+        # A scan reports one match per position, so remember which shorter
+        # skills each skill contains (e.g. "sql server" also implies "sql")
+        self.implied = {
+            outer: [inner for inner in alternatives if inner != outer and re.search(self._word(inner), outer)]
+            for outer in alternatives
+        }
+
+    @staticmethod
+    def _word(skill: str) -> str:
+        return r'\b' + re.escape(skill) + r'\b'
+
+    def find(self, text: str) -> List[str]:
+        """Return matched skills in list order."""
+        found = set()
+        for match in self.pattern.finditer(text):
+            key = match.group(0).lower()
+            found.add(key)
+            found.update(self.implied[key])
+        return [skill for skill in self.skills if skill.lower() in found]
+
+
+# Skills recognised in job card snippets and titles
+CARD_TECH_SKILLS = [
+    # Programming Languages
+    'Java', 'Python', 'JavaScript', 'TypeScript', 'C#', 'C++', 'Ruby', 'Go', 'Scala', 'PHP',
+    # Frontend
+    'React', 'Angular', 'Vue', 'HTML', 'CSS', 'SASS', 'Redux', 'Next.js', 'Svelte',
+    # Backend
+    'Spring', 'Spring Boot', 'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', '.NET',
+    # Databases
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'Cassandra', 'DynamoDB',
+    # Cloud & DevOps
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'CI/CD', 'Terraform',
+    # Data & BI
+    'Tableau', 'Power BI', 'Excel', 'SQL Server', 'ETL', 'Data Warehouse', 'Snowflake',
+    'Apache Spark', 'Hadoop', 'Airflow', 'SSIS', 'SSRS', 'DAX', 'MDX',
+    # APIs & Integration
+    'REST', 'RESTful', 'API', 'GraphQL', 'SOAP', 'Microservices', 'Kafka', 'RabbitMQ',
+    # Testing & Quality
+    'JUnit', 'Jest', 'Selenium', 'Testing', 'TDD', 'pytest', 'Cypress',
+    # Tools & Frameworks
+    'Git', 'GitHub', 'GitLab', 'JIRA', 'Confluence', 'Agile', 'Scrum', 'Kanban',
+    'JPA', 'Hibernate', 'Maven', 'Gradle', 'npm', 'webpack',
+    # General
+    'Full Stack', 'Frontend', 'Backend', 'DevOps', 'Machine Learning', 'AI', 'Data Science'
+]
+
+# Skills recognised in full job descriptions
+DETAIL_TECH_SKILLS = [
+    'Java', 'Python', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue', 
+    'Spring', 'Spring Boot', 'Node.js', 'Express', '.NET', 'C#', 'C++',
+    'SQL', 'NoSQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Oracle', 'Redis',
+    'AWS', 'Azure', 'GCP', 'Cloud', 'Docker', 'Kubernetes', 'Jenkins',
+    'CI/CD', 'DevOps', 'Microservices', 'REST', 'RESTful', 'API', 'GraphQL',
+    'Git', 'GitHub', 'GitLab', 'Agile', 'Scrum', 'JIRA', 'Kafka', 'RabbitMQ',
+    'HTML', 'CSS', 'SASS', 'Bootstrap', 'Material UI', 'Tailwind',
+    'JPA', 'Hibernate', 'Maven', 'Gradle', 'JUnit', 'Jest', 'Selenium',
+    'Machine Learning', 'AI', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy'
+]
+
+_CARD_SKILLS = _SkillMatcher(CARD_TECH_SKILLS)
+_DETAIL_SKILLS = _SkillMatcher(DETAIL_TECH_SKILLS)
+
+
+# (needle, field, value, unless) rules checked in order; the first match
+# per field wins, mirroring the original if/elif ladders
+JOB_TYPE_RULES = (
+    ('full-time', 'job_type', 'full-time', None),
+    ('full time', 'job_type', 'full-time', None),
+    ('part-time', 'job_type', 'part-time', None),
+    ('part time', 'job_type', 'part-time', None),
+    ('contract', 'job_type', 'contract', None),
+    ('temporary', 'job_type', 'temporary', None),
+    ('temp', 'job_type', 'temporary', None),
+    ('internship', 'job_type', 'internship', None),
+    ('intern', 'job_type', 'internship', None),
+    ('volunteer', 'job_type', 'volunteer', None),
+)
+
+EXPERIENCE_LEVEL_RULES = (
+    ('entry', 'experience_level', 'entry', None),
+    ('junior', 'experience_level', 'entry', None),
+    ('associate', 'experience_level', 'associate', None),
+    ('mid-senior', 'experience_level', 'mid-senior', None),
+    ('mid senior', 'experience_level', 'mid-senior', None),
+    ('senior', 'experience_level', 'mid-senior', 'mid'),  # Map senior to mid-senior
+    ('director', 'experience_level', 'director', None),
+    ('lead', 'experience_level', 'director', None),
+    ('principal', 'experience_level', 'director', None),
+    ('executive', 'experience_level', 'executive', None),
+    ('vp', 'experience_level', 'executive', None),
+    ('president', 'experience_level', 'executive', None),
+)
+
+CARD_METADATA_RULES = JOB_TYPE_RULES + EXPERIENCE_LEVEL_RULES
+
+# Experience level hints in job titles
+TITLE_LEVEL_RULES = (
+    ('senior', 'experience_level', 'mid-senior', None),
+    ('sr.', 'experience_level', 'mid-senior', None),
+    ('sr ', 'experience_level', 'mid-senior', None),
+    ('junior', 'experience_level', 'entry', None),
+    ('jr.', 'experience_level', 'entry', None),
+    ('jr ', 'experience_level', 'entry', None),
+    ('lead', 'experience_level', 'director', None),
+    ('principal', 'experience_level', 'director', None),
+    ('director', 'experience_level', 'director', None),
+    ('manager', 'experience_level', 'director', None),
+    ('vp', 'experience_level', 'executive', None),
+    ('vice president', 'experience_level', 'executive', None),
+)
+
+
+def _classify(text_lower: str, rules: Tuple, found: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Fill fields from the first matching rule for each, skipping fields already found."""
+    if found is None:
+        found = {}
+    for needle, field, value, unless in rules:
+        if field not in found and needle in text_lower and not (unless and unless in text_lower):
+            found[field] = value
+    return found
+
 
 class JobSearchParams(BaseModel):
     """Parameters for LinkedIn job search."""
+    # Read-only once built, so it is hashable and safe to share between tasks
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     keywords: str
     location: str = settings.default_location
     job_type: Optional[str] = settings.default_job_type
@@ -40,33 +459,42 @@ class LinkedInScraperPlaywright:
     
     def __init__(self):
         """Initialize the LinkedIn scraper."""
+        self._playwright = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.jobs_scraped = []
+        # Scraped jobs are stored column-wise (field -> values) so sheet and
+        # CSV writers can consume whole columns without per-row dict lookups
+        self._columns: Dict[str, List[Any]] = {}
+        self._row_count = 0
         self.resume_matcher = None
         self.google_sheets = None
+        # Jobs are queued for upload so Sheets writes overlap with scraping
+        self._sheets_queue: Optional[asyncio.Queue] = None
+        self._sheets_uploader: Optional[asyncio.Task] = None
+        # Caps concurrent LinkedIn requests across pages and HTTP fetches
+        self._net_sem = asyncio.BoundedSemaphore(MAX_NETWORK_CONCURRENCY)
         
     async def initialize(self):
-        """Initialize browser and services."""
+        """Initialize browser and services.
+
+        Launches Playwright and Chromium once per scraper; later calls reuse
+        them and every category search opens a context on the same browser.
+        """
+        if self.browser:
+            return
         try:
-            playwright = await async_playwright().start()
+            self._playwright = await async_playwright().start()
             
-            # Launch browser (set headless=True for production)
-            self.browser = await playwright.chromium.launch(
-                headless=False,  # Set to True in production
+            self.browser = await self._playwright.chromium.launch(
+                headless=settings.browser_headless,
                 args=['--disable-blink-features=AutomationControlled']
             )
             
-            # Create new page with realistic viewport
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            self.page = await context.new_page()
-            
-            # Apply stealth mode to bypass detection
-            stealth_config = Stealth()
-            await stealth_config.apply_stealth_async(self.page)
+            # Reuse the session saved by a previous login when there is one
+            state_path = Path(settings.linkedin_storage_state_path)
+            self.context = await self._new_context(str(state_path) if state_path.exists() else None)
+            self.page = await self._new_page(self.context)
             logger.info("Stealth mode applied to browser")
             
             # Initialize resume matcher
@@ -81,6 +509,8 @@ class LinkedInScraperPlaywright:
             # Initialize Google Sheets
             if settings.google_sheets_id:
                 self.google_sheets = GoogleSheetsService()
+                self._sheets_queue = asyncio.Queue(maxsize=SHEETS_QUEUE_SIZE)
+                self._sheets_uploader = asyncio.create_task(self._drain_to_sheets())
                 logger.info("Google Sheets service initialized")
             
             logger.info("Browser and services initialized")
@@ -89,13 +519,66 @@ class LinkedInScraperPlaywright:
             logger.error(f"Failed to initialize: {e}")
             raise
     
+    async def _new_context(self, storage_state: Optional[Union[str, Dict[str, Any]]] = None) -> BrowserContext:
+        """Create a browser context with a realistic viewport, optionally reusing cookies (dict or file path)."""
+        return await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            storage_state=storage_state
+        )
+
+    async def _new_page(self, context: BrowserContext) -> Page:
+        """Open a page in the context with stealth mode applied to bypass detection."""
+        page = await context.new_page()
+        await Stealth().apply_stealth_async(page)
+        return page
+
+    async def _goto(self, page: Page, url: str, **kwargs):
+        """Navigate the page after a short random delay.
+
+        Anti-bot jitter lives here, around outgoing navigations, rather than
+        between DOM reads on an already loaded page. Throttled responses
+        are retried with exponential backoff; a page still blocked after the
+        retries is logged and left loaded, so the scrape carries on as it
+        would with any other page that has no results.
+        """
+        try:
+            return await self._goto_with_backoff(page, url, **kwargs)
+        except RateLimitedError as e:
+            logger.warning(f"Still rate limited after retries, continuing: {e}")
+            return None
+
+    @retry_rate_limited
+    async def _goto_with_backoff(self, page: Page, url: str, **kwargs):
+        """Navigate once, raising RateLimitedError on a throttled response."""
+        await asyncio.sleep(random.uniform(*NAVIGATION_JITTER))
+        async with self._net_sem:
+            response = await page.goto(url, **kwargs)
+        if response and response.status in RETRY_STATUSES:
+            raise RateLimitedError(f"{response.status} for {url}")
+        return response
+
+    async def ensure_logged_in(self):
+        """Log in unless the saved session is still valid."""
+        if Path(settings.linkedin_storage_state_path).exists():
+            try:
+                await self._goto(self.page, "https://www.linkedin.com/jobs/", wait_until='domcontentloaded', timeout=15000)
+                if not any(marker in self.page.url for marker in LOGIN_REDIRECT_MARKERS):
+                    logger.info("Reusing saved LinkedIn session")
+                    return
+                logger.info("Saved LinkedIn session expired, logging in again")
+            except Exception as e:
+                logger.warning(f"Could not verify saved session: {e}")
+
+        await self.login()
+
     async def login(self):
-        """Login to LinkedIn using credentials from settings."""
+        """Login to LinkedIn using credentials from settings and save the session."""
         try:
             logger.info(f"Navigating to LinkedIn login: {settings.linkedin_url}")
             
             # Go to login page
-            await self.page.goto(settings.linkedin_url, wait_until='networkidle')
+            await self._goto(self.page, settings.linkedin_url, wait_until='networkidle')
             await asyncio.sleep(2)
             
             # Enter email with human-like behavior
@@ -129,6 +612,8 @@ class LinkedInScraperPlaywright:
             try:
                 await self.page.wait_for_selector('div.global-nav', timeout=10000)
                 logger.info("Successfully logged in to LinkedIn")
+                await self.context.storage_state(path=settings.linkedin_storage_state_path)
+                logger.info(f"Saved LinkedIn session to {settings.linkedin_storage_state_path}")
             except:
                 logger.warning("Login verification timeout - continuing anyway")
             
@@ -136,7 +621,7 @@ class LinkedInScraperPlaywright:
             logger.error(f"Login failed: {e}")
             raise
     
-    async def search_and_extract_jobs(self, params: JobSearchParams) -> List[Dict[str, Any]]:
+    async def search_and_extract_jobs(self, params: JobSearchParams, page: Optional[Page] = None) -> List[Dict[str, Any]]:
         """
         Search for jobs using the search bar and extract with URL manipulation.
 
@@ -149,16 +634,18 @@ class LinkedInScraperPlaywright:
 
         Args:
             params: Search parameters
+            page: Page to search on (defaults to the main logged-in page)
 
         Returns:
             List of job dictionaries with match scores
         """
+        page = page or self.page
         try:
             logger.info(f"Searching for: {params.keywords}")
 
             # Navigate to LinkedIn jobs page first to ensure search bar is available
             logger.info("Navigating to LinkedIn jobs page...")
-            await self.page.goto("https://www.linkedin.com/jobs/", wait_until='domcontentloaded', timeout=15000)
+            await self._goto(page, "https://www.linkedin.com/jobs/", wait_until='domcontentloaded', timeout=15000)
             await asyncio.sleep(3)
 
             # Step 1: Use the search bar - try multiple selectors
@@ -177,7 +664,7 @@ class LinkedInScraperPlaywright:
 
             for selector in search_bar_selectors:
                 try:
-                    search_bar = await self.page.wait_for_selector(selector, timeout=5000)
+                    search_bar = await page.wait_for_selector(selector, timeout=5000)
                     if search_bar:
                         logger.info(f"Found search bar using selector: {selector}")
                         break
@@ -186,7 +673,7 @@ class LinkedInScraperPlaywright:
 
             if not search_bar:
                 # Take screenshot for debugging
-                await self.page.screenshot(path="debug_search_bar_not_found.png")
+                await page.screenshot(path="debug_search_bar_not_found.png")
                 logger.error("Could not find search bar with any selector. Screenshot saved.")
                 raise Exception("Search bar not found on LinkedIn jobs page")
 
@@ -199,32 +686,32 @@ class LinkedInScraperPlaywright:
             logger.info("Navigating to Jobs section...")
             
             # Check if we're already on a jobs page
-            current_url = self.page.url
+            current_url = page.url
             if '/jobs/' in current_url:
                 logger.info("Already on jobs search page, skipping Jobs navigation")
             else:
                 try:
                     # Wait for primary navigation to be visible
                     try:
-                        await self.page.wait_for_selector('nav[aria-label="Primary"]', timeout=5000)
+                        await page.wait_for_selector('nav[aria-label="Primary"]', timeout=5000)
                         logger.info("Primary navigation found")
                     except:
                         logger.warning("Primary navigation not found, trying alternative approach")
                     
                     # Method 1: Try to find Jobs link in primary navigation
-                    jobs_button = await self.page.query_selector('nav[aria-label="Primary"] a:has-text("Jobs")')
+                    jobs_button = await page.query_selector('nav[aria-label="Primary"] a:has-text("Jobs")')
                     
                     # Method 2: Try data-test attribute
                     if not jobs_button:
-                        jobs_button = await self.page.query_selector('a[data-test-global-nav-link="jobs"]')
+                        jobs_button = await page.query_selector('a[data-test-global-nav-link="jobs"]')
                     
                     # Method 3: Try finding Jobs in the header navigation
                     if not jobs_button:
-                        jobs_button = await self.page.query_selector('header a:has-text("Jobs")')
+                        jobs_button = await page.query_selector('header a:has-text("Jobs")')
                     
                     # Method 4: Try the filter pills if we're on search results
                     if not jobs_button:
-                        jobs_button = await self.page.query_selector('button:text("Jobs"):not(.artdeco-card button)')
+                        jobs_button = await page.query_selector('button:text("Jobs"):not(.artdeco-card button)')
                     
                     if jobs_button:
                         # Scroll into view and click
@@ -234,13 +721,13 @@ class LinkedInScraperPlaywright:
                         await asyncio.sleep(3)
                     else:
                         # Take a screenshot for debugging
-                        await self.page.screenshot(path="jobs_button_not_found.png")
+                        await page.screenshot(path="jobs_button_not_found.png")
                         logger.warning("Could not find Jobs button, screenshot saved. Continuing anyway...")
                         
                         # Alternative: Navigate directly to jobs URL
-                        jobs_url = f"https://www.linkedin.com/jobs/search/?keywords={params.keywords.replace(' ', '%20')}"
+                        jobs_url = _build_search_url(params.keywords)
                         logger.info(f"Navigating directly to jobs URL: {jobs_url}")
-                        await self.page.goto(jobs_url, wait_until='domcontentloaded', timeout=15000)
+                        await self._goto(page, jobs_url, wait_until='domcontentloaded', timeout=15000)
                         
                 except Exception as e:
                     logger.error(f"Error navigating to Jobs: {e}")
@@ -262,7 +749,7 @@ class LinkedInScraperPlaywright:
             
             for selector in date_button_selectors:
                 try:
-                    button = await self.page.wait_for_selector(selector, timeout=5000)
+                    button = await page.wait_for_selector(selector, timeout=5000)
                     await button.click()
                     logger.info("Opened Date Posted dropdown")
                     await asyncio.sleep(2)
@@ -277,7 +764,7 @@ class LinkedInScraperPlaywright:
                     
                     for past_selector in past_24_selectors:
                         try:
-                            option = await self.page.wait_for_selector(past_selector, timeout=3000)
+                            option = await page.wait_for_selector(past_selector, timeout=3000)
                             await option.click()
                             logger.info("Selected Past 24 hours")
                             
@@ -290,7 +777,7 @@ class LinkedInScraperPlaywright:
                             
                             for apply_selector in apply_selectors:
                                 try:
-                                    apply_btn = await self.page.wait_for_selector(apply_selector, timeout=3000)
+                                    apply_btn = await page.wait_for_selector(apply_selector, timeout=3000)
                                     await apply_btn.click()
                                     date_filter_applied = True
                                     logger.info("Applied date filter")
@@ -311,7 +798,7 @@ class LinkedInScraperPlaywright:
             await asyncio.sleep(3)
             
             # Step 4: Modify URL from r86400 to r3600
-            current_url = self.page.url
+            current_url = page.url
             logger.info(f"Current URL: {current_url}")
             
             # Check if URL already has the 1-hour filter
@@ -319,20 +806,14 @@ class LinkedInScraperPlaywright:
                 logger.info("URL already has 1-hour filter (r3600), skipping navigation")
                 await asyncio.sleep(3)  # Just wait for any dynamic content
             else:
-                # Need to modify the URL
-                if 'f_TPR=' in current_url:
-                    # Replace existing time filter with r3600
-                    modified_url = re.sub(r'f_TPR=r\d+', 'f_TPR=r3600', current_url)
-                else:
-                    # Add the parameter if not present
-                    separator = '&' if '?' in current_url else '?'
-                    modified_url = f"{current_url}{separator}f_TPR=r3600"
+                # Replace (or add) the time filter, keeping the other query parameters
+                modified_url = _with_time_filter(current_url, 3600)
                 
                 logger.info(f"Modified URL (1-hour filter): {modified_url}")
                 
                 # Navigate with shorter timeout and different wait strategy
                 try:
-                    await self.page.goto(modified_url, wait_until='domcontentloaded', timeout=15000)
+                    await self._goto(page, modified_url, wait_until='domcontentloaded', timeout=15000)
                     await asyncio.sleep(5)  # Wait for jobs to load
                 except Exception as e:
                     logger.warning(f"Navigation timeout, continuing anyway: {e}")
@@ -340,29 +821,24 @@ class LinkedInScraperPlaywright:
             
             # Step 5: Extract jobs from the page
             logger.info("Extracting jobs from 1-hour filtered results...")
-            jobs = await self._extract_jobs_with_details()
+            jobs = await self._extract_jobs_with_details(page, params.max_results)
+            # Limit to max_results before scoring so no discarded job is analysed
+            jobs = jobs[:params.max_results]
             
-            # Add metadata and calculate match scores
+            # Add metadata
+            scraped_at = datetime.now().isoformat(timespec='seconds')
             for job in jobs:
-                job["scraped_at"] = datetime.now().isoformat()
+                job["scraped_at"] = scraped_at
                 job["source"] = "LinkedIn"
                 job["time_filter"] = "1_hour"
                 job["search_keywords"] = params.keywords
                 job["search_location"] = params.location
-                
-                # Calculate match score if resume matcher is available
-                if self.resume_matcher:
-                    try:
-                        job_listing = JobListing(**job)
-                        analysis = await self.resume_matcher.analyze_job_fit(job_listing)
-                        job["resume_match_score"] = analysis.overall_match_score
-                        job["matching_skills"] = analysis.matching_skills
-                        job["missing_skills"] = analysis.missing_skills
-                        logger.info(f"Job '{job['title']}' - Match Score: {analysis.overall_match_score}%")
-                    except Exception as e:
-                        logger.warning(f"Could not calculate match score: {e}")
-                        job["resume_match_score"] = 0
-                
+            
+            # Calculate match scores for the whole batch if resume matcher is available
+            if self.resume_matcher:
+                await self._score_jobs(jobs)
+            
+            for job in jobs:
                 # Log to Google Sheets if available
                 if self.google_sheets and "resume_match_score" in job:
                     try:
@@ -384,16 +860,14 @@ class LinkedInScraperPlaywright:
                                    f"level={job_listing.level}, "
                                    f"applicants_count={job_listing.applicants_count}")
 
-                        self.google_sheets.add_job(job_listing)
-                        logger.info(f"✓ Added job to Google Sheets: {job['title']}")
+                        await self._sheets_queue.put(job_listing)
+                        logger.info(f"✓ Queued job for Google Sheets: {job['title']}")
                     except Exception as e:
-                        logger.error(f"❌ Could not add to Google Sheets: {e}")
+                        logger.error(f"❌ Could not queue for Google Sheets: {e}")
                         import traceback
                         logger.error(traceback.format_exc())
             
-            # Limit to max_results
-            jobs = jobs[:params.max_results]
-            self.jobs_scraped.extend(jobs)
+            self._record_jobs(jobs)
             
             logger.info(f"Successfully extracted {len(jobs)} jobs from 1-hour filter")
             return jobs
@@ -402,8 +876,32 @@ class LinkedInScraperPlaywright:
             logger.error(f"Search and extract failed: {e}")
             return []
     
-    async def _extract_job_details_from_panel(self) -> Dict[str, Any]:
+    async def _score_jobs(self, jobs: List[Dict[str, Any]]):
+        """Score all jobs against the resume in one batch, setting 0 where analysis fails."""
+        pairs = []
+        for job in jobs:
+            try:
+                pairs.append((job, JobListing(**job)))
+            except Exception as e:
+                logger.warning(f"Could not calculate match score: {e}")
+                job["resume_match_score"] = 0
+
+        results = await self.resume_matcher.batch_analyze_jobs([listing for _, listing in pairs])
+        analyses = {id(listing): analysis for listing, analysis in results}
+
+        for job, listing in pairs:
+            analysis = analyses.get(id(listing))
+            if analysis is None:
+                job["resume_match_score"] = 0
+                continue
+            job["resume_match_score"] = analysis.overall_match_score
+            job["matching_skills"] = analysis.matching_skills
+            job["missing_skills"] = analysis.missing_skills
+            logger.info(f"Job '{job['title']}' - Match Score: {analysis.overall_match_score}%")
+    
+    async def _extract_job_details_from_panel(self, page: Optional[Page] = None) -> Dict[str, Any]:
         """Extract full job details from the opened detail panel."""
+        page = page or self.page
         details = {}
 
         try:
@@ -411,63 +909,22 @@ class LinkedInScraperPlaywright:
             logger.info("PHASE 2 DETAIL EXTRACTION - START")
             logger.info("=" * 60)
 
-            # First, wait a bit longer for panel to fully load
-            logger.info("Waiting 3 seconds for panel to load...")
-            await asyncio.sleep(3)
-
             # Log current page structure for debugging
-            logger.info(f"Current URL: {self.page.url}")
-
-            # MORE COMPREHENSIVE selectors for LinkedIn 2024/2025
-            desc_selectors = [
-                # Most common current selectors
-                'div[class*="jobs-description"]',
-                'div[class*="job-details"]',
-                'section[class*="jobs-description"]',
-                'div.jobs-unified-description__content',
-                'div#job-details',
-
-                # Try broader selectors
-                'article[class*="jobs"]',
-                'div[class*="description-content"]',
-                '[data-job-description]',
-
-                # Very broad but specific to job content
-                'div.scaffold-layout__detail',
-                'div.jobs-search__job-details',
-                'div.jobs-view-layout',
-
-                # Legacy selectors
-                '.jobs-description-content',
-                '.details-pane__content'
-            ]
-
-            # Try to find ANY job detail element
-            panel_loaded = False
-            matched_selector = None
-            for selector in desc_selectors:
-                try:
-                    elem = await self.page.query_selector(selector)
-                    if elem:
-                        panel_loaded = True
-                        matched_selector = selector
-                        logger.info(f"✓ Found panel element with selector: {selector}")
-                        break
-                    else:
-                        logger.debug(f"✗ Selector '{selector}' returned None")
-                except Exception as e:
-                    logger.debug(f"✗ Selector '{selector}' failed: {e}")
-                    continue
+            logger.info(f"Current URL: {page.url}")
 
-            if not panel_loaded:
+            # Try to find ANY job detail element with one union query
+            panel_loaded = await page.query_selector(DETAIL_PANEL_SELECTOR) is not None
+            if panel_loaded:
+                logger.info("✓ Found panel element")
+            else:
                 logger.error("❌ NO DETAIL PANEL FOUND WITH ANY SELECTOR!")
                 screenshot_path = f"debug_no_panel_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                await self.page.screenshot(path=screenshot_path)
+                await page.screenshot(path=screenshot_path)
                 logger.error(f"Saved screenshot to: {screenshot_path}")
 
                 # Log page HTML structure for debugging
                 try:
-                    page_html = await self.page.content()
+                    page_html = await page.content()
                     html_file = f"debug_page_html_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
                     with open(html_file, 'w', encoding='utf-8') as f:
                         f.write(page_html)
@@ -479,37 +936,25 @@ class LinkedInScraperPlaywright:
                 
                 # Try to get ANY text from the right side of the page
                 try:
-                    right_panel = await self.page.query_selector('div.scaffold-layout__detail, div[class*="detail"], aside')
+                    right_panel = await page.query_selector('div.scaffold-layout__detail, div[class*="detail"], aside')
                     if right_panel:
                         panel_text = await right_panel.inner_text()
                         logger.info(f"Right panel text length: {len(panel_text) if panel_text else 0}")
                 except:
                     pass
             
-            # Extract full description - try ALL selectors
+            # Extract full description - first selector (in priority order) with meaningful content
             logger.info("Attempting to extract job description...")
-            full_description = ""
-            for selector in desc_selectors:
-                try:
-                    desc_elem = await self.page.query_selector(selector)
-                    if desc_elem:
-                        text = await desc_elem.inner_text()
-                        if text and len(text) > 100:  # Meaningful content
-                            full_description = text
-                            logger.info(f"✓ Found description using selector: {selector} (length: {len(text)} chars)")
-                            break
-                        else:
-                            logger.debug(f"Selector '{selector}' found element but text too short: {len(text) if text else 0} chars")
-                except Exception as e:
-                    logger.debug(f"Error with selector '{selector}': {e}")
-                    continue
+            full_description = await page.evaluate(_FIRST_LONG_TEXT_JS, DETAIL_DESCRIPTION_SELECTORS)
+            if full_description:
+                logger.info(f"✓ Found description (length: {len(full_description)} chars)")
             
             # If still no description, try to get text from the entire right panel
             if not full_description or len(full_description) < 100:
                 logger.warning("No description from specific selectors, trying broader approach...")
                 try:
                     # Try to get all text from the detail section
-                    detail_section = await self.page.query_selector('div.scaffold-layout__detail, aside[class*="scaffold"], div.jobs-search__job-details--container')
+                    detail_section = await page.query_selector('div.scaffold-layout__detail, aside[class*="scaffold"], div.jobs-search__job-details--container')
                     if detail_section:
                         full_description = await detail_section.inner_text()
                         logger.info(f"Got description from detail section (length: {len(full_description)})")
@@ -517,43 +962,18 @@ class LinkedInScraperPlaywright:
                     pass
             
             if full_description:
-                logger.info(f"Processing description ({len(full_description)} chars)...")
-
-                # Parse responsibilities
-                responsibilities = self._parse_responsibilities(full_description)
-                details['responsibilities'] = responsibilities
-                logger.info(f"✓ Extracted {len(responsibilities)} responsibilities")
-
-                # Parse requirements and determine experience level
-                requirements, exp_level, years_num = self._parse_requirements_and_experience(full_description)
-                details['requirements'] = requirements
-                logger.info(f"✓ Extracted {len(requirements)} requirements")
-
-                if exp_level:
-                    details['experience_level'] = exp_level
-                    logger.info(f"✓ Experience level: {exp_level}")
-                if years_num is not None:
-                    details['level'] = years_num
-                    logger.info(f"✓ Years of experience: {years_num}")
-
-                # Extract skills from full description
-                skills = self._extract_skills_from_full_description(full_description)
-                details['skills'] = skills
-                logger.info(f"✓ Extracted {len(skills)} skills: {skills[:5] if len(skills) > 5 else skills}")
-
-                # Store full description
-                details['description'] = full_description[:500] + "..." if len(full_description) > 500 else full_description
+                details.update(self._details_from_description(full_description))
             else:
                 logger.warning("❌ No description text found - cannot extract responsibilities, requirements, skills")
             
             # Try to extract skills from skill badges/tags if present
-            skill_badges = await self.page.query_selector_all(
+            skill_badges = await page.query_selector_all(
                 '.job-details-skill-match__skill-name, .jobs-description__skill-item'
             )
             badge_skills = []
             for badge in skill_badges:
                 try:
-                    skill_text = await badge.inner_text()
+                    skill_text = await _text_content(badge)
                     if skill_text:
                         badge_skills.append(skill_text.strip())
                 except:
@@ -566,80 +986,48 @@ class LinkedInScraperPlaywright:
             # FIX 3: Also try to extract job_type, applicants, and posted from detail panel
             logger.info("Attempting to extract job_type, applicants, posted from detail panel...")
 
-            # Try to extract job type from detail panel
+            # Try to extract job type from detail panel: the first element, by
+            # selector priority, whose text normalizes to a JobType value
+            # (ignoring extra text like "· Mid-Senior level")
             try:
-                job_type_selectors = [
-                    '.jobs-unified-top-card__job-insight span:has-text("Full-time")',
-                    '.jobs-unified-top-card__job-insight span:has-text("Part-time")',
-                    '.jobs-unified-top-card__job-insight span:has-text("Contract")',
-                    '.jobs-unified-top-card__job-insight',
-                    '.job-details-jobs-unified-top-card__job-insight'
-                ]
-                for selector in job_type_selectors:
-                    elem = await self.page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text:
-                            # Normalize text to match JobType enum values
-                            text_lower = text.lower()
-
-                            # Extract just the job type, ignoring extra text like "· Mid-Senior level"
-                            normalized_type = None
-                            if 'full-time' in text_lower or 'full time' in text_lower:
-                                normalized_type = 'full-time'
-                            elif 'part-time' in text_lower or 'part time' in text_lower:
-                                normalized_type = 'part-time'
-                            elif 'contract' in text_lower:
-                                normalized_type = 'contract'
-                            elif 'temporary' in text_lower or 'temp' in text_lower:
-                                normalized_type = 'temporary'
-                            elif 'internship' in text_lower or 'intern' in text_lower:
-                                normalized_type = 'internship'
-                            elif 'volunteer' in text_lower:
-                                normalized_type = 'volunteer'
-
-                            if normalized_type:
-                                details['job_type'] = normalized_type
-                                logger.info(f"✓ Found job_type from panel: '{text}' → normalized to '{normalized_type}'")
-                                break
+                for selector in DETAIL_JOB_TYPE_SELECTORS:
+                    normalized_type = None
+                    for elem in await page.query_selector_all(selector):
+                        try:
+                            text = await _text_content(elem)
+                        except Exception:
+                            continue
+                        normalized_type = _classify(text.lower(), JOB_TYPE_RULES).get('job_type')
+                        if normalized_type:
+                            break
+                    if normalized_type:
+                        details['job_type'] = normalized_type
+                        logger.info(f"✓ Found job_type from panel: '{text}' → normalized to '{normalized_type}'")
+                        break
             except Exception as e:
                 logger.debug(f"Could not extract job_type from panel: {e}")
 
             # Try to extract applicants count from detail panel
             try:
-                applicants_selectors = [
-                    'span:has-text("applicant")',
-                    'span:has-text("applicants")',
-                    '.jobs-unified-top-card__applicant-count',
-                    'figcaption:has-text("applicant")'
-                ]
-                for selector in applicants_selectors:
-                    elem = await self.page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and 'applicant' in text.lower():
-                            details['applicants_count'] = text.strip()
-                            logger.info(f"✓ Found applicants from panel: {details['applicants_count']}")
-                            break
+                text = await _first_text(
+                    page, DETAIL_APPLICANTS_SELECTORS,
+                    lambda t: 'applicant' in t.lower()
+                )
+                if text:
+                    details['applicants_count'] = text
+                    logger.info(f"✓ Found applicants from panel: {details['applicants_count']}")
             except Exception as e:
                 logger.debug(f"Could not extract applicants from panel: {e}")
 
             # Try to extract posted date from detail panel
             try:
-                posted_selectors = [
-                    '.jobs-unified-top-card__posted-date',
-                    'span:has-text("ago")',
-                    'span.tvm__text:has-text("ago")',
-                    '.job-details-jobs-unified-top-card__posted-date'
-                ]
-                for selector in posted_selectors:
-                    elem = await self.page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and ('ago' in text.lower() or 'posted' in text.lower()):
-                            details['posted_date'] = text.strip()
-                            logger.info(f"✓ Found posted date from panel: {details['posted_date']}")
-                            break
+                text = await _first_text(
+                    page, DETAIL_POSTED_SELECTORS,
+                    lambda t: 'ago' in t.lower() or 'posted' in t.lower()
+                )
+                if text:
+                    details['posted_date'] = text
+                    logger.info(f"✓ Found posted date from panel: {details['posted_date']}")
             except Exception as e:
                 logger.debug(f"Could not extract posted date from panel: {e}")
             
@@ -647,7 +1035,7 @@ class LinkedInScraperPlaywright:
             if not full_description or len(full_description) < 100:
                 logger.warning(f"No meaningful description found (length: {len(full_description)})")
                 # Save screenshot for debugging
-                await self.page.screenshot(path=f"debug_no_description_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
+                await page.screenshot(path=f"debug_no_description_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
                 
         except Exception as e:
             logger.error(f"Exception in _extract_job_details_from_panel: {e}")
@@ -667,6 +1055,121 @@ class LinkedInScraperPlaywright:
 
         return details
     
+    def _details_from_description(self, description: str) -> Dict[str, Any]:
+        """Parse responsibilities, requirements, experience and skills from a full description."""
+        details = {}
+        logger.info(f"Processing description ({len(description)} chars)...")
+
+        # Parse responsibilities
+        responsibilities = self._parse_responsibilities(description)
+        details['responsibilities'] = responsibilities
+        logger.info(f"✓ Extracted {len(responsibilities)} responsibilities")
+
+        # Parse requirements and determine experience level
+        requirements, exp_level, years_num = self._parse_requirements_and_experience(description)
+        details['requirements'] = requirements
+        logger.info(f"✓ Extracted {len(requirements)} requirements")
+
+        if exp_level:
+            details['experience_level'] = exp_level
+            logger.info(f"✓ Experience level: {exp_level}")
+        if years_num is not None:
+            details['level'] = years_num
+            logger.info(f"✓ Years of experience: {years_num}")
+
+        # Extract skills from full description
+        skills = self._extract_skills_from_full_description(description)
+        details['skills'] = skills
+        logger.info(f"✓ Extracted {len(skills)} skills: {skills[:5] if len(skills) > 5 else skills}")
+
+        # Store full description
+        details['description'] = description[:500] + "..." if len(description) > 500 else description
+
+        return details
+
+    def _merge_details(self, job_data: Dict[str, Any], full_details: Dict[str, Any], i: int):
+        """Update a job's basic card data with fields from its full details."""
+        if full_details:
+            logger.info(f"[Job {i}] Got full_details: {list(full_details.keys())}")
+
+            if full_details.get('description') and len(full_details.get('description', '')) > 100:
+                job_data['description'] = full_details['description']
+                logger.info(f"[Job {i}] ✓ Updated description")
+
+            if full_details.get('responsibilities') and full_details['responsibilities'] != ["See job posting for full responsibilities"]:
+                job_data['responsibilities'] = full_details['responsibilities']
+                logger.info(f"[Job {i}] ✓ Updated responsibilities: {len(job_data['responsibilities'])} items")
+
+            if full_details.get('requirements'):
+                job_data['requirements'] = full_details['requirements']
+                logger.info(f"[Job {i}] ✓ Updated requirements: {len(job_data['requirements'])} items")
+
+            if full_details.get('skills') and len(full_details.get('skills', [])) > 0:
+                # Merge skills from both sources
+                existing_skills = job_data.get('skills', [])
+                if isinstance(existing_skills, list) and existing_skills != ["Not specified"]:
+                    all_skills = list(set(existing_skills + full_details['skills']))
+                    job_data['skills'] = all_skills[:15]
+                else:
+                    job_data['skills'] = full_details['skills']
+                logger.info(f"[Job {i}] ✓ Updated skills: {job_data['skills'][:3]}")
+
+            if full_details.get('experience_level'):
+                job_data['experience_level'] = full_details['experience_level']
+                logger.info(f"[Job {i}] ✓ Updated experience_level: {job_data['experience_level']}")
+
+            if full_details.get('level') is not None:
+                job_data['level'] = full_details['level']
+                logger.info(f"[Job {i}] ✓ Updated level: {job_data['level']}")
+
+            # FIX 3: Also update job_type, applicants, posted if found in panel
+            if full_details.get('job_type'):
+                job_data['job_type'] = full_details['job_type']
+                logger.info(f"[Job {i}] ✓ Updated job_type: {job_data['job_type']}")
+
+            if full_details.get('applicants_count'):
+                job_data['applicants_count'] = full_details['applicants_count']
+                logger.info(f"[Job {i}] ✓ Updated applicants_count: {job_data['applicants_count']}")
+
+            if full_details.get('posted_date'):
+                job_data['posted_date'] = full_details['posted_date']
+                logger.info(f"[Job {i}] ✓ Updated posted_date: {job_data['posted_date']}")
+
+            logger.info(f"[Job {i}] ✓ Detailed extraction successful")
+        else:
+            logger.warning(f"[Job {i}] ❌ No details extracted from panel (full_details is empty)")
+
+    async def _prefetch_job_details(self, jobs: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch job pages over plain HTTP and parse details from their JSON-LD.
+
+        Returns one entry per job, None where the page had no usable posting
+        so the caller can fall back to clicking the card.
+        """
+        try:
+            pages = await fetch_all_parallel([job.get('url') for job in jobs], semaphore=self._net_sem)
+        except Exception as e:
+            logger.warning(f"HTTP prefetch failed, falling back to detail panels: {e}")
+            return [None] * len(jobs)
+
+        results = []
+        for html in pages:
+            posting = extract_job_posting(html) if html else None
+            description = html_to_text(posting.get('description') or '') if posting else ''
+            if len(description) < 100:
+                results.append(None)
+                continue
+
+            details = self._details_from_description(description)
+            employment_type = posting.get('employmentType')
+            if isinstance(employment_type, list):
+                employment_type = employment_type[0] if employment_type else None
+            if employment_type:
+                details.update(_classify(employment_type.lower().replace('_', '-'), JOB_TYPE_RULES))
+            results.append(details)
+
+        logger.info(f"HTTP prefetch: {sum(1 for r in results if r)}/{len(jobs)} jobs had JSON-LD details")
+        return results
+
     def _parse_responsibilities(self, description: str) -> List[str]:
         """Parse responsibilities section from job description."""
         responsibilities = []
@@ -678,24 +1181,18 @@ class LinkedInScraperPlaywright:
             line_lower = line.lower().strip()
             
             # Check if we're entering responsibilities section
-            if any(keyword in line_lower for keyword in [
-                'responsibilities:', 'what you\'ll do:', 'you will:', 
-                'your responsibilities:', 'key responsibilities:', 'duties:'
-            ]):
+            if RESPONSIBILITIES_START_RE.search(line_lower):
                 in_responsibilities = True
                 continue
                 
             # Check if we're leaving responsibilities section
-            elif any(keyword in line_lower for keyword in [
-                'requirements:', 'qualifications:', 'skills:', 'what we need:',
-                'about you:', 'experience:', 'education:', 'benefits:'
-            ]):
+            elif RESPONSIBILITIES_END_RE.search(line_lower):
                 in_responsibilities = False
                 
             # Collect responsibility lines
             elif in_responsibilities and line.strip():
                 # Clean up bullet points and numbers
-                cleaned = re.sub(r'^[\s•\-\*\d\.]+', '', line.strip())
+                cleaned = BULLET_PREFIX_RE.sub('', line.strip())
                 if cleaned and len(cleaned) > 10:
                     responsibilities.append(cleaned)
                     if len(responsibilities) >= 5:  # Limit to 5 responsibilities
@@ -705,28 +1202,15 @@ class LinkedInScraperPlaywright:
     
     def _extract_years_as_level(self, text: str) -> Optional[int]:
         """Extract years of experience as a numeric level."""
-        
-        # Comprehensive patterns to match years of experience
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'(\d+)\s*-\s*(\d+)\s*years?\s*(?:of\s*)?(?:experience|exp)',  # Take lower bound
-            r'minimum\s*(?:of\s*)?(\d+)\s*years?',
-            r'at\s*least\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*minimum',
-            r'requires?\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*required',
-            r'(\d+)\s*years?\s*preferred'
-        ]
-        
         text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in YEARS_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 # Return the first number found (lower bound if range)
                 return int(match.group(1))
         
         # Check for entry-level indicators
-        if any(term in text_lower for term in ['entry level', 'entry-level', '0-2 years', 'fresh graduate', 'new graduate']):
+        if ENTRY_LEVEL_RE.search(text_lower):
             return 0
         
         return None
@@ -763,19 +1247,15 @@ class LinkedInScraperPlaywright:
             line_lower = line.lower().strip()
             
             # Check if we're in requirements section
-            if any(keyword in line_lower for keyword in [
-                'requirements:', 'qualifications:', 'must have:', 'required:'
-            ]):
+            if REQUIREMENTS_START_RE.search(line_lower):
                 in_requirements = True
                 continue
-            elif any(keyword in line_lower for keyword in [
-                'responsibilities:', 'benefits:', 'nice to have:', 'preferred:'
-            ]):
+            elif REQUIREMENTS_END_RE.search(line_lower):
                 in_requirements = False
                 
             # Collect requirement lines
             elif in_requirements and line.strip():
-                cleaned = re.sub(r'^[\s•\-\*\d\.]+', '', line.strip())
+                cleaned = BULLET_PREFIX_RE.sub('', line.strip())
                 if cleaned and len(cleaned) > 10:
                     requirements.append(cleaned)
                     if len(requirements) >= 5:
@@ -794,53 +1274,25 @@ class LinkedInScraperPlaywright:
     
     def _extract_skills_from_full_description(self, description: str) -> List[str]:
         """Extract technical skills from the full job description."""
-        skills = []
-        
-        # Comprehensive tech skills list
-        tech_skills = [
-            'Java', 'Python', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue', 
-            'Spring', 'Spring Boot', 'Node.js', 'Express', '.NET', 'C#', 'C++',
-            'SQL', 'NoSQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Oracle', 'Redis',
-            'AWS', 'Azure', 'GCP', 'Cloud', 'Docker', 'Kubernetes', 'Jenkins',
-            'CI/CD', 'DevOps', 'Microservices', 'REST', 'RESTful', 'API', 'GraphQL',
-            'Git', 'GitHub', 'GitLab', 'Agile', 'Scrum', 'JIRA', 'Kafka', 'RabbitMQ',
-            'HTML', 'CSS', 'SASS', 'Bootstrap', 'Material UI', 'Tailwind',
-            'JPA', 'Hibernate', 'Maven', 'Gradle', 'JUnit', 'Jest', 'Selenium',
-            'Machine Learning', 'AI', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy'
-        ]
-        
-        desc_lower = description.lower()
-        seen_skills = set()
-        
-        # Extract skills that appear in the description
-        for skill in tech_skills:
-            # Use word boundaries for more accurate matching
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, desc_lower) and skill not in seen_skills:
-                skills.append(skill)
-                seen_skills.add(skill)
-        
-        return skills[:15]  # Limit to 15 most relevant skills
+        return _DETAIL_SKILLS.find(description)[:15]  # Limit to 15 most relevant skills
 
-    async def _extract_jobs_with_details(self) -> List[Dict[str, Any]]:
-        """Extract job listings with all details including links."""
+    async def _extract_jobs_with_details(self, page: Optional[Page] = None, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract job listings with all details including links, stopping after max_results cards."""
+        page = page or self.page
         jobs = []
 
         try:
             # Wait for job cards to load with shorter timeout
             try:
-                await self.page.wait_for_selector(
+                await page.wait_for_selector(
                     'div.job-card-container, li.jobs-search-results__list-item, ul.scaffold-layout__list-container',
                     timeout=7000
                 )
             except:
                 logger.warning("Timeout waiting for job cards, checking if any exist...")
 
-            # Human-like scrolling to trigger lazy loading
-            await self.page.mouse.wheel(0, random.randint(200, 400))
-            await asyncio.sleep(random.uniform(1, 2))
-            await self.page.mouse.wheel(0, random.randint(200, 400))
-            await asyncio.sleep(random.uniform(0.5, 1.5))
+            # Scroll to trigger lazy loading
+            await page.mouse.wheel(0, random.randint(400, 800))
 
             # Try different selectors for job cards - updated for current LinkedIn
             job_card_selectors = [
@@ -854,7 +1306,7 @@ class LinkedInScraperPlaywright:
             job_cards = []
             working_selector = None  # Track which selector actually works
             for selector in job_card_selectors:
-                cards = await self.page.query_selector_all(selector)
+                cards = await page.query_selector_all(selector)
                 if cards:
                     job_cards = cards
                     working_selector = selector  # Save the selector that worked
@@ -870,6 +1322,9 @@ class LinkedInScraperPlaywright:
             jobs_basic_data = []
             
             for i, card in enumerate(job_cards):
+                if max_results and len(jobs_basic_data) >= max_results:
+                    logger.info(f"Reached max_results ({max_results}), skipping remaining cards")
+                    break
                 try:
                     job_data = {}
 
@@ -888,36 +1343,8 @@ class LinkedInScraperPlaywright:
                     except:
                         job_data["job_id"] = f"job_{i}"
                     
-                    # Extract title - simplified for current LinkedIn structure
-                    title = ""
-                    
-                    # Primary selector for job title
-                    title_elem = await card.query_selector('.base-search-card__title')
-                    if title_elem:
-                        try:
-                            title = await title_elem.inner_text()
-                            title = title.strip()
-                        except:
-                            pass
-                    
-                    # Fallback selectors if primary fails
-                    if not title:
-                        fallback_selectors = [
-                            'h3.base-search-card__title',
-                            'a.job-card-list__title strong',
-                            'div.job-card-container a strong',
-                            'a.job-card-container__link span[aria-hidden="true"]'
-                        ]
-                        for selector in fallback_selectors:
-                            elem = await card.query_selector(selector)
-                            if elem:
-                                try:
-                                    title = await elem.inner_text()
-                                    title = title.strip()
-                                    if title:
-                                        break
-                                except:
-                                    pass
+                    # Extract title - first non-empty match across all title selectors
+                    title = await _first_text(card, TITLE_SELECTORS)
                     
                     job_data["title"] = title or "Job Title Not Available"
                     
@@ -939,31 +1366,11 @@ class LinkedInScraperPlaywright:
                     job_data["url"] = url
                     
                     # Extract company - from job card only (no clicking to avoid context issues)
-                    company = ""
-
-                    card_selectors = [
-                        'a[class*="subtitle"]',
-                        'span[class*="subtitle"]',
-                        '.base-search-card__subtitle > a',
-                        '.base-search-card__subtitle',
-                        '.artdeco-entity-lockup__subtitle',
-                        '[data-test-job-card-company-name]',
-                        'h4.job-card-container__company-name',
-                        'span.job-card-container__primary-description'
-                    ]
-
-                    for selector in card_selectors:
-                        try:
-                            elem = await card.query_selector(selector)
-                            if elem:
-                                text = await elem.inner_text()
-                                text = text.strip()
-                                # Validate it's likely a company name
-                                if text and len(text) > 2 and not any(skip in text.lower() for skip in ['remote', 'ago', 'applicant', 'hybrid', 'on-site']):
-                                    company = text
-                                    break
-                        except:
-                            pass
+                    company = await _first_text(
+                        card, COMPANY_SELECTORS,
+                        # Validate it's likely a company name
+                        lambda t: len(t) > 2 and not any(skip in t.lower() for skip in ['remote', 'ago', 'applicant', 'hybrid', 'on-site'])
+                    )
 
                     # Fallback: extract from aria-label
                     if not company:
@@ -986,7 +1393,7 @@ class LinkedInScraperPlaywright:
                     )
                     if location_elem:
                         try:
-                            job_data["location"] = await location_elem.inner_text()
+                            job_data["location"] = await _text_content(location_elem)
                         except:
                             job_data["location"] = "Location not specified"
                     else:
@@ -997,74 +1404,37 @@ class LinkedInScraperPlaywright:
                     time_elem = await card.query_selector('time')
                     if time_elem:
                         try:
-                            posted_date = await time_elem.inner_text()
+                            posted_date = await _text_content(time_elem)
                         except:
                             pass
                     job_data["posted_date"] = posted_date or "Recently"
                     
                     # Extract applicants count
-                    applicants = ""
-                    applicants_selectors = [
-                        'span:has-text("applicants")',
-                        'span:has-text("applicant")',
-                        '.job-card-container__applicant-count',
-                        'span.job-card-container__footer-item'
-                    ]
-                    for selector in applicants_selectors:
-                        app_elem = await card.query_selector(selector)
-                        if app_elem:
-                            try:
-                                text = await app_elem.inner_text()
-                                if 'applicant' in text.lower():
-                                    applicants = text
-                                    break
-                            except:
-                                continue
+                    applicants = await _first_text(
+                        card, APPLICANTS_SELECTORS,
+                        lambda t: 'applicant' in t.lower()
+                    )
                     job_data["applicants_count"] = applicants
 
                     # DEBUG: Log applicants extraction
                     logger.debug(f"[Card {i}] applicants_count: {applicants}")
                     
                     # Extract salary if available
-                    salary = ""
-                    salary_selectors = [
-                        'span:has-text("$")',
-                        '.job-card-container__salary-info',
-                        'span.job-card-container__metadata-item:has-text("$")'
-                    ]
-                    for selector in salary_selectors:
-                        salary_elem = await card.query_selector(selector)
-                        if salary_elem:
-                            try:
-                                text = await salary_elem.inner_text()
-                                if '$' in text:
-                                    salary = text
-                                    break
-                            except:
-                                continue
+                    salary = await _first_text(card, SALARY_SELECTORS, lambda t: '$' in t)
                     job_data["salary_range"] = salary or ""
                     
                     # Extract description - look for snippet or benefits
                     description = ""
-                    desc_selectors = [
-                        '.job-card-list__snippet',
-                        '.job-card-search__body',
-                        '.job-card-container__benefits',
-                        'ul.job-card-container__benefits li',
-                        '.base-search-card__metadata',
-                        '[class*="snippet"]',
-                        '[class*="description"]'
-                    ]
                     desc_parts = []
-                    for selector in desc_selectors:
-                        desc_elems = await card.query_selector_all(selector)
-                        for desc_elem in desc_elems:
-                            try:
-                                text = await desc_elem.inner_text()
-                                if text and text.strip() and len(text.strip()) > 20:
-                                    desc_parts.append(text.strip())
-                            except:
-                                continue
+                    for desc_elem in await card.query_selector_all(SNIPPET_SELECTORS):
+                        try:
+                            text = await _text_content(desc_elem)
+                            if text and text.strip() and len(text.strip()) > 20:
+                                desc_parts.append(text.strip())
+                                if len(desc_parts) >= 3:
+                                    break
+                        except:
+                            continue
                     
                     # Combine all description parts
                     if desc_parts:
@@ -1072,73 +1442,23 @@ class LinkedInScraperPlaywright:
                     job_data["description"] = description or "See job posting for details"
                     
                     # Extract job type and experience level from badges/metadata and other areas
-                    job_type = None
-                    exp_level = None
+                    found = {}
                     
                     # First check metadata items - expanded selectors
-                    metadata_selectors = [
-                        '.job-card-container__metadata-item',
-                        'span.job-card-search__badge',
-                        '.base-search-card__metadata span',
-                        'li.result-benefits__text',
-                        '[class*="job-type"]',
-                        '[class*="employment"]',
-                        '[class*="seniority"]',
-                        '.job-card-container__footer-item'
-                    ]
-                    
-                    for selector in metadata_selectors:
-                        items = await card.query_selector_all(selector)
-                        for item in items:
-                            try:
-                                text = await item.inner_text()
-                                text_lower = text.lower().strip()
-                                
-                                # Map to valid job type enum values
-                                if not job_type:
-                                    if 'full-time' in text_lower or 'full time' in text_lower:
-                                        job_type = 'full-time'
-                                    elif 'part-time' in text_lower or 'part time' in text_lower:
-                                        job_type = 'part-time'
-                                    elif 'contract' in text_lower:
-                                        job_type = 'contract'
-                                    elif 'temporary' in text_lower or 'temp' in text_lower:
-                                        job_type = 'temporary'
-                                    elif 'internship' in text_lower or 'intern' in text_lower:
-                                        job_type = 'internship'
-                                    elif 'volunteer' in text_lower:
-                                        job_type = 'volunteer'
-                                
-                                # Map to valid experience level enum values
-                                if not exp_level:
-                                    if 'entry' in text_lower or 'junior' in text_lower:
-                                        exp_level = 'entry'
-                                    elif 'associate' in text_lower:
-                                        exp_level = 'associate'
-                                    elif 'mid-senior' in text_lower or 'mid senior' in text_lower:
-                                        exp_level = 'mid-senior'
-                                    elif 'senior' in text_lower and 'mid' not in text_lower:
-                                        exp_level = 'mid-senior'  # Map senior to mid-senior
-                                    elif 'director' in text_lower or 'lead' in text_lower or 'principal' in text_lower:
-                                        exp_level = 'director'
-                                    elif 'executive' in text_lower or 'vp' in text_lower or 'president' in text_lower:
-                                        exp_level = 'executive'
-                            except:
-                                continue
-                    
+                    for item in await card.query_selector_all(METADATA_SELECTORS):
+                        if len(found) == 2:
+                            break
+                        try:
+                            text = await _text_content(item)
+                            _classify(text.lower().strip(), CARD_METADATA_RULES, found)
+                        except:
+                            continue
+                
                     # If still not found, check the title for clues about experience level
-                    if not exp_level and title:
-                        title_lower = title.lower()
-                        if 'senior' in title_lower or 'sr.' in title_lower or 'sr ' in title_lower:
-                            exp_level = 'mid-senior'
-                        elif 'junior' in title_lower or 'jr.' in title_lower or 'jr ' in title_lower:
-                            exp_level = 'entry'
-                        elif 'lead' in title_lower or 'principal' in title_lower:
-                            exp_level = 'director'
-                        elif 'director' in title_lower or 'manager' in title_lower:
-                            exp_level = 'director'
-                        elif 'vp' in title_lower or 'vice president' in title_lower:
-                            exp_level = 'executive'
+                    if 'experience_level' not in found and title:
+                        _classify(title.lower(), TITLE_LEVEL_RULES, found)
+                    job_type = found.get('job_type')
+                    exp_level = found.get('experience_level')
                     
                     # Set to None if not found (not empty string)
                     job_data["job_type"] = job_type
@@ -1147,45 +1467,9 @@ class LinkedInScraperPlaywright:
                     # DEBUG: Log what we extracted
                     logger.debug(f"[Card {i}] job_type: {job_type}, experience_level: {exp_level}")
                     
-                    # Extract skills from description and title if available
-                    skills = []
-                    # Comprehensive skill list based on common job requirements
-                    tech_skills = [
-                        # Programming Languages
-                        'Java', 'Python', 'JavaScript', 'TypeScript', 'C#', 'C++', 'Ruby', 'Go', 'Scala', 'PHP',
-                        # Frontend
-                        'React', 'Angular', 'Vue', 'HTML', 'CSS', 'SASS', 'Redux', 'Next.js', 'Svelte',
-                        # Backend
-                        'Spring', 'Spring Boot', 'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', '.NET',
-                        # Databases
-                        'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'Cassandra', 'DynamoDB',
-                        # Cloud & DevOps
-                        'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'CI/CD', 'Terraform',
-                        # Data & BI
-                        'Tableau', 'Power BI', 'Excel', 'SQL Server', 'ETL', 'Data Warehouse', 'Snowflake',
-                        'Apache Spark', 'Hadoop', 'Airflow', 'SSIS', 'SSRS', 'DAX', 'MDX',
-                        # APIs & Integration
-                        'REST', 'RESTful', 'API', 'GraphQL', 'SOAP', 'Microservices', 'Kafka', 'RabbitMQ',
-                        # Testing & Quality
-                        'JUnit', 'Jest', 'Selenium', 'Testing', 'TDD', 'pytest', 'Cypress',
-                        # Tools & Frameworks
-                        'Git', 'GitHub', 'GitLab', 'JIRA', 'Confluence', 'Agile', 'Scrum', 'Kanban',
-                        'JPA', 'Hibernate', 'Maven', 'Gradle', 'npm', 'webpack',
-                        # General
-                        'Full Stack', 'Frontend', 'Backend', 'DevOps', 'Machine Learning', 'AI', 'Data Science'
-                    ]
-
                     # Check both description and title for skills
                     combined_text = f"{description} {title}".lower() if description else title.lower() if title else ""
-                    seen_skills = set()
-
-                    for skill in tech_skills:
-                        # Use word boundaries for more accurate matching
-                        import re
-                        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                        if re.search(pattern, combined_text) and skill not in seen_skills:
-                            skills.append(skill)
-                            seen_skills.add(skill)
+                    skills = _CARD_SKILLS.find(combined_text)
                     
                     # Also extract requirements from description
                     requirements = []
@@ -1236,12 +1520,22 @@ class LinkedInScraperPlaywright:
             if ENABLE_PHASE_2 and working_selector:
                 logger.info("Phase 2: Clicking jobs to extract detailed information...")
 
+                # Fast path: read details from server-rendered job pages and
+                # only click the cards whose page has no JSON-LD posting
+                prefetched = await self._prefetch_job_details(jobs_basic_data)
+
                 # Re-query for job cards using the SAME selector that worked in Phase 1
-                current_cards = await self.page.query_selector_all(working_selector)
+                current_cards = await page.query_selector_all(working_selector)
                 logger.info(f"Re-queried using '{working_selector}' and found {len(current_cards)} job cards for Phase 2")
 
                 for i, job_data in enumerate(jobs_basic_data):
                     try:
+                        if prefetched[i]:
+                            logger.info(f"[Job {i}] Using details from HTTP fetch")
+                            self._merge_details(job_data, prefetched[i], i)
+                            jobs.append(job_data)
+                            continue
+
                         # Make sure we have a corresponding card
                         if i >= len(current_cards):
                             logger.warning(f"No card element for job {i}, skipping detailed extraction")
@@ -1255,89 +1549,50 @@ class LinkedInScraperPlaywright:
                         try:
                             # Scroll card into view
                             await card.scroll_into_view_if_needed()
-                            await asyncio.sleep(0.3)
 
-                            # Click the card
+                            # Click the card and wait until the panel shows this job
+                            # rather than sleeping a fixed delay
                             await card.click()
-                            await asyncio.sleep(2)  # Wait for panel to load
+                            try:
+                                await page.wait_for_function(
+                                    _PANEL_SHOWS_JOB_JS,
+                                    arg={
+                                        "jobId": job_data.get("job_id", ""),
+                                        "title": job_data.get("title", ""),
+                                        "panelSelector": DETAIL_PANEL_SELECTOR,
+                                        "titleSelector": DETAIL_TITLE_SELECTORS
+                                    },
+                                    timeout=5000
+                                )
+                            except Exception:
+                                logger.debug(f"[Job {i}] Detail panel did not show this job after click")
 
                             # Check if we're still on the same page (didn't navigate)
-                            current_url = self.page.url
+                            current_url = page.url
                             if '/jobs/search' in current_url or '/jobs/' in current_url:
                                 # Good! We're still on the search page, panel should be open
                                 logger.info(f"[Job {i}] Still on search page, extracting details from panel...")
 
                                 # Extract full details from the side panel
-                                full_details = await self._extract_job_details_from_panel()
+                                full_details = await self._extract_job_details_from_panel(page)
 
                                 # Update job data with full details
-                                if full_details:
-                                    logger.info(f"[Job {i}] Got full_details: {list(full_details.keys())}")
-
-                                    if full_details.get('description') and len(full_details.get('description', '')) > 100:
-                                        job_data['description'] = full_details['description']
-                                        logger.info(f"[Job {i}] ✓ Updated description")
-
-                                    if full_details.get('responsibilities') and full_details['responsibilities'] != ["See job posting for full responsibilities"]:
-                                        job_data['responsibilities'] = full_details['responsibilities']
-                                        logger.info(f"[Job {i}] ✓ Updated responsibilities: {len(job_data['responsibilities'])} items")
-
-                                    if full_details.get('requirements'):
-                                        job_data['requirements'] = full_details['requirements']
-                                        logger.info(f"[Job {i}] ✓ Updated requirements: {len(job_data['requirements'])} items")
-
-                                    if full_details.get('skills') and len(full_details.get('skills', [])) > 0:
-                                        # Merge skills from both sources
-                                        existing_skills = job_data.get('skills', [])
-                                        if isinstance(existing_skills, list) and existing_skills != ["Not specified"]:
-                                            all_skills = list(set(existing_skills + full_details['skills']))
-                                            job_data['skills'] = all_skills[:15]
-                                        else:
-                                            job_data['skills'] = full_details['skills']
-                                        logger.info(f"[Job {i}] ✓ Updated skills: {job_data['skills'][:3]}")
-
-                                    if full_details.get('experience_level'):
-                                        job_data['experience_level'] = full_details['experience_level']
-                                        logger.info(f"[Job {i}] ✓ Updated experience_level: {job_data['experience_level']}")
-
-                                    if full_details.get('level') is not None:
-                                        job_data['level'] = full_details['level']
-                                        logger.info(f"[Job {i}] ✓ Updated level: {job_data['level']}")
-
-                                    # FIX 3: Also update job_type, applicants, posted if found in panel
-                                    if full_details.get('job_type'):
-                                        job_data['job_type'] = full_details['job_type']
-                                        logger.info(f"[Job {i}] ✓ Updated job_type: {job_data['job_type']}")
-
-                                    if full_details.get('applicants_count'):
-                                        job_data['applicants_count'] = full_details['applicants_count']
-                                        logger.info(f"[Job {i}] ✓ Updated applicants_count: {job_data['applicants_count']}")
-
-                                    if full_details.get('posted_date'):
-                                        job_data['posted_date'] = full_details['posted_date']
-                                        logger.info(f"[Job {i}] ✓ Updated posted_date: {job_data['posted_date']}")
-
-                                    logger.info(f"[Job {i}] ✓ Detailed extraction successful")
-                                else:
-                                    logger.warning(f"[Job {i}] ❌ No details extracted from panel (full_details is empty)")
+                                self._merge_details(job_data, full_details, i)
 
                                 # Close the panel (press ESC)
-                                await self.page.keyboard.press('Escape')
-                                await asyncio.sleep(0.5)
+                                await page.keyboard.press('Escape')
                             else:
                                 # We navigated to a new page, go back
                                 logger.warning(f"Navigated away from search page, going back...")
-                                await self.page.go_back(wait_until='domcontentloaded')
-                                await asyncio.sleep(2)
+                                await page.go_back(wait_until='domcontentloaded')
                                 # Re-query cards after going back using the SAME selector
-                                current_cards = await self.page.query_selector_all(working_selector)
+                                current_cards = await page.query_selector_all(working_selector)
 
                         except Exception as e:
                             logger.warning(f"Could not get detailed info for job {i}: {e}")
                             # Try to close any open panels
                             try:
-                                await self.page.keyboard.press('Escape')
-                                await asyncio.sleep(0.3)
+                                await page.keyboard.press('Escape')
                             except:
                                 pass
 
@@ -1380,6 +1635,39 @@ class LinkedInScraperPlaywright:
 
         return jobs
     
+    async def _search_category(self, category: Dict[str, Any], storage_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Search every keyword of a category on its own page."""
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Processing category: {category['category']}")
+        logger.info(f"{'='*60}")
+
+        context = await self._new_context(storage_state)
+        try:
+            page = await self._new_page(context)
+            category_jobs = []
+
+            # Search each keyword in the category
+            for keyword in category['keywords']:  # Search all keywords
+                params = JobSearchParams(
+                    keywords=keyword,
+                    location=category.get('location', 'United States'),
+                    job_type=category.get('job_type', ['full-time'])[0],
+                    posted_within="24h",  # Will be changed to 1 hour
+                    max_results=category.get('max_results', 50)
+                )
+
+                jobs = await self.search_and_extract_jobs(params, page)
+                category_jobs.extend(jobs)
+
+                logger.info(f"Found {len(jobs)} jobs for '{keyword}'")
+
+                # Jittered delay between searches
+                await asyncio.sleep(random.uniform(1, 3))
+
+            return category_jobs
+        finally:
+            await context.close()
+
     async def run_full_search(self, job_categories: List[Dict[str, Any]]):
         """
         Run full search for all job categories.
@@ -1389,32 +1677,28 @@ class LinkedInScraperPlaywright:
         """
         try:
             await self.initialize()
-            await self.login()
+            await self.ensure_logged_in()
             
+            # Each category runs in its own context seeded with the logged-in
+            # session, sharing one browser, with a cap on concurrent pages
+            storage_state = await self.context.storage_state()
+            semaphore = asyncio.BoundedSemaphore(MAX_PARALLEL_PAGES)
+
+            async def bounded(category):
+                async with semaphore:
+                    return await self._search_category(category, storage_state)
+
+            results = await asyncio.gather(
+                *[bounded(category) for category in job_categories],
+                return_exceptions=True
+            )
+
             all_jobs = []
-            
-            for category in job_categories:
-                logger.info(f"\n{'='*60}")
-                logger.info(f"Processing category: {category['category']}")
-                logger.info(f"{'='*60}")
-                
-                # Search each keyword in the category
-                for keyword in category['keywords']:  # Search all keywords
-                    params = JobSearchParams(
-                        keywords=keyword,
-                        location=category.get('location', 'United States'),
-                        job_type=category.get('job_type', ['full-time'])[0],
-                        posted_within="24h",  # Will be changed to 1 hour
-                        max_results=category.get('max_results', 50)
-                    )
-                    
-                    jobs = await self.search_and_extract_jobs(params)
-                    all_jobs.extend(jobs)
-                    
-                    logger.info(f"Found {len(jobs)} jobs for '{keyword}'")
-                    
-                    # Delay between searches
-                    await asyncio.sleep(5)
+            for category, result in zip(job_categories, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Category '{category['category']}' failed: {result}")
+                    continue
+                all_jobs.extend(result)
             
             logger.info(f"\n{'='*60}")
             logger.info(f"Total jobs extracted: {len(all_jobs)}")
@@ -1435,29 +1719,93 @@ class LinkedInScraperPlaywright:
         finally:
             await self.cleanup()
     
+    async def _drain_to_sheets(self):
+        """Upload queued job listings to Google Sheets in batches until a None sentinel arrives."""
+        done = False
+        while not done:
+            batch = [await self._sheets_queue.get()]
+            while len(batch) < SHEETS_BATCH_SIZE and not self._sheets_queue.empty():
+                batch.append(self._sheets_queue.get_nowait())
+            done = batch[-1] is None
+
+            # Keep the last listing per job_id within the batch
+            unique = {job.job_id: job for job in batch if job is not None}
+            if not unique:
+                continue
+            try:
+                await self.google_sheets.add_jobs_batch_async(list(unique.values()))
+                logger.info(f"✓ Uploaded batch of {len(unique)} jobs to Google Sheets")
+            except Exception as e:
+                logger.error(f"❌ Could not add batch to Google Sheets: {e}")
+
     async def cleanup(self):
-        """Clean up browser resources."""
+        """Flush pending Google Sheets uploads and clean up browser resources."""
         try:
+            if self._sheets_uploader:
+                await self._sheets_queue.put(None)
+                await self._sheets_uploader
+                self._sheets_uploader = None
             if self.page:
                 await self.page.close()
+                self.page = None
+            if self.context:
+                await self.context.close()
+                self.context = None
             if self.browser:
                 await self.browser.close()
+                self.browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
             logger.info("Browser cleanup completed")
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
     
+    def _record_jobs(self, jobs: List[Dict[str, Any]]):
+        """Append jobs to the columnar store, padding fields a job doesn't set."""
+        for job in jobs:
+            for key in job.keys() - self._columns.keys():
+                self._columns[key] = [_MISSING] * self._row_count
+            for key, column in self._columns.items():
+                column.append(job.get(key, _MISSING))
+            self._row_count += 1
+
+    @property
+    def jobs_scraped(self) -> List[Dict[str, Any]]:
+        """All jobs scraped in this session, rebuilt as one dict per job."""
+        keys = list(self._columns)
+        return [
+            {key: value for key, value in zip(keys, row) if value is not _MISSING}
+            for row in zip(*self._columns.values())
+        ]
+
     def get_scraped_jobs(self) -> List[Dict[str, Any]]:
         """Get all jobs scraped in this session."""
         return self.jobs_scraped
 
+    def get_scraped_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get all jobs scraped in this session as parallel columns.
+
+        Returns:
+            Mapping of field name to one value per job (None where unset)
+        """
+        return {
+            key: [None if value is _MISSING else value for value in column]
+            for key, column in self._columns.items()
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def _load_job_preferences() -> Dict[str, Any]:
+    """Load and cache the job categories config."""
+    return orjson.loads(Path('config/job_preferences.json').read_bytes())
+
 
 async def test_scraper():
     """Test the LinkedIn scraper with login and URL manipulation."""
-    import json
-    
     # Load job categories
-    with open('config/job_preferences.json', 'r') as f:
-        config = json.load(f)
+    config = _load_job_preferences()
     
     scraper = LinkedInScraperPlaywright()
     
@@ -1,23 +1,291 @@
 """LinkedIn job scraper using Browser-Use for AI-powered automation."""
 
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import List, Dict, Optional, Any
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, AsyncIterator, Callable
 from datetime import datetime
-import json
-import re
-from browser_use import Agent, Controller
+from urllib.parse import urlencode
+from browser_use import Agent, BrowserSession, ChatOpenAI, Controller
+from browser_use.browser.events import CloseTabEvent
+from diskcache import Cache
+import httpx
+import orjson
 from playwright.async_api import Browser, Page
-from langchain_openai import ChatOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from config import settings
+from config import settings, LOGS_DIR
+from scrapers.http_helper import DEFAULT_HEADERS, fetch_all_parallel, parse_job_cards
+from scrapers.rate_limiter import TokenBucket
+from services.json_utils import find_json
 
 logger = logging.getLogger(__name__)
 
 
+def _loads_agent_json(text: str, opening: str = "{[") -> Any:
+    """Parse agent output that is JSON or contains JSON; None if there is none."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    candidate = find_json(text, opening)
+    return orjson.loads(candidate) if candidate else None
+
+
+SEARCH_BASE_URL = "https://www.linkedin.com/jobs/search/"
+
+# LinkedIn search filter codes
+JOB_TYPE_CODES = MappingProxyType({
+    "full-time": "F",
+    "part-time": "P",
+    "contract": "C",
+    "temporary": "T",
+    "internship": "I"
+})
+EXPERIENCE_LEVEL_CODES = MappingProxyType({
+    "entry": "1",
+    "associate": "2",
+    "mid-senior": "3",
+    "director": "4",
+    "executive": "5"
+})
+POSTED_WITHIN_CODES = MappingProxyType({
+    "24h": "r86400",
+    "week": "r604800",
+    "month": "r2592000"
+})
+
+# Search listings change quickly, so they are cached for less time than job details
+LISTING_CACHE_TTL_SECONDS = 600
+
+# Job cards on each page of the logged-out search results
+GUEST_PAGE_SIZE = 25
+
+# Browser sessions kept warm for agent runs, recycled after MAX_USES_PER_INSTANCE tasks
+POOL_SIZE = 4
+MAX_USES_PER_INSTANCE = 50
+
+
+# Instructions shared by every scrape task. They are sent once as part of the
+# system prompt (a prefix the LLM provider can cache), so each task only
+# carries its URL and limits.
+SCRAPE_SYSTEM_MESSAGE = """
+You extract job data from LinkedIn pages.
+- Stay on the given page; on a search page open each job card in the right-hand pane instead of leaving it.
+- Click "Show more" to expand a full job description before reading it.
+- Leave a field empty when the page does not show it; never guess.
+- Report the results through the done action's structured data.
+"""
+
+LISTING_TASK = "Search page: {url}\nCollect up to {max_results} jobs (paginate if needed)."
+DETAIL_TASK = "Job page: {url}\nCollect the job's details."
+
+# One append-only step log per process, so concurrent scrapers never rewrite a shared file
+STEP_LOG_PATH = LOGS_DIR / f"scrape-{os.getpid()}-{int(time.time())}.jsonl"
+
+
+def _log_agent_step(state: Any, model_output: Any, step: int):
+    """
+    Append one agent step to the JSONL step log (register_new_step_callback).
+    
+    Never raises: a logging failure must not abort the agent's step.
+    """
+    try:
+        record = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "step": step,
+            "url": getattr(state, "url", None),
+            "output": model_output.model_dump(mode="json", exclude_none=True) if model_output is not None else None
+        }
+        with open(STEP_LOG_PATH, "ab") as f:
+            f.write(orjson.dumps(record) + b"\n")
+    except Exception as e:
+        logger.debug(f"Failed to write agent step log: {e}")
+
+
+class BrowserPool:
+    """Pool of long-lived browser sessions shared by every agent run in the process."""
+    
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[int, int] = {}
+        # Every live session, idle or checked out, so close() can reach them all
+        self._sessions: Dict[int, BrowserSession] = {}
+        self._started = 0
+        self._closed = False
+    
+    async def _start_session(self) -> BrowserSession:
+        """Launch a browser session that outlives the agents using it."""
+        session = BrowserSession(headless=settings.browser_headless, keep_alive=True)
+        await session.start()
+        self._uses[id(session)] = 0
+        self._sessions[id(session)] = session
+        return session
+    
+    async def _kill_session(self, session: BrowserSession):
+        """Shut down a session and forget it."""
+        self._uses.pop(id(session), None)
+        self._sessions.pop(id(session), None)
+        try:
+            await session.kill()
+        except Exception as e:
+            logger.error(f"Failed to close browser session: {e}")
+    
+    async def acquire(self) -> BrowserSession:
+        """Check out a session, starting one lazily while the pool is below size."""
+        while True:
+            if self._idle.empty() and self._started < self.size:
+                self._started += 1
+                try:
+                    return await self._start_session()
+                except Exception:
+                    self._started -= 1
+                    raise
+            session = await self._idle.get()
+            if session is not None:
+                return session
+            # None marks a slot freed by a failed restart; start a session in it
+    
+    async def release(self, session: BrowserSession):
+        """Return a session to the pool, replacing it once it has been used max_uses times."""
+        if self._closed:
+            # Checked out when the pool closed; nothing will use it again
+            await self._kill_session(session)
+            return
+        uses = self._uses.pop(id(session), 0) + 1
+        if uses >= self.max_uses:
+            logger.info(f"Recycling browser session after {uses} uses")
+            await self._kill_session(session)
+            try:
+                session = await self._start_session()
+            except Exception as e:
+                logger.error(f"Failed to restart browser session: {e}")
+                self._started -= 1
+                # Wake a waiter so it can start a session in the freed slot
+                self._idle.put_nowait(None)
+                return
+        else:
+            self._uses[id(session)] = uses
+        self._idle.put_nowait(session)
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[BrowserSession]:
+        """
+        Check out a session for one task.
+        
+        Tabs the task opened are closed before the session goes back to the
+        pool, so a warm browser holds one tab instead of one per past task.
+        """
+        session = await self.acquire()
+        try:
+            yield session
+        finally:
+            await self._close_extra_tabs(session)
+            await self.release(session)
+    
+    async def _close_extra_tabs(self, session: BrowserSession):
+        """Close every tab but the first."""
+        try:
+            for tab in (await session.get_tabs())[1:]:
+                await session.event_bus.dispatch(CloseTabEvent(target_id=tab.target_id))
+        except Exception as e:
+            logger.debug(f"Failed to close extra tabs: {e}")
+    
+    async def close(self):
+        """Shut down every session, including ones still checked out."""
+        self._closed = True
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for session in list(self._sessions.values()):
+            await self._kill_session(session)
+        self._started = 0
+
+
+class _LoopResources:
+    """
+    Async resources shared by every scraper on one event loop.
+
+    Clients, queues and locks are bound to the loop that first uses them, so
+    each loop gets its own set, created on first use; close_shared_resources()
+    releases them before the loop exits.
+    """
+    
+    def __init__(self):
+        # Paces every outbound LinkedIn request on the loop to the configured rate
+        self.rate_limiter = TokenBucket(settings.max_rate_per_minute, period=60)
+        self.browser_pool = BrowserPool()
+        # Plain HTTP fetches reuse warm HTTP/2 connections
+        self.http = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=10.0
+        )
+        self._llm: Optional[ChatOpenAI] = None
+        self._llm_http: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def llm(self) -> ChatOpenAI:
+        """
+        LLM client shared by every agent run on the loop.
+        
+        Browser-Use's own ChatOpenAI calls openai.AsyncOpenAI directly, without
+        LangChain's message conversion and callbacks. It is built on first use
+        rather than at import, so the module can be imported without an API key.
+        Every agent step goes through one pooled HTTP/2 connection.
+        """
+        if self._llm is None:
+            self._llm_http = httpx.AsyncClient(http2=True)
+            self._llm = ChatOpenAI(
+                api_key=settings.openai_api_key,
+                model=settings.openai_model,
+                temperature=0.1,
+                http_client=self._llm_http
+            )
+        return self._llm
+    
+    async def close(self):
+        """Shut down the browser pool and close the HTTP clients."""
+        await self.browser_pool.close()
+        await self.http.aclose()
+        if self._llm_http is not None:
+            await self._llm_http.aclose()
+
+
+_loop_resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources]" = weakref.WeakKeyDictionary()
+
+
+def _shared() -> _LoopResources:
+    """The running event loop's shared resources, created on first use."""
+    loop = asyncio.get_running_loop()
+    resources = _loop_resources.get(loop)
+    if resources is None:
+        resources = _loop_resources[loop] = _LoopResources()
+    return resources
+
+
+async def close_shared_resources():
+    """Close the running loop's browser pool, HTTP client and LLM client; call before the loop exits."""
+    resources = _loop_resources.pop(asyncio.get_running_loop(), None)
+    if resources is None:
+        return
+    await resources.close()
+
+
 class JobSearchParams(BaseModel):
     """Parameters for LinkedIn job search."""
+    # Read-only once built, so it is hashable and safe to share between tasks
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     keywords: str
     location: str = settings.default_location
     job_type: Optional[str] = settings.default_job_type
@@ -28,35 +296,80 @@ class JobSearchParams(BaseModel):
     max_results: int = settings.max_results_per_search
 
 
+class JobDetails(BaseModel):
+    """Detail fields an agent reads from a job posting."""
+    description: str = ""
+    requirements: List[str] = []
+    qualifications: List[str] = []
+    responsibilities: List[str] = []
+    benefits: List[str] = []
+    salary_range: str = ""
+    application_deadline: str = ""
+    applicants_count: str = ""
+    employment_type: str = ""
+    industry: str = ""
+    company_size: str = ""
+
+
+class ScrapedJob(JobDetails):
+    """A job card from the search results together with its details."""
+    title: str
+    company: str = ""
+    location: str = ""
+    posted_date: str = ""
+    url: str = ""
+    job_id: str = ""
+
+
+class ScrapedJobList(BaseModel):
+    """Structured result of a listing task."""
+    jobs: List[ScrapedJob]
+
+
 class LinkedInScraper:
     """LinkedIn job scraper using Browser-Use AI agent."""
     
-    def __init__(self):
-        """Initialize the LinkedIn scraper."""
-        self.llm = ChatOpenAI(
-            api_key=settings.openai_api_key,
-            model=settings.openai_model,
-            temperature=0.1
-        )
-        self.controller = None
-        self.agent = None
+    @property
+    def llm(self) -> ChatOpenAI:
+        """LLM client shared by every scraper on the running event loop."""
+        return _shared().llm
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """HTTP client shared by every scraper on the running event loop."""
+        return _shared().http
+    
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the LinkedIn scraper.
+        
+        Args:
+            use_cache: Reuse listings and job details scraped recently (disable for fresh results)
+        """
+        # One controller per structured output model, since the model
+        # replaces the controller's done action
+        self.controllers: Optional[Dict[type, Controller]] = None
         self.browser = None
-        self.jobs_scraped = []
+        # Unique jobs scraped this session, keyed by _job_key
+        self.jobs_scraped: Dict[str, Dict[str, Any]] = {}
+        self._init_lock = asyncio.Lock()
+        self.cache = Cache(settings.cache_dir) if use_cache else None
         
     async def initialize(self):
-        """Initialize the browser and agent."""
+        """Initialize the browser controller (no-op once initialized)."""
+        async with self._init_lock:
+            if self.controllers is not None:
+                return
+            await self._initialize()
+    
+    async def _initialize(self):
+        """Create the controllers shared by every agent run."""
         try:
-            # Create controller for browser automation
-            self.controller = Controller()
-            
-            # Create AI agent with specific instructions for LinkedIn
-            self.agent = Agent(
-                task="Search for jobs on LinkedIn and extract job details",
-                llm=self.llm,
-                controller=self.controller,
-                use_vision=True,  # Enable vision for better page understanding
-                save_conversation_to="linkedin_scrape_log.json"
-            )
+            # Create controllers for browser automation
+            self.controllers = {
+                model: Controller(output_model=model)
+                for model in (ScrapedJobList, JobDetails)
+            }
             
             logger.info("LinkedIn scraper initialized successfully")
             
@@ -64,73 +377,252 @@ class LinkedInScraper:
             logger.error(f"Failed to initialize scraper: {e}")
             raise
     
+    async def _run_agent(
+        self,
+        task: str,
+        output_model: type,
+        use_vision: bool = False
+    ) -> Optional[str]:
+        """
+        Run one agent task and return its final result.
+        
+        Each task gets its own Agent (sharing the LLM client and controllers)
+        on a session checked out from the browser pool, so several tasks
+        can run concurrently without a browser cold start each. Screenshots
+        are only sent to the LLM when use_vision is set.
+        
+        The agent must finish with data matching output_model, so the result
+        is that model's JSON rather than free text.
+        """
+        resources = _shared()
+        await resources.rate_limiter.acquire()
+        async with resources.browser_pool.session() as session:
+            agent = Agent(
+                task=task,
+                llm=self.llm,
+                controller=self.controllers[output_model],
+                output_model_schema=output_model,
+                browser_session=session,
+                use_vision=use_vision,
+                extend_system_message=SCRAPE_SYSTEM_MESSAGE,
+                register_new_step_callback=_log_agent_step
+            )
+            history = await agent.run()
+            return history.final_result()
+    
+    async def _run_with_vision_fallback(
+        self,
+        task: str,
+        output_model: type,
+        parse: Callable[[Any], Any],
+        accept: Callable[[Any], bool] = bool
+    ) -> Any:
+        """
+        Run a task on the page text alone, retrying once with vision.
+        
+        LinkedIn's DOM is structured enough for text extraction in most
+        cases; screenshots cost far more tokens, so they are only sent when
+        the text-only run fails or its parsed result is not accepted.
+        Structured output always parses to a full model, so callers pass
+        accept to say what counts as an empty result.
+        """
+        try:
+            parsed = parse(await self._run_agent(task, output_model))
+        except Exception as e:
+            logger.warning(f"Text-only agent run failed: {e}")
+            parsed = None
+        if parsed is not None and accept(parsed):
+            return parsed
+        
+        logger.info("Text-only extraction came back empty, retrying with vision")
+        return parse(await self._run_agent(task, output_model, use_vision=True))
+    
+    async def __aenter__(self) -> "LinkedInScraper":
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+    
     async def search_jobs(self, params: JobSearchParams) -> List[Dict[str, Any]]:
         """
         Search for jobs on LinkedIn based on parameters.
         
+        The browser stays open between searches; use the scraper as an async
+        context manager (or call cleanup()) to release it.
+        
         Args:
             params: Search parameters
             
         Returns:
-            List of job dictionaries
+            List of job dictionaries, in the order they finished scraping
+        """
+        return [job async for job in self.search_jobs_stream(params)]
+    
+    async def search_jobs_stream(self, params: JobSearchParams) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for jobs and yield each one as soon as it is fully scraped.
+        
+        Jobs that came back complete with the listing are yielded first; the
+        rest follow as their detail scrapes finish, so callers can store or
+        rank early results while later pages are still loading.
+        
+        Args:
+            params: Search parameters
+            
+        Yields:
+            Job dictionaries
         """
         try:
             await self.initialize()
-            
-            # Build search URL
-            search_url = self._build_search_url(params)
-            logger.info(f"Searching LinkedIn with URL: {search_url}")
-            
-            # Navigate to LinkedIn jobs
-            search_task = f"""
-            1. Go to LinkedIn Jobs: {search_url}
-            2. Wait for the job listings to load
-            3. Extract the following information for each job listing visible on the page:
-               - Job title
-               - Company name
-               - Location
-               - Posted date
-               - Job URL (the link to the full job posting)
-            4. If there are multiple pages, navigate through them (up to {params.max_results} jobs total)
-            5. Return the extracted data as a structured JSON
-            """
-            
-            # Execute the search task
-            result = await self.agent.run(search_task)
-            
-            # Parse the results
-            jobs = self._parse_job_results(result)
-            
-            # Get detailed information for each job
-            detailed_jobs = []
-            for job in jobs[:params.max_results]:
-                try:
-                    detailed_job = await self._get_job_details(job)
-                    detailed_jobs.append(detailed_job)
-                    self.jobs_scraped.append(detailed_job)
-                    
-                    # Add delay to avoid rate limiting
-                    await asyncio.sleep(settings.search_delay_seconds)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to get details for job {job.get('title')}: {e}")
-                    continue
-            
-            logger.info(f"Successfully scraped {len(detailed_jobs)} jobs")
-            return detailed_jobs
-            
+            jobs = await self._collect_listings(params)
         except Exception as e:
             logger.error(f"Job search failed: {e}")
             raise
+        
+        scraped_at = datetime.now().isoformat(timespec="seconds")
+        yielded = 0
+        
+        # Only jobs whose description did not come back with the listing
+        # need their own detail-page visit, a few at a time
+        incomplete = [job for job in jobs if not job.get("description")]
+        if incomplete:
+            logger.info(f"Fetching detail pages for {len(incomplete)} jobs without a description")
+        
+        concurrency = settings.max_concurrency or 5
+        semaphore = asyncio.Semaphore(concurrency)
+        # Bounded so detail workers pause when the consumer falls behind
+        finished: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        
+        async def worker(job: Dict[str, Any]):
+            # Pacing comes from the shared rate limiter in _run_agent
+            try:
+                async with semaphore:
+                    result = await self._get_job_details(job, scraped_at)
+            except Exception as e:
+                result = e
+            await finished.put((job, result))
+        
+        # Start detail scrapes before the first yield, so they run while the
+        # consumer handles the jobs that are already complete
+        workers = [asyncio.create_task(worker(job)) for job in incomplete]
+        try:
+            for job in jobs:
+                if job.get("description"):
+                    self._add_metadata(job, scraped_at)
+                    self.jobs_scraped[self._job_key(job)] = job
+                    yielded += 1
+                    yield job
+            
+            for _ in workers:
+                job, result = await finished.get()
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to get details for job {job.get('title')}: {result}")
+                    continue
+                self.jobs_scraped[self._job_key(result)] = result
+                yielded += 1
+                yield result
         finally:
-            await self.cleanup()
+            # Stop outstanding scrapes if the consumer stops early
+            for task in workers:
+                task.cancel()
+        
+        logger.info(f"Successfully scraped {yielded} jobs")
+    
+    async def _collect_listings(self, params: JobSearchParams) -> List[Dict[str, Any]]:
+        """
+        Collect the search results for params, from cache when fresh.
+        
+        Returns:
+            Up to params.max_results jobs not already scraped by this scraper
+        """
+        # Build search URL
+        search_url = self._build_search_url(params)
+        logger.info(f"Searching LinkedIn with URL: {search_url}")
+        
+        # Collect listings and their details in one pass over the results page
+        search_task = LISTING_TASK.format(url=search_url, max_results=params.max_results)
+        
+        listing_key = self._cache_key("listing", f"{search_url}|{params.max_results}")
+        jobs = self.cache.get(listing_key) if self.cache is not None else None
+        if jobs is not None:
+            logger.info(f"Using cached listing ({len(jobs)} jobs)")
+        else:
+            # The server-rendered listing needs no browser or LLM; the agent
+            # only collects listings when those pages come up short
+            jobs = await self._fetch_listings_fast(search_url, params.max_results)
+            if len(jobs) < params.max_results:
+                if jobs:
+                    logger.info(f"HTTP listing found {len(jobs)} of {params.max_results} jobs, topping up with the agent")
+                try:
+                    jobs = jobs + await self._run_with_vision_fallback(
+                        search_task, ScrapedJobList, self._parse_job_results
+                    )
+                except Exception as e:
+                    if not jobs:
+                        raise
+                    logger.warning(f"Agent listing failed, keeping {len(jobs)} HTTP listings: {e}")
+            if self.cache is not None and jobs:
+                self.cache.set(listing_key, jobs, expire=LISTING_CACHE_TTL_SECONDS)
+        
+        # Drop repeats (the agent often re-emits jobs across pages) and jobs
+        # this scraper already returned, then cap, so no slot is spent on them
+        # (the agent's copy of a job may lack the job_id, so URLs are checked too)
+        unique = {}
+        urls = set()
+        for job in jobs:
+            key = self._job_key(job)
+            url = job.get("url")
+            if key in self.jobs_scraped or key in unique or (url and url in urls):
+                continue
+            unique[key] = job
+            if url:
+                urls.add(url)
+        if len(unique) < len(jobs):
+            logger.info(f"Skipping {len(jobs) - len(unique)} duplicate or already scraped jobs")
+        return list(unique.values())[:params.max_results]
     
-    async def _get_job_details(self, job_summary: Dict[str, Any]) -> Dict[str, Any]:
+    async def _fetch_listings_fast(self, url: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        Fetch job cards from the search pages over plain HTTP.
+        
+        Pages of GUEST_PAGE_SIZE cards are requested concurrently with
+        start= offsets until max_results is covered; results stop at the
+        first empty page. Throttled pages are not retried, since the agent
+        collects whatever this comes up short on.
+        
+        Cards carry no description, so search_jobs fetches details for each
+        job with the agent afterwards.
+        
+        Returns:
+            Cleaned job dictionaries, empty if no page could be fetched or parsed
+        """
+        separator = "&" if "?" in url else "?"
+        page_urls = [
+            f"{url}{separator}start={start}" if start else url
+            for start in range(0, max_results, GUEST_PAGE_SIZE)
+        ]
+        rate_limiter = _shared().rate_limiter
+        for _ in page_urls:
+            await rate_limiter.acquire()
+        pages = await fetch_all_parallel(page_urls, client=self.http, retry_throttled=False)
+        
+        jobs = []
+        for html in pages:
+            page_jobs = self._parse_job_results(parse_job_cards(html)) if html else []
+            if not page_jobs:
+                break
+            jobs.extend(page_jobs)
+        logger.info(f"Fetched {len(jobs)} listings over HTTP from {len(page_urls)} pages")
+        return jobs[:max_results]
+    
+    async def _get_job_details(self, job_summary: Dict[str, Any], scraped_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Get detailed information for a specific job.
         
         Args:
             job_summary: Basic job information including URL
+            scraped_at: ISO timestamp shared by the whole search (defaults to now)
             
         Returns:
             Detailed job information
@@ -142,34 +634,24 @@ class LinkedInScraper:
                 return job_summary
             
             # Task to extract detailed job information
-            detail_task = f"""
-            1. Navigate to the job posting: {job_url}
-            2. Click "Show more" or similar buttons to expand the full job description
-            3. Extract the following detailed information:
-               - Full job description
-               - Required qualifications
-               - Preferred qualifications
-               - Responsibilities
-               - Benefits (if mentioned)
-               - Salary range (if mentioned)
-               - Application deadline (if mentioned)
-               - Number of applicants (if visible)
-               - Employment type (Full-time, Part-time, Contract, etc.)
-               - Industry
-               - Company size
-            4. Return all information as structured JSON
-            """
+            detail_task = DETAIL_TASK.format(url=job_url)
             
-            # Execute detail extraction
-            result = await self.agent.run(detail_task)
+            details_key = self._cache_key("details", job_url)
+            details = self.cache.get(details_key) if self.cache is not None else None
+            if details is not None:
+                logger.debug(f"Using cached details for {job_url}")
+            else:
+                # Execute detail extraction
+                details = await self._run_with_vision_fallback(
+                    detail_task, JobDetails, self._parse_job_details, self._has_description
+                )
+                # An all-default result means the page was not read; retry it next time
+                if self.cache is not None and self._has_description(details):
+                    self.cache.set(details_key, details, expire=settings.cache_ttl_hours * 3600)
             
-            # Parse and merge with summary
-            details = self._parse_job_details(result)
+            # Merge with summary
             job_full = {**job_summary, **details}
-            
-            # Add metadata
-            job_full["scraped_at"] = datetime.now().isoformat()
-            job_full["source"] = "LinkedIn"
+            self._add_metadata(job_full, scraped_at or datetime.now().isoformat(timespec="seconds"))
             
             return job_full
             
@@ -177,70 +659,62 @@ class LinkedInScraper:
             logger.error(f"Failed to get job details for job_id {job_summary.get('job_id')}: {e}")
             return job_summary
     
-    def _build_search_url(self, params: JobSearchParams) -> str:
-        """Build LinkedIn job search URL from parameters."""
-        base_url = "https://www.linkedin.com/jobs/search/"
-        
-        query_params = []
+    @staticmethod
+    def _has_description(details: Dict[str, Any]) -> bool:
+        """Whether parsed details include the job description."""
+        return bool(details and details.get("description"))
+    
+    @staticmethod
+    def _add_metadata(job: Dict[str, Any], scraped_at: str):
+        """Stamp a scraped job with its scrape time and source."""
+        job["scraped_at"] = scraped_at
+        job["source"] = "LinkedIn"
+    
+    @staticmethod
+    def _cache_key(kind: str, value: str) -> str:
+        """Cache key for a listing or details entry."""
+        return f"{kind}:{hashlib.sha256(value.encode()).hexdigest()}"
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_search_url(params: JobSearchParams) -> str:
+        """Build LinkedIn job search URL from parameters (memoized; params are frozen)."""
+        query = {}
         
-        # Keywords
         if params.keywords:
-            query_params.append(f"keywords={params.keywords.replace(' ', '%20')}")
-        
-        # Location
+            query["keywords"] = params.keywords
         if params.location:
-            query_params.append(f"location={params.location.replace(' ', '%20')}")
+            query["location"] = params.location
         
         # Job type
-        job_type_map = {
-            "full-time": "F",
-            "part-time": "P",
-            "contract": "C",
-            "temporary": "T",
-            "internship": "I"
-        }
-        if params.job_type and params.job_type.lower() in job_type_map:
-            query_params.append(f"f_JT={job_type_map[params.job_type.lower()]}")
+        if params.job_type and params.job_type.lower() in JOB_TYPE_CODES:
+            query["f_JT"] = JOB_TYPE_CODES[params.job_type.lower()]
         
         # Experience level
-        exp_level_map = {
-            "entry": "1",
-            "associate": "2",
-            "mid-senior": "3",
-            "director": "4",
-            "executive": "5"
-        }
-        if params.experience_level and params.experience_level.lower() in exp_level_map:
-            query_params.append(f"f_E={exp_level_map[params.experience_level.lower()]}")
+        if params.experience_level and params.experience_level.lower() in EXPERIENCE_LEVEL_CODES:
+            query["f_E"] = EXPERIENCE_LEVEL_CODES[params.experience_level.lower()]
         
         # Remote
         if params.remote:
-            query_params.append("f_WT=2")  # Remote work type
+            query["f_WT"] = "2"  # Remote work type
         
         # Posted within
-        time_map = {
-            "24h": "r86400",
-            "week": "r604800",
-            "month": "r2592000"
-        }
-        if params.posted_within and params.posted_within in time_map:
-            query_params.append(f"f_TPR={time_map[params.posted_within]}")
+        if params.posted_within and params.posted_within in POSTED_WITHIN_CODES:
+            query["f_TPR"] = POSTED_WITHIN_CODES[params.posted_within]
         
-        # Build final URL
-        if query_params:
-            return f"{base_url}?{'&'.join(query_params)}"
-        return base_url
+        # urlencode escapes every reserved and non-ASCII character, not just spaces
+        if query:
+            return f"{SEARCH_BASE_URL}?{urlencode(query, safe=',')}"
+        return SEARCH_BASE_URL
     
     def _parse_job_results(self, agent_result: Any) -> List[Dict[str, Any]]:
         """Parse job results from agent response."""
         try:
             # Extract JSON from agent response
             if isinstance(agent_result, str):
-                # Try to find JSON in the response
-                json_match = re.search(r'\{.*\}|\[.*\]', agent_result, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                else:
+                # agent.run often returns clean JSON; otherwise find it in the text
+                data = _loads_agent_json(agent_result)
+                if data is None:
                     logger.warning("No JSON found in agent response")
                     return []
             else:
@@ -269,7 +743,9 @@ class LinkedInScraper:
                         "location": job.get("location", ""),
                         "posted_date": job.get("posted_date", ""),
                         "url": job.get("url", ""),
-                        "job_id": job.get("job_id", "")
+                        "job_id": job.get("job_id", ""),
+                        # Details collected from the side pane in the same pass
+                        **self._clean_details(job)
                     }
                     cleaned_jobs.append(cleaned_job)
             
@@ -284,51 +760,60 @@ class LinkedInScraper:
         try:
             # Extract JSON from agent response
             if isinstance(agent_result, str):
-                json_match = re.search(r'\{.*\}', agent_result, re.DOTALL)
-                if json_match:
-                    details = json.loads(json_match.group())
-                else:
+                details = _loads_agent_json(agent_result, opening="{")
+                if not isinstance(details, dict):
                     details = {}
             else:
                 details = agent_result if isinstance(agent_result, dict) else {}
             
-            # Clean and structure the details
-            return {
-                "description": details.get("description", ""),
-                "requirements": details.get("requirements", []),
-                "qualifications": details.get("qualifications", []),
-                "responsibilities": details.get("responsibilities", []),
-                "benefits": details.get("benefits", []),
-                "salary_range": details.get("salary_range", ""),
-                "application_deadline": details.get("application_deadline", ""),
-                "applicants_count": details.get("applicants_count", ""),
-                "employment_type": details.get("employment_type", ""),
-                "industry": details.get("industry", ""),
-                "company_size": details.get("company_size", "")
-            }
+            # Nothing extracted: leave the summary's fields as they are
+            return self._clean_details(details) if details else {}
             
         except Exception as e:
             logger.error(f"Failed to parse job details: {e}")
             return {}
     
+    @staticmethod
+    def _clean_details(details: Dict[str, Any]) -> Dict[str, Any]:
+        """Structure the detail fields of a job, defaulting missing ones."""
+        return {
+            "description": details.get("description", ""),
+            "requirements": details.get("requirements", []),
+            "qualifications": details.get("qualifications", []),
+            "responsibilities": details.get("responsibilities", []),
+            "benefits": details.get("benefits", []),
+            "salary_range": details.get("salary_range", ""),
+            "application_deadline": details.get("application_deadline", ""),
+            "applicants_count": details.get("applicants_count", ""),
+            "employment_type": details.get("employment_type", ""),
+            "industry": details.get("industry", ""),
+            "company_size": details.get("company_size", "")
+        }
+    
     async def cleanup(self):
         """Clean up browser resources."""
         try:
-            if self.controller:
-                await self.controller.close()
+            # Controllers hold no browser resources (sessions belong to the
+            # pool); dropping them lets initialize() start fresh after cleanup
+            self.controllers = None
+            if self.cache is not None:
+                self.cache.close()
             logger.info("Scraper cleanup completed")
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
     
+    @staticmethod
+    def _job_key(job: Dict[str, Any]) -> str:
+        """Identify a job by job_id, falling back to its URL, then title and company."""
+        return job.get("job_id") or job.get("url") or f"{job.get('title', '')}|{job.get('company', '')}"
+    
     def get_scraped_jobs(self) -> List[Dict[str, Any]]:
-        """Get all jobs scraped in this session."""
-        return self.jobs_scraped
+        """Get all unique jobs scraped in this session."""
+        return list(self.jobs_scraped.values())
 
 
 async def test_scraper():
     """Test the LinkedIn scraper."""
-    scraper = LinkedInScraper()
-    
     params = JobSearchParams(
         keywords="software engineer",
         location="San Francisco, CA",
@@ -338,7 +823,8 @@ async def test_scraper():
     )
     
     try:
-        jobs = await scraper.search_jobs(params)
+        async with LinkedInScraper() as scraper:
+            jobs = await scraper.search_jobs(params)
         print(f"Found {len(jobs)} jobs:")
         for job in jobs:
             print(f"- {job.get('title')} at {job.get('company')}")
@@ -347,6 +833,8 @@ async def test_scraper():
             print()
     except Exception as e:
         print(f"Test failed: {e}")
+    finally:
+        await close_shared_resources()
 
 
 if __name__ == "__main__":
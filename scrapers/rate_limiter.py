@@ -0,0 +1,44 @@
+"""Async token-bucket rate limiting for outbound LinkedIn requests."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket shared by concurrent tasks.
+
+    Allows bursts of up to `rate` requests, then refills at rate/period
+    tokens per second. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        """
+        Args:
+            rate: Requests allowed per period
+            period: Length of the period in seconds
+        """
+        self.capacity = max(1, rate)
+        self.fill_rate = self.capacity / period
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
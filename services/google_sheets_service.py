@@ -1,26 +1,314 @@
 """Google Sheets integration service for real-time job logging."""
 
+import asyncio
+import gzip
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from datetime import datetime
 import json
 
+import google.auth
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+import httplib2
+import httpx
+import orjson
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from config import settings
 from models.job_model import JobListing, GoogleSheetRow
 
+try:
+    from rbloom import Bloom
+except ImportError:  # rbloom is optional; duplicate checks hold every ID in a set without it
+    Bloom = None
+
+try:
+    import marisa_trie
+except ImportError:  # marisa-trie is optional; _DupIndex falls back to a frozenset
+    marisa_trie = None
+
 logger = logging.getLogger(__name__)
 
 # Google Sheets API scope
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Seconds before a Sheets API request times out
+HTTP_TIMEOUT_SECONDS = 30
+
+# Sheets REST endpoint used directly (over HTTP/2) for bulk writes
+SHEETS_API_URL = 'https://sheets.googleapis.com/v4/'
+
+# Request bodies at least this large are sent gzip-compressed
+GZIP_MIN_BYTES = 1024
+
+# Rows sent per appendCells request when logging jobs in bulk
+APPEND_CHUNK_ROWS = 1000
+
+# Queued status changes that trigger a values.batchUpdate without waiting for a flush
+STATUS_FLUSH_SIZE = 50
+
+# Seconds before cached job IDs are reloaded (and, when due, reconciled with the sheet)
+ID_CACHE_TTL_SECONDS = 300
+
+# Seconds between reconciling the local job ID index with the spreadsheet
+ID_RECONCILE_SECONDS = 24 * 3600
+
+# Queued rows that trigger a batchUpdate without waiting for flush()
+PENDING_FLUSH_ROWS = 500
+
+# Batches at least this large are appended column-major, where repeated
+# values (companies, locations, dates) sit together and the payload shrinks
+COLUMN_MAJOR_MIN_ROWS = 200
+
+# Bloom filter sizing for the job ID index
+BLOOM_MIN_CAPACITY = 10_000
+BLOOM_ERROR_RATE = 0.001
+
+# Status the Sheets API answers with when a quota is exhausted
+QUOTA_EXCEEDED_STATUS = 429
+
+# Jobs from add_job are written in batches of up to this many, or whatever
+# arrived within JOB_QUEUE_WAIT_SECONDS of the first one
+JOB_QUEUE_BATCH_SIZE = 500
+JOB_QUEUE_WAIT_SECONDS = 2.0
+
+# IDs added to a _DupIndex before its trie is rebuilt to include them
+DUP_INDEX_REBUILD_SIZE = 10_000
+
+
+def _cell(value: Any) -> Dict[str, Any]:
+    """Wrap a row value as an appendCells CellData, keeping numbers numeric."""
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': '' if value is None else str(value)}}
+
+
+# Bold white-on-blue header row, with columns sized to fit
+HEADER_FORMAT_REQUESTS = (
+    {
+        'repeatCell': {
+            'range': {
+                'sheetId': 0,
+                'startRowIndex': 0,
+                'endRowIndex': 1
+            },
+            'cell': {
+                'userEnteredFormat': {
+                    'backgroundColor': {
+                        'red': 0.2,
+                        'green': 0.5,
+                        'blue': 0.8
+                    },
+                    'textFormat': {
+                        'bold': True,
+                        'foregroundColor': {
+                            'red': 1.0,
+                            'green': 1.0,
+                            'blue': 1.0
+                        }
+                    }
+                }
+            },
+            'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+        }
+    },
+    {
+        'autoResizeDimensions': {
+            'dimensions': {
+                'sheetId': 0,
+                'dimension': 'COLUMNS',
+                'startIndex': 0,
+                'endIndex': 15
+            }
+        }
+    },
+)
+
+# Red-to-green gradient highlighting high-match jobs
+CONDITIONAL_FORMAT_REQUESTS = (
+    {
+        'addConditionalFormatRule': {
+            'rule': {
+                'ranges': [{
+                    'sheetId': 0,
+                    'startColumnIndex': 10,  # Resume Match % column
+                    'endColumnIndex': 11
+                }],
+                'gradientRule': {
+                    'minpoint': {
+                        'color': {
+                            'red': 1.0,
+                            'green': 0.4,
+                            'blue': 0.4
+                        },
+                        'type': 'MIN'
+                    },
+                    'midpoint': {
+                        'color': {
+                            'red': 1.0,
+                            'green': 1.0,
+                            'blue': 0.4
+                        },
+                        'type': 'PERCENTILE',
+                        'value': '50'
+                    },
+                    'maxpoint': {
+                        'color': {
+                            'red': 0.4,
+                            'green': 1.0,
+                            'blue': 0.4
+                        },
+                        'type': 'MAX'
+                    }
+                }
+            }
+        }
+    },
+)
+
+
+def _header_requests() -> List[Dict[str, Any]]:
+    """batchUpdate requests that write the header row and format it."""
+    return [{
+        'updateCells': {
+            'rows': [{'values': [_cell(header) for header in GoogleSheetRow.get_headers()]}],
+            'fields': 'userEnteredValue',
+            'start': {'sheetId': 0, 'rowIndex': 0, 'columnIndex': 0}
+        }
+    }, *HEADER_FORMAT_REQUESTS]
+
+
+class _BloomIndex:
+    """
+    Set-like view of the local job ID index for one spreadsheet.
+
+    A Bloom filter (about 10 bits per ID instead of a Python string each)
+    answers most lookups for new IDs in memory; positives are confirmed
+    against the SQLite index.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, spreadsheet_id: str, lock: threading.RLock):
+        self._conn = conn
+        self._spreadsheet_id = spreadsheet_id
+        # Guards the connection, which the service's writer thread also uses
+        self._lock = lock
+        with lock:
+            (count,) = conn.execute(
+                'SELECT COUNT(*) FROM seen_ids WHERE spreadsheet_id = ?', (spreadsheet_id,)
+            ).fetchone()
+            self._bloom = Bloom(max(BLOOM_MIN_CAPACITY, count * 2), BLOOM_ERROR_RATE)
+            self._bloom.update(
+                row[0] for row in conn.execute(
+                    'SELECT job_id FROM seen_ids WHERE spreadsheet_id = ?', (spreadsheet_id,)
+                )
+            )
+
+    def __contains__(self, job_id: str) -> bool:
+        if job_id not in self._bloom:
+            return False
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM seen_ids WHERE spreadsheet_id = ? AND job_id = ?',
+                (self._spreadsheet_id, job_id)
+            ).fetchone() is not None
+
+    def add(self, job_id: str):
+        self._bloom.add(job_id)
+
+    def update(self, job_ids: Iterable[str]):
+        self._bloom.update(job_ids)
+
+
+def _is_quota_error(exc: BaseException) -> bool:
+    """True for an HttpError rejecting a request over quota."""
+    return isinstance(exc, HttpError) and exc.resp.status == QUOTA_EXCEEDED_STATUS
+
+
+# Jittered exponential backoff for requests rejected over quota
+retry_over_quota = retry(
+    retry=retry_if_exception(_is_quota_error),
+    wait=wait_random_exponential(multiplier=1, max=64),
+    stop=stop_after_attempt(6),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+class _RequestBucket:
+    """
+    Thread-safe token bucket for Sheets API requests.
+
+    Allows bursts of up to `rate` requests, then refills at rate/period
+    tokens per second; acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = max(1, rate)
+        self.fill_rate = self.capacity / period
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until a token is available and take it."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) / self.fill_rate)
+
+
+class _DupIndex:
+    """
+    Set-like job ID index kept in a compact, read-only trie.
+
+    A marisa-trie stores short IDs several times smaller than a Python set.
+    IDs added afterwards go to a small set delta that is folded into a new
+    trie every DUP_INDEX_REBUILD_SIZE additions.
+    """
+
+    def __init__(self, job_ids: Iterable[str] = ()):
+        self._trie = self._build(job_ids)
+        self._delta: set = set()
+
+    @staticmethod
+    def _build(job_ids: Iterable[str]):
+        if marisa_trie is None:
+            return frozenset(job_ids)
+        return marisa_trie.Trie(job_ids)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._delta or job_id in self._trie
+
+    def __len__(self) -> int:
+        return len(self._trie) + len(self._delta)
+
+    def add(self, job_id: str):
+        if job_id not in self._trie:
+            self._delta.add(job_id)
+            if len(self._delta) >= DUP_INDEX_REBUILD_SIZE:
+                self._trie = self._build([*self._trie, *self._delta])
+                self._delta.clear()
+
+    def update(self, job_ids: Iterable[str]):
+        for job_id in job_ids:
+            self.add(job_id)
+
 
 class GoogleSheetsService:
     """Service for interacting with Google Sheets."""
@@ -33,13 +321,65 @@ class GoogleSheetsService:
             spreadsheet_id: Google Sheets ID (uses config default if not provided)
         """
         self.spreadsheet_id = spreadsheet_id or settings.google_sheets_id
-        self.service = None
+        # Authentication and header checks are deferred to first use of service
+        self._authenticated = False
+        self._auth_lock = threading.Lock()
         self.credentials = None
-        self._authenticate()
-        
-        # Ensure headers exist in the spreadsheet
-        if self.service and self.spreadsheet_id:
-            self._ensure_headers_exist()
+        self._rest: Optional[httpx.Client] = None
+        # Job IDs already in the sheet, loaded on first duplicate check
+        self._known_ids = None
+        self._ids_loaded_at = 0.0
+        # The index connection is shared with the writer thread; _db_lock serializes its use
+        self._db_lock = threading.RLock()
+        self._seen_db = self._open_seen_db()
+        # batchUpdate requests waiting to be sent together by flush()
+        self._pending_requests: List[Dict[str, Any]] = []
+        self._pending_rows = 0
+        # Status per row number, written together by flush_status_updates()
+        self._status_queue: Dict[int, str] = {}
+        # Jobs from add_job, written in batches by a background thread
+        self._job_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # First error the writer thread hit since the last flush(), re-raised there
+        self._writer_error: Optional[Exception] = None
+        # Held across duplicate filtering and appends, and around the request
+        # and status queues, since add_job writes from another thread
+        self._write_lock = threading.RLock()
+        # Separate budgets for the read and write request quotas
+        self._read_bucket = _RequestBucket(settings.sheets_reads_per_minute)
+        self._write_bucket = _RequestBucket(settings.sheets_writes_per_minute)
+    
+    @property
+    def service(self) -> Optional[httpx.Client]:
+        """
+        HTTP client for the Sheets REST API, authenticated on first use.
+
+        None when credentials are missing or authentication failed; the
+        attempt is made once, so a failure is logged once rather than for
+        every job. Authentication may open a browser for OAuth and makes
+        blocking HTTP calls, so async callers should trigger it from a
+        worker thread (app startup does). Requests should go through
+        _rest_call(), which adds authorization, quota limits and retries.
+        """
+        if not self._authenticated:
+            with self._auth_lock:
+                if not self._authenticated:
+                    try:
+                        self._authenticate()
+                    except Exception:
+                        # Already logged by _authenticate; run without Sheets
+                        self._rest = None
+                    # Marked before the header check, whose own _rest_call
+                    # reads this property again while the lock is held
+                    self._authenticated = True
+
+                    # Ensure headers exist in the spreadsheet
+                    if self._rest and self.spreadsheet_id:
+                        try:
+                            self._ensure_headers_exist()
+                        except Exception as e:
+                            logger.warning(f"Could not check spreadsheet headers: {e}")
+        return self._rest
         
     def _authenticate(self):
         """Authenticate with Google Sheets API."""
@@ -62,9 +402,20 @@ class GoogleSheetsService:
                             creds_path, SCOPES
                         )
                         self.credentials = flow.run_local_server(port=0)
+                else:
+                    # Not a JSON key file: use Application Default Credentials,
+                    # as the discovery client did when given no credentials
+                    self.credentials, _ = google.auth.default(scopes=SCOPES)
                 
-                # Build the service
-                self.service = build('sheets', 'v4', credentials=self.credentials)
+                # Every call goes straight to the REST endpoints over one
+                # HTTP/2 client with gzip, with no discovery document or
+                # dynamically built request objects in between
+                self._rest = httpx.Client(
+                    http2=True,
+                    base_url=SHEETS_API_URL,
+                    headers={'Accept-Encoding': 'gzip'},
+                    timeout=HTTP_TIMEOUT_SECONDS
+                )
                 logger.info("Successfully authenticated with Google Sheets API")
                 
             else:
@@ -92,6 +443,7 @@ class GoogleSheetsService:
                 },
                 'sheets': [{
                     'properties': {
+                        'sheetId': 0,
                         'title': 'Jobs',
                         'gridProperties': {
                             'frozenRowCount': 1
@@ -100,13 +452,13 @@ class GoogleSheetsService:
                 }]
             }
             
-            result = self.service.spreadsheets().create(body=spreadsheet).execute()
+            result = self._rest_call('POST', 'spreadsheets', body=spreadsheet)
             spreadsheet_id = result['spreadsheetId']
             
             logger.info(f"Created new spreadsheet with ID: {spreadsheet_id}")
             
-            # Initialize with headers
-            self._initialize_headers(spreadsheet_id)
+            # Headers, header formatting and conditional formatting in one call
+            self._initialize_sheet(spreadsheet_id)
             
             return spreadsheet_id
             
@@ -115,92 +467,38 @@ class GoogleSheetsService:
             raise
     
     def _initialize_headers(self, spreadsheet_id: Optional[str] = None):
-        """Initialize spreadsheet with headers."""
+        """Write and format the header row in one batchUpdate."""
         try:
-            sheet_id = spreadsheet_id or self.spreadsheet_id
-            headers = GoogleSheetRow.get_headers()
-            
-            # Add headers to first row
-            body = {
-                'values': [headers]
-            }
-            
-            self.service.spreadsheets().values().update(
-                spreadsheetId=sheet_id,
-                range='A1',
-                valueInputOption='RAW',
-                body=body
-            ).execute()
-            
-            # Format header row
-            self._format_header_row(sheet_id)
-            
+            self._batch_update(_header_requests(), spreadsheet_id)
             logger.info("Initialized spreadsheet with headers")
             
         except HttpError as e:
             logger.error(f"Failed to initialize headers: {e}")
             raise
     
-    def _format_header_row(self, spreadsheet_id: Optional[str] = None):
-        """Format the header row with bold text and background color."""
+    def _initialize_sheet(self, spreadsheet_id: Optional[str] = None):
+        """Write and format the header row and add conditional formatting in one batchUpdate."""
         try:
-            sheet_id = spreadsheet_id or self.spreadsheet_id
-            
-            requests = [{
-                'repeatCell': {
-                    'range': {
-                        'sheetId': 0,
-                        'startRowIndex': 0,
-                        'endRowIndex': 1
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': {
-                                'red': 0.2,
-                                'green': 0.5,
-                                'blue': 0.8
-                            },
-                            'textFormat': {
-                                'bold': True,
-                                'foregroundColor': {
-                                    'red': 1.0,
-                                    'green': 1.0,
-                                    'blue': 1.0
-                                }
-                            }
-                        }
-                    },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                }
-            }, {
-                'autoResizeDimensions': {
-                    'dimensions': {
-                        'sheetId': 0,
-                        'dimension': 'COLUMNS',
-                        'startIndex': 0,
-                        'endIndex': 15
-                    }
-                }
-            }]
-            
-            body = {'requests': requests}
-            
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=sheet_id,
-                body=body
-            ).execute()
+            self._batch_update(_header_requests() + list(CONDITIONAL_FORMAT_REQUESTS), spreadsheet_id)
+            logger.info("Initialized spreadsheet with headers and formatting")
             
         except HttpError as e:
-            logger.error(f"Failed to format header row: {e}")
+            logger.error(f"Failed to initialize spreadsheet: {e}")
+            raise
+    
+    def _batch_update(self, requests: List[Dict[str, Any]], spreadsheet_id: Optional[str] = None):
+        """Send requests in one spreadsheets.batchUpdate call."""
+        self._rest_call(
+            'POST',
+            f'spreadsheets/{spreadsheet_id or self.spreadsheet_id}:batchUpdate',
+            body={'requests': requests}
+        )
     
     def _ensure_headers_exist(self):
         """Check if headers exist and add them if missing."""
         try:
             # Check if sheet has any data in first row
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='A1:P1'
-            ).execute()
+            result = self._rest_call('GET', f'spreadsheets/{self.spreadsheet_id}/values/A1:P1')
             
             values = result.get('values', [])
             expected_headers = GoogleSheetRow.get_headers()
@@ -222,43 +520,69 @@ class GoogleSheetsService:
     
     def add_job(self, job: JobListing):
         """
-        Add a single job to the spreadsheet.
+        Queue a single job to be added to the spreadsheet.
         Automatically skips duplicates.
 
+        Jobs are written in batches by a background thread, so this returns
+        without waiting for the Sheets API and API errors are not raised
+        here. They are logged, and flush() (or close()) re-raises the first
+        one, so call it to make sure queued jobs were written.
+
         Args:
             job: JobListing to add
         """
-        try:
-            if not self.service:
-                logger.warning("Google Sheets service not initialized, skipping job logging")
-                return
+        if not self.service:
+            logger.warning("Google Sheets service not initialized, skipping job logging")
+            return
 
-            # Check for duplicates BEFORE adding
-            if self.check_duplicate(job.job_id):
-                logger.debug(f"Skipping duplicate job: {job.title} at {job.company} (ID: {job.job_id})")
-                return  # Skip silently
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._flush_loop, name="sheets-writer", daemon=True)
+            self._writer.start()
+        self._job_queue.put(job)
 
-            # Convert job to Google Sheets row
-            row = GoogleSheetRow.from_job_listing(job)
+    def _flush_loop(self):
+        """Write queued jobs with add_jobs_batch until close() sends None."""
+        running = True
+        while running:
+            job = self._job_queue.get()
+            if job is None:
+                self._job_queue.task_done()
+                break
 
-            # Append to spreadsheet
-            body = {
-                'values': [row.to_list()]
-            }
+            batch = [job]
+            deadline = time.monotonic() + JOB_QUEUE_WAIT_SECONDS
+            while len(batch) < JOB_QUEUE_BATCH_SIZE:
+                try:
+                    job = self._job_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._job_queue.task_done()
+                    running = False
+                    break
+                batch.append(job)
 
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range='A:P',
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
+            try:
+                self.add_jobs_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to add {len(batch)} queued jobs to spreadsheet: {e}")
+                if self._writer_error is None:
+                    self._writer_error = e
+            finally:
+                for _ in batch:
+                    self._job_queue.task_done()
 
-            logger.info(f"Added job '{job.title}' at '{job.company}' to spreadsheet")
+    def close(self):
+        """
+        Write any queued jobs and requests, then stop the background writer.
 
-        except HttpError as e:
-            logger.error(f"Failed to add job to spreadsheet: {e}")
-            raise
+        Raises the first error the writer hit, like flush().
+        """
+        if self._writer is not None:
+            self._job_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self.flush()
     
     def add_jobs_batch(self, jobs: List[JobListing]):
         """
@@ -277,46 +601,251 @@ class GoogleSheetsService:
                 logger.warning("No jobs to add")
                 return
 
-            # Get all existing job IDs in one API call (efficient)
-            existing_ids = self._get_existing_job_ids()
+            self._append_new_jobs(jobs)
 
-            # Filter out duplicates
-            new_jobs = []
-            duplicate_count = 0
+        except HttpError as e:
+            logger.error(f"Failed to add jobs batch to spreadsheet: {e}")
+            raise
 
-            for job in jobs:
-                if job.job_id in existing_ids:
-                    logger.debug(f"Skipping duplicate job: {job.title} at {job.company} (ID: {job.job_id})")
-                    duplicate_count += 1
-                else:
-                    new_jobs.append(job)
+    async def add_jobs_batch_async(self, jobs: List[JobListing]):
+        """
+        Async variant of add_jobs_batch for use inside an event loop.
 
-            if not new_jobs:
-                logger.info(f"All {len(jobs)} jobs are duplicates, nothing to add")
-                return
+        The existing-ID fetch runs in a worker thread while rows are built,
+        and the append runs in a worker thread too, so the loop stays free.
+        Each service instance owns its own connection, so callers writing to
+        several spreadsheets can asyncio.gather one call per instance.
 
-            # Convert all new jobs to rows
-            rows = [GoogleSheetRow.from_job_listing(job).to_list() for job in new_jobs]
+        Args:
+            jobs: List of JobListings to add
+        """
+        try:
+            if not self.service:
+                logger.warning("Google Sheets service not initialized, skipping batch logging")
+                return
 
-            # Batch append to spreadsheet
-            body = {
-                'values': rows
-            }
+            if not jobs:
+                logger.warning("No jobs to add")
+                return
 
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range='A:P',
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
+            ids_task = asyncio.ensure_future(asyncio.to_thread(self._ensure_ids_loaded))
+            rows = {id(job): GoogleSheetRow.values_from_job_listing(job) for job in jobs}
+            await ids_task
 
-            logger.info(f"Added {len(new_jobs)} new jobs to spreadsheet ({duplicate_count} duplicates skipped)")
+            await asyncio.to_thread(self._append_new_jobs, jobs, rows)
 
         except HttpError as e:
             logger.error(f"Failed to add jobs batch to spreadsheet: {e}")
             raise
+
+    def _append_new_jobs(self, jobs: List[JobListing], rows: Optional[Dict[int, List[Any]]] = None):
+        """
+        Append the jobs not already in the spreadsheet.
+
+        The duplicate check and the append happen under _write_lock, so two
+        batches carrying the same job cannot both pass the check.
+
+        Args:
+            jobs: Jobs to add
+            rows: Prepared rows keyed by id(job); built here when not given
+        """
+        with self._write_lock:
+            # Existing job IDs, fetched once per service instance
+            new_jobs = self._filter_new_jobs(jobs, self._ensure_ids_loaded())
+            if not new_jobs:
+                return
+
+            # Convert all new jobs to rows
+            if rows is None:
+                new_rows = list(map(GoogleSheetRow.values_from_job_listing, new_jobs))
+            else:
+                new_rows = [rows[id(job)] for job in new_jobs]
+            self._append_rows(new_jobs, new_rows)
+
+    def _filter_new_jobs(self, jobs: List[JobListing], existing_ids) -> List[JobListing]:
+        """Drop jobs already in the spreadsheet and repeats within jobs."""
+        # First job per ID, so repeats within this batch are skipped too
+        unique = {}
+        for job in jobs:
+            unique.setdefault(job.job_id, job)
+        new_jobs = [job for job_id, job in unique.items() if job_id not in existing_ids]
+        duplicate_count = len(jobs) - len(new_jobs)
+
+        if duplicate_count and logger.isEnabledFor(logging.DEBUG):
+            kept = {id(job) for job in new_jobs}
+            for job in jobs:
+                if id(job) not in kept:
+                    logger.debug(f"Skipping duplicate job: {job.title} at {job.company} (ID: {job.job_id})")
+
+        if not new_jobs:
+            logger.info(f"All {len(jobs)} jobs are duplicates, nothing to add")
+        elif duplicate_count:
+            logger.info(f"Skipping {duplicate_count} duplicate jobs")
+        return new_jobs
+
+    def _append_rows(self, new_jobs: List[JobListing], rows: List[List[Any]]):
+        """Append prepared rows for new_jobs and record their IDs."""
+        with self._write_lock:
+            if len(rows) >= COLUMN_MAJOR_MIN_ROWS:
+                # Send anything queued first so rows land in order
+                self._flush_pending()
+                for start in range(0, len(rows), APPEND_CHUNK_ROWS):
+                    chunk = rows[start:start + APPEND_CHUNK_ROWS]
+                    body = {
+                        'majorDimension': 'COLUMNS',
+                        'values': [list(column) for column in zip(*chunk)]
+                    }
+
+                    self._rest_call(
+                        'POST',
+                        f'spreadsheets/{self.spreadsheet_id}/values/A:P:append',
+                        body=body,
+                        params={'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'}
+                    )
+            else:
+                # Queue one appendCells per chunk of rows and send them, along with
+                # anything else pending, in a single batchUpdate
+                for start in range(0, len(rows), APPEND_CHUNK_ROWS):
+                    chunk = rows[start:start + APPEND_CHUNK_ROWS]
+                    self._queue_request({
+                        'appendCells': {
+                            'sheetId': 0,
+                            'rows': [{'values': [_cell(value) for value in row]} for row in chunk],
+                            'fields': 'userEnteredValue'
+                        }
+                    }, rows=len(chunk))
+                self._flush_pending()
+            self._known_ids.update(job.job_id for job in new_jobs)
+            self._record_ids(job.job_id for job in new_jobs)
+
+            logger.info(f"Added {len(new_jobs)} new jobs to spreadsheet")
     
+    def _queue_request(self, request: Dict[str, Any], rows: int = 0):
+        """
+        Queue a batchUpdate request, flushing once enough rows are waiting.
+
+        Args:
+            request: A single spreadsheets.batchUpdate request
+            rows: Number of rows the request appends
+        """
+        with self._write_lock:
+            self._pending_requests.append(request)
+            self._pending_rows += rows
+            if self._pending_rows >= PENDING_FLUSH_ROWS:
+                self._flush_pending()
+
+    def flush(self):
+        """
+        Write jobs queued by add_job, then everything _flush_pending() sends.
+
+        Raises the first error the background writer hit since the last
+        flush, so add_job callers can see failed writes.
+        """
+        if self._writer is not None:
+            self._job_queue.join()
+
+        with self._write_lock:
+            self._flush_pending()
+
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+
+    def _flush_pending(self):
+        """
+        Send every queued request in one spreadsheets.batchUpdate call, then queued status changes.
+
+        Callers hold _write_lock.
+        """
+        if self._pending_requests and self.service:
+            requests, self._pending_requests = self._pending_requests, []
+            rows, self._pending_rows = self._pending_rows, 0
+            try:
+                self._rest_call(
+                    'POST',
+                    f'spreadsheets/{self.spreadsheet_id}:batchUpdate',
+                    body={'requests': requests}
+                )
+                logger.debug(f"Flushed {len(requests)} queued requests to spreadsheet")
+            except Exception as e:
+                # Put the requests back in front of anything queued since, so
+                # the next flush retries them instead of dropping them
+                self._pending_requests = requests + self._pending_requests
+                self._pending_rows += rows
+                logger.error(f"Failed to flush queued requests to spreadsheet: {e}")
+                raise
+
+        self.flush_status_updates()
+
+    def _rest_call(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call the Sheets REST API over the shared HTTP/2 client.
+
+        Authenticates on first use. Large JSON bodies are gzip-compressed.
+        Errors are raised as googleapiclient's HttpError, so existing error
+        handling applies unchanged.
+
+        Args:
+            method: HTTP method
+            path: Path relative to SHEETS_API_URL
+            body: JSON request body
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+        """
+        http = self.service
+        if http is None or self.credentials is None:
+            raise RuntimeError("Google Sheets service not initialized")
+        if not self.credentials.valid:
+            self.credentials.refresh(Request())
+
+        headers = {'Authorization': f'Bearer {self.credentials.token}'}
+        content = None
+        if body is not None:
+            content = orjson.dumps(body)
+            headers['Content-Type'] = 'application/json'
+            if len(content) >= GZIP_MIN_BYTES:
+                content = gzip.compress(content)
+                headers['Content-Encoding'] = 'gzip'
+
+        def send() -> httpx.Response:
+            response = http.request(method, path, params=params, content=content, headers=headers)
+            if response.is_error:
+                raise HttpError(
+                    httplib2.Response({'status': response.status_code}),
+                    response.content,
+                    uri=str(response.url)
+                )
+            return response
+
+        response = self._rpc(send, write=method != 'GET')
+        return response.json() if response.content else {}
+
+    @retry_over_quota
+    def _rpc(self, call: Callable[[], Any], write: bool = False) -> Any:
+        """
+        Run one Sheets API request within the read or write quota.
+
+        Takes a token from the matching bucket first; requests rejected with
+        429 anyway are retried with jittered exponential backoff.
+
+        Args:
+            call: Executes the request, e.g. a googleapiclient request's execute
+            write: Whether the request counts against the write quota
+
+        Returns:
+            Whatever call returns
+        """
+        (self._write_bucket if write else self._read_bucket).acquire()
+        return call()
+
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Retrieve all jobs from the spreadsheet.
@@ -329,10 +858,7 @@ class GoogleSheetsService:
                 logger.warning("Google Sheets service not initialized")
                 return []
             
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='A:Q'
-            ).execute()
+            result = self._rest_call('GET', f'spreadsheets/{self.spreadsheet_id}/values/A:Q')
             
             values = result.get('values', [])
             
@@ -359,36 +885,59 @@ class GoogleSheetsService:
             logger.error(f"Failed to retrieve jobs from spreadsheet: {e}")
             return []
     
-    def update_job_status(self, row_number: int, status: str):
+    def update_job_status(self, row_number: int, status: str, batch: bool = False):
         """
         Update the status of a job in the spreadsheet.
-        
+
+        The change is written immediately, along with any queued changes.
+        With batch=True it is queued instead and written with other status
+        changes by flush_status_updates(), which runs automatically once
+        STATUS_FLUSH_SIZE changes are waiting and whenever flush() runs
+        (e.g. after a batch of jobs); queued changes are lost if the process
+        dies first.
+
         Args:
             row_number: Row number to update (1-indexed, excluding header)
             status: New status value
+            batch: Queue the change instead of writing it now
         """
+        if not self.service:
+            logger.warning("Google Sheets service not initialized")
+            return
+
+        with self._write_lock:
+            # A later change to the same row replaces the queued one
+            self._status_queue[row_number] = status
+            if not batch or len(self._status_queue) >= STATUS_FLUSH_SIZE:
+                self.flush_status_updates()
+
+    def flush_status_updates(self):
+        """Write every queued status change in one values.batchUpdate call."""
+        if not self._status_queue or not self.service:
+            return
+
+        with self._write_lock:
+            queued, self._status_queue = self._status_queue, {}
+        if not queued:
+            return
         try:
-            if not self.service:
-                logger.warning("Google Sheets service not initialized")
-                return
-            
-            # Status is in column P (16th column)
-            range_name = f'P{row_number + 1}'  # +1 for header
-            
+            # Status is in column P (16th column); +1 for header
             body = {
-                'values': [[status]]
+                'valueInputOption': 'RAW',
+                'data': [
+                    {'range': f'P{row_number + 1}', 'values': [[status]]}
+                    for row_number, status in queued.items()
+                ]
             }
-            
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
-            ).execute()
-            
-            logger.info(f"Updated job status in row {row_number} to '{status}'")
-            
-        except HttpError as e:
+
+            self._rest_call('POST', f'spreadsheets/{self.spreadsheet_id}/values:batchUpdate', body=body)
+
+            logger.info(f"Updated job status in {len(queued)} rows")
+
+        except Exception as e:
+            # Requeue for the next flush; changes queued since the swap are newer and win
+            with self._write_lock:
+                self._status_queue = {**queued, **self._status_queue}
             logger.error(f"Failed to update job status: {e}")
             raise
     
@@ -402,58 +951,156 @@ class GoogleSheetsService:
         Returns:
             True if duplicate exists, False otherwise
         """
-        try:
-            if not self.service:
-                return False
-
-            # Get all job IDs from column A
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='A:A'  # Changed from 'O:O' to 'A:A' (Job ID column)
-            ).execute()
+        if not self.service:
+            return False
 
-            values = result.get('values', [])
+        return job_id in self._ensure_ids_loaded()
 
-            # Check if job_id exists (skip header row)
-            for row in values[1:]:  # Skip header
-                if row and row[0] == job_id:  # Exact match instead of 'in'
-                    return True
+    def _ensure_ids_loaded(self):
+        """
+        Return the cached index of job IDs in the spreadsheet, loading it when stale.
 
-            return False
+        The index is kept current as jobs are appended through this service and
+        re-read every ID_CACHE_TTL_SECONDS; call refresh_ids() to re-read sooner.
+        """
+        now = time.monotonic()
+        if self._known_ids is None or now - self._ids_loaded_at > ID_CACHE_TTL_SECONDS:
+            if Bloom is not None and self._seen_db is not None and self.service:
+                # Large sheets: keep a Bloom filter instead of every ID in memory
+                self._reconcile_seen_db()
+                self._known_ids = _BloomIndex(self._seen_db, self.spreadsheet_id, self._db_lock)
+            else:
+                self._known_ids = _DupIndex(self._get_existing_job_ids())
+            self._ids_loaded_at = now
+        return self._known_ids
 
-        except HttpError as e:
-            logger.error(f"Failed to check for duplicates: {e}")
-            return False  # On error, don't skip (safer default)
+    def refresh_ids(self):
+        """Drop the cached job IDs so the next duplicate check re-reads the sheet."""
+        self._known_ids = None
 
     def _get_existing_job_ids(self) -> set:
         """
-        Get all existing job IDs from the spreadsheet.
+        Get all existing job IDs.
         Used for efficient batch duplicate checking.
 
+        IDs come from the local index, which records every job this service
+        appends and picks up rows added to the spreadsheet since it was last
+        read (see _reconcile_seen_db). Without the index, the column is read
+        directly.
+
         Returns:
             Set of job IDs currently in the spreadsheet
         """
-        try:
-            if not self.service:
-                return set()
+        if not self.service:
+            return set()
 
-            # Get all job IDs from column A
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='A:A'
-            ).execute()
+        if self._seen_db is None:
+            return self._fetch_sheet_job_ids()[0]
 
-            values = result.get('values', [])
+        self._reconcile_seen_db()
+        with self._db_lock:
+            return {
+                row[0] for row in self._seen_db.execute(
+                    'SELECT job_id FROM seen_ids WHERE spreadsheet_id = ?', (self.spreadsheet_id,)
+                )
+            }
+
+    def _reconcile_seen_db(self):
+        """
+        Merge the spreadsheet's job IDs into the local index.
+
+        The whole Job ID column is read when the index is empty or older than
+        ID_RECONCILE_SECONDS; otherwise only rows after the last row read,
+        which is checkpointed per spreadsheet, so restarts skip the history.
+        """
+        reconciled_key = f"reconciled_at:{self.spreadsheet_id}"
+        last_row_key = f"last_row:{self.spreadsheet_id}"
+        with self._db_lock:
+            meta = dict(self._seen_db.execute(
+                'SELECT key, value FROM meta WHERE key IN (?, ?)', (reconciled_key, last_row_key)
+            ))
+        full = reconciled_key not in meta or time.time() - meta[reconciled_key] > ID_RECONCILE_SECONDS
+        first_row = 2 if full else int(meta.get(last_row_key, 1)) + 1
+
+        sheet_ids, last_row = self._fetch_sheet_job_ids(first_row)
+        if last_row is None:
+            return
+
+        self._record_ids(sheet_ids)
+        with self._db_lock, self._seen_db:
+            if full and sheet_ids:
+                self._seen_db.execute(
+                    'INSERT OR REPLACE INTO meta VALUES (?, ?)', (reconciled_key, time.time())
+                )
+            self._seen_db.execute(
+                'INSERT OR REPLACE INTO meta VALUES (?, ?)', (last_row_key, last_row)
+            )
+
+    def _fetch_sheet_job_ids(self, first_row: int = 2) -> Tuple[set, Optional[int]]:
+        """
+        Read job IDs from the spreadsheet's Job ID column.
+
+        Args:
+            first_row: First row to read (row 1 holds the headers)
+
+        Returns:
+            The job IDs and the number of the last row read, or None for the
+            row when the read failed
+        """
+        try:
+            # Get the job IDs from column A as one flat list rather than a
+            # one-element list per row
+            result = self._rest_call(
+                'GET',
+                f'spreadsheets/{self.spreadsheet_id}/values/A{first_row}:A',
+                params={
+                    'majorDimension': 'COLUMNS',
+                    'valueRenderOption': 'UNFORMATTED_VALUE',
+                    'fields': 'values'
+                }
+            )
 
-            # Extract IDs (skip header row, handle empty cells)
-            job_ids = {row[0] for row in values[1:] if row and row[0]}
+            column = result.get('values', [[]])[0]
 
-            logger.debug(f"Found {len(job_ids)} existing job IDs in spreadsheet")
-            return job_ids
+            # Extract IDs (handle empty cells); unformatted values may come
+            # back as numbers when an ID was typed in by hand
+            job_ids = {str(value) for value in column if value != ''}
+
+            logger.debug(f"Found {len(job_ids)} existing job IDs in spreadsheet from row {first_row}")
+            return job_ids, first_row + len(column) - 1
 
         except HttpError as e:
             logger.error(f"Failed to fetch existing job IDs: {e}")
-            return set()  # Return empty set on error (don't skip jobs)
+            return set(), None  # Return empty set on error (don't skip jobs)
+
+    def _open_seen_db(self) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the local index of logged job IDs."""
+        try:
+            db_path = settings.dup_db_path
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+            # Used from worker threads too (the add_job writer, add_jobs_batch_async),
+            # always under _db_lock
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS seen_ids '
+                    '(spreadsheet_id TEXT, job_id TEXT, PRIMARY KEY (spreadsheet_id, job_id))'
+                )
+                conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)')
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open job ID index at {settings.dup_db_path}, reading IDs from the sheet: {e}")
+            return None
+
+    def _record_ids(self, job_ids):
+        """Add job IDs to the local index for this spreadsheet."""
+        if self._seen_db is None:
+            return
+        with self._db_lock, self._seen_db:
+            self._seen_db.executemany(
+                'INSERT OR IGNORE INTO seen_ids VALUES (?, ?)',
+                ((self.spreadsheet_id, job_id) for job_id in job_ids)
+            )
 
     def get_spreadsheet_url(self) -> str:
         """
@@ -467,58 +1114,20 @@ class GoogleSheetsService:
         return ""
     
     def add_conditional_formatting(self):
-        """Add conditional formatting to highlight high-match jobs."""
+        """
+        Add conditional formatting to highlight high-match jobs.
+
+        The rule is queued and sent with the next batch of jobs (or flush()).
+        """
         try:
             if not self.service:
                 return
             
-            requests = [{
-                'addConditionalFormatRule': {
-                    'rule': {
-                        'ranges': [{
-                            'sheetId': 0,
-                            'startColumnIndex': 10,  # Resume Match % column
-                            'endColumnIndex': 11
-                        }],
-                        'gradientRule': {
-                            'minpoint': {
-                                'color': {
-                                    'red': 1.0,
-                                    'green': 0.4,
-                                    'blue': 0.4
-                                },
-                                'type': 'MIN'
-                            },
-                            'midpoint': {
-                                'color': {
-                                    'red': 1.0,
-                                    'green': 1.0,
-                                    'blue': 0.4
-                                },
-                                'type': 'PERCENTILE',
-                                'value': '50'
-                            },
-                            'maxpoint': {
-                                'color': {
-                                    'red': 0.4,
-                                    'green': 1.0,
-                                    'blue': 0.4
-                                },
-                                'type': 'MAX'
-                            }
-                        }
-                    }
-                }
-            }]
-            
-            body = {'requests': requests}
-            
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.spreadsheet_id,
-                body=body
-            ).execute()
+            with self._write_lock:
+                for request in CONDITIONAL_FORMAT_REQUESTS:
+                    self._queue_request(request)
             
-            logger.info("Added conditional formatting to spreadsheet")
+            logger.info("Queued conditional formatting for spreadsheet")
             
         except HttpError as e:
             logger.error(f"Failed to add conditional formatting: {e}")
@@ -544,6 +1153,7 @@ def test_google_sheets():
         
         # Add job to sheet
         sheets_service.add_job(test_job)
+        sheets_service.close()
         
         print(f"Test successful! View spreadsheet at: {sheets_service.get_spreadsheet_url()}")
         
@@ -0,0 +1,46 @@
+"""Helpers for pulling JSON out of free-form model output."""
+
+from typing import Optional
+
+
+def find_json(text: str, opening: str = "{[") -> Optional[str]:
+    """
+    Find the first balanced JSON object or array in text.
+    
+    A single linear scan tracking bracket depth and string escapes, so
+    braces inside strings are ignored and long agent transcripts or LLM replies cannot
+    trigger regex backtracking.
+    
+    Args:
+        text: Text that may contain JSON
+        opening: Characters allowed to start the JSON value
+        
+    Returns:
+        The JSON substring, or None if there is no balanced value
+    """
+    start = None
+    depth = 0
+    in_string = False
+    escape = False
+    for i, char in enumerate(text):
+        if start is None:
+            if char in opening:
+                start = i
+                depth = 1
+            continue
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
@@ -1,23 +1,369 @@
 """Resume matching service using AI for job fit analysis."""
 
+import asyncio
+import hashlib
 import logging
 import re
+import weakref
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-import json
 
-from openai import OpenAI
-from groq import Groq
-import PyPDF2
+import groq
+import openai
+from openai import AsyncOpenAI
+from groq import AsyncGroq
+import fitz
+import numpy as np
+import orjson
+from diskcache import Cache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from config import settings
 from models.job_model import JobListing, JobAnalysis
+from services.json_utils import find_json
+
+try:
+    import PyPDF2
+except ImportError:  # PyPDF2 is optional; only used when PyMuPDF cannot read a file
+    PyPDF2 = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; _KeywordScanner falls back to regex and substring checks
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; _KeywordScanner falls back to pyahocorasick or regex
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# Rate limits and server errors worth retrying, from either provider
+RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    groq.RateLimitError,
+    groq.InternalServerError,
+)
+
+# Jittered exponential backoff for LLM calls rejected with 429/5xx
+retry_llm = retry(
+    retry=retry_if_exception_type(RETRYABLE_LLM_ERRORS),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+# Tech keywords picked out of job text by extract_keywords_from_job, by category
+TECH_KEYWORDS = {
+    "language": ("python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust", "swift", "kotlin"),
+    "framework": ("react", "angular", "vue", "node", "django", "flask", "spring", "rails", "laravel"),
+    "cloud": ("aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "ci/cd", "devops"),
+    "database": ("sql", "nosql", "mongodb", "postgresql", "mysql", "redis", "elasticsearch"),
+    "ml": ("machine learning", "ai", "data science", "deep learning", "nlp", "computer vision"),
+    "process": ("agile", "scrum", "kanban", "jira", "git", "github", "gitlab"),
+}
+
+# Resume characters included in each analysis prompt
+RESUME_PROMPT_CHARS = 3000
+
+# Job description characters included in each analysis prompt
+JOB_DESCRIPTION_PROMPT_CHARS = 2000
+
+# Fields of the analysis JSON the LLM returns, by type
+ANALYSIS_LIST_FIELDS = (
+    "technical_skills", "soft_skills", "tools_technologies", "certifications",
+    "missing_skills", "matching_skills", "recommendations", "interview_tips",
+)
+ANALYSIS_SCORE_FIELDS = ("overall_match_score", "skills_match_score", "experience_match_score")
+ANALYSIS_TEXT_FIELDS = ("ai_summary", "ai_fit_assessment")
+
+# Values used for fields missing from an LLM analysis
+ANALYSIS_DEFAULTS = {
+    **dict.fromkeys(ANALYSIS_LIST_FIELDS, ()),
+    **dict.fromkeys(ANALYSIS_SCORE_FIELDS, 0.0),
+    **dict.fromkeys(ANALYSIS_TEXT_FIELDS, ""),
+}
+
+# Structured output schema for OpenAI analyses
+ANALYSIS_JSON_SCHEMA = {
+    "name": "job_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            **{field: {"type": "array", "items": {"type": "string"}} for field in ANALYSIS_LIST_FIELDS},
+            **{field: {"type": "number"} for field in ANALYSIS_SCORE_FIELDS},
+            **{field: {"type": "string"} for field in ANALYSIS_TEXT_FIELDS},
+        },
+        "required": [*ANALYSIS_LIST_FIELDS, *ANALYSIS_SCORE_FIELDS, *ANALYSIS_TEXT_FIELDS],
+        "additionalProperties": False,
+    },
+}
+
+# System prompt shared by every analysis; the schema carries the structure
+ANALYSIS_INSTRUCTIONS = (
+    "You are an expert career advisor and resume analyst. Assess how well the candidate fits the job. "
+    "Scores are 0-100. matching_skills/missing_skills are relative to the candidate. "
+    "recommendations and interview_tips: 3-5 items each. ai_summary (the job) and "
+    "ai_fit_assessment (the fit): about 100 words each. Be specific and accurate in your scoring."
+)
+
+# Groq has no strict schema mode, so the JSON keys are spelled out instead
+GROQ_ANALYSIS_INSTRUCTIONS = (
+    f"{ANALYSIS_INSTRUCTIONS} Return only a JSON object with keys: "
+    f"{', '.join(ANALYSIS_LIST_FIELDS)} (string lists); {', '.join(ANALYSIS_SCORE_FIELDS)} (numbers); "
+    f"{', '.join(ANALYSIS_TEXT_FIELDS)} (strings)."
+)
+
+# Keywords the basic (no-LLM) analysis looks for
+BASIC_TECH_KEYWORDS = ('python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker', 'kubernetes')
+BASIC_SOFT_KEYWORDS = ('communication', 'leadership', 'teamwork', 'problem-solving')
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character can be part of a word, as regex \\w treats it."""
+    return char.isalnum() or char == "_"
+
+
+def _utf8_char_before(data: bytes, index: int) -> str:
+    """The character whose UTF-8 encoding ends at data[index]."""
+    start = index - 1
+    while start > 0 and 0x80 <= data[start] < 0xC0:
+        start -= 1
+    return data[start:index].decode("utf-8", "replace")
+
+
+def _utf8_char_at(data: bytes, index: int) -> str:
+    """The character whose UTF-8 encoding starts at data[index]."""
+    end = index + 1
+    while end < len(data) and 0x80 <= data[end] < 0xC0:
+        end += 1
+    return data[index:end].decode("utf-8", "replace")
+
+
+def _is_whole_word(text, start: int, end: int) -> bool:
+    """
+    Whether text[start:end] is not part of a longer word.
+
+    text may be a str or its UTF-8 bytes; for bytes the neighbouring
+    characters are decoded, so NBSP, bullets and dashes count as
+    boundaries the same way they do in str.
+    """
+    if isinstance(text, bytes):
+        before = _utf8_char_before(text, start) if start else ""
+        after = _utf8_char_at(text, end) if end < len(text) else ""
+    else:
+        before = text[start - 1] if start else ""
+        after = text[end] if end < len(text) else ""
+    return not _is_word_char(before) and not _is_word_char(after)
+
+
+class _KeywordScanner:
+    """
+    Finds a fixed set of keywords in lowercased text in one pass.
+
+    Uses a Hyperscan database when hyperscan is installed, else a
+    pyahocorasick automaton, else plain regex/substring checks. Each keyword
+    maps to a value, and scan() returns the values of the keywords found.
+    """
+
+    def __init__(self, words: Dict[str, Any], whole_words: bool = False):
+        """
+        Args:
+            words: Lowercase keyword to the value reported when it is found
+            whole_words: Only count hits that are not part of a longer word
+        """
+        self._words = words
+        self._keywords = list(words)
+        self._whole_words = whole_words
+
+        if hyperscan is not None:
+            self._keyword_bytes = [keyword.encode("utf-8") for keyword in self._keywords]
+            self._database = hyperscan.Database()
+            self._database.compile(
+                expressions=[re.escape(keyword).encode("utf-8") for keyword in self._keywords],
+                ids=list(range(len(self._keywords))),
+                elements=len(self._keywords)
+            )
+        elif ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self._keywords):
+                self._automaton.add_word(keyword, index)
+            self._automaton.make_automaton()
+        elif whole_words:
+            longest_first = sorted(self._keywords, key=len, reverse=True)
+            self._pattern = re.compile(rf"(?<!\w)(?:{'|'.join(map(re.escape, longest_first))})(?!\w)")
+
+    def scan(self, text_lower: str) -> set:
+        """Values of the keywords occurring in lowercased text."""
+        if hyperscan is not None:
+            data = text_lower.encode("utf-8")
+            found = set()
+
+            def on_match(index, start, end, flags, context):
+                if not self._whole_words or _is_whole_word(data, end - len(self._keyword_bytes[index]), end):
+                    found.add(index)
+
+            self._database.scan(data, match_event_handler=on_match)
+        elif ahocorasick is not None:
+            found = {
+                index for end, index in self._automaton.iter(text_lower)
+                if not self._whole_words
+                or _is_whole_word(text_lower, end + 1 - len(self._keywords[index]), end + 1)
+            }
+        elif self._whole_words:
+            return {self._words[match.group(0)] for match in self._pattern.finditer(text_lower)}
+        else:
+            return {value for keyword, value in self._words.items() if keyword in text_lower}
+
+        return {self._words[self._keywords[index]] for index in found}
+
+
+_BASIC_SCANNER = _KeywordScanner({keyword: keyword for keyword in BASIC_TECH_KEYWORDS + BASIC_SOFT_KEYWORDS})
+_TECH_SCANNER = _KeywordScanner(
+    {keyword: (category, keyword) for category, keywords in TECH_KEYWORDS.items() for keyword in keywords},
+    whole_words=True
+)
+
+
+def _basic_keyword_hits(text_lower: str) -> set:
+    """Basic-analysis keywords occurring anywhere in lowercased text."""
+    return _BASIC_SCANNER.scan(text_lower)
+
+
+def _tech_keyword_hits(text_lower: str) -> Dict[str, set]:
+    """Tech keywords occurring as whole words in lowercased text, by category."""
+    hits = defaultdict(set)
+    for category, keyword in _TECH_SCANNER.scan(text_lower):
+        hits[category].add(keyword)
+    return hits
+
+
+# Inputs and total tokens the embeddings endpoint accepts in a single request
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_BATCH_TOKENS = 300_000
+# Conservative characters-per-token ratio for sizing requests without a tokenizer
+EMBEDDING_CHARS_PER_TOKEN = 3
+
+
+def _embedding_chunks(texts: List[str], indexes: List[int]) -> List[List[int]]:
+    """
+    Split indexes into texts into embedding requests.
+
+    Each chunk stays within EMBEDDING_BATCH_SIZE inputs and an estimated
+    EMBEDDING_BATCH_TOKENS tokens.
+    """
+    chunks, chunk, tokens = [], [], 0
+    for index in indexes:
+        text_tokens = len(texts[index]) // EMBEDDING_CHARS_PER_TOKEN + 1
+        if chunk and (len(chunk) >= EMBEDDING_BATCH_SIZE or tokens + text_tokens > EMBEDDING_BATCH_TOKENS):
+            chunks.append(chunk)
+            chunk, tokens = [], 0
+        chunk.append(index)
+        tokens += text_tokens
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+# Seconds between Batch API status checks, doubling up to the maximum
+BATCH_POLL_MIN_SECONDS = 10
+BATCH_POLL_MAX_SECONDS = 300
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Marks the keyword-only analysis used when the LLM fails; never cached
+BASIC_ANALYSIS_ASSESSMENT = "Basic analysis only"
+
+
+def _loads_llm_json(content: str) -> Dict[str, Any]:
+    """
+    Parse a JSON object from an LLM reply.
+
+    JSON mode replies parse directly; otherwise (e.g. a reply with preamble
+    or a code fence) the first balanced object is found in one linear scan.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        candidate = find_json(content, opening="{")
+        if candidate is None:
+            raise ValueError("No JSON found in response")
+        return orjson.loads(candidate)
+
+
+@lru_cache(maxsize=4096)
+def _job_block(
+    title: str,
+    company: str,
+    location: str,
+    job_type: Any,
+    experience_level: Any,
+    description: str,
+    requirements: Tuple[str, ...],
+    qualifications: Tuple[str, ...],
+    responsibilities: Tuple[str, ...]
+) -> str:
+    """
+    Format the job half of an analysis prompt.
+
+    Cached on the job's content, so retries and repeat analyses of a job
+    reuse the string instead of re-joining its lists.
+    """
+    # Drop repeated lines, including qualifications that restate a requirement
+    requirements = dict.fromkeys(requirements)
+    qualifications = [q for q in dict.fromkeys(qualifications) if q not in requirements]
+    return (
+        f"Job: {title} | {company} | {location}\n"
+        f"Type: {job_type or 'Not specified'} | Level: {experience_level or 'Not specified'}\n"
+        f"Description: {description[:JOB_DESCRIPTION_PROMPT_CHARS]}\n"
+        f"Requirements: {'; '.join(requirements)}\n"
+        f"Qualifications: {'; '.join(qualifications)}\n"
+        f"Responsibilities: {'; '.join(dict.fromkeys(responsibilities))}"
+    )
+
+
+# AI clients shared by every matcher, one set per event loop: their connection
+# pools are bound to the loop that first used them
+_ai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[type, str], Any]]" = weakref.WeakKeyDictionary()
+
+
+def _shared_client(client_class: type, api_key: Optional[str]):
+    """client_class for api_key on the running event loop, created on first use."""
+    clients = _ai_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (client_class, api_key)
+    if key not in clients:
+        clients[key] = client_class(api_key=api_key)
+    return clients[key]
+
+
+async def close_ai_clients():
+    """Close the running loop's shared AI clients; call before the loop exits."""
+    for client in _ai_clients.pop(asyncio.get_running_loop(), {}).values():
+        await client.close()
+
+
+@retry_llm
+async def _create_completion(client, **kwargs):
+    """Create a chat completion, retrying rate-limited and failed requests."""
+    return await client.chat.completions.create(**kwargs)
+
+
+@retry_llm
+async def _create_embeddings(client, **kwargs):
+    """Create embeddings, retrying rate-limited and failed requests."""
+    return await client.embeddings.create(**kwargs)
+
 
 class ResumeProfile:
     """User resume profile for matching."""
+
+    _lowered_text: Optional[str] = None
+    _resume_text_lower = ""
     
     def __init__(self, 
                  resume_text: Optional[str] = None,
@@ -44,19 +390,26 @@ class ResumeProfile:
         
         if not self.skills and settings.skills_list:
             self.skills = settings.skills_list
+
+        # Prompt-ready forms, computed once rather than per analyzed job
+        self.resume_text_truncated = self.resume_text[:RESUME_PROMPT_CHARS]
+        self.skills_joined = ", ".join(self.skills)
     
+    @property
+    def resume_text_lower(self) -> str:
+        """Lowercased resume text, recomputed only when resume_text changes."""
+        if self._lowered_text is not self.resume_text:
+            self._resume_text_lower = self.resume_text.lower()
+            self._lowered_text = self.resume_text
+        return self._resume_text_lower
+
     def _load_resume_file(self, file_path: str):
         """Load resume from file."""
         try:
             path = Path(file_path)
             
             if path.suffix.lower() == '.pdf':
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
-                    self.resume_text = text
+                self.resume_text = self._read_pdf_text(path)
                     
             elif path.suffix.lower() in ['.txt', '.md']:
                 with open(file_path, 'r', encoding='utf-8') as file:
@@ -67,6 +420,26 @@ class ResumeProfile:
         except Exception as e:
             logger.error(f"Failed to load resume file: {e}")
 
+    @staticmethod
+    def _read_pdf_text(path: Path) -> str:
+        """Extract a PDF's text, cached by file contents so unchanged resumes skip parsing."""
+        data = path.read_bytes()
+        key = ("pdf_text", hashlib.sha256(data).hexdigest())
+        with Cache(settings.resume_cache_dir) as cache:
+            text = cache.get(key)
+            if text is None:
+                try:
+                    with fitz.open(stream=data, filetype="pdf") as doc:
+                        text = "\n".join(page.get_text("text") for page in doc)
+                except Exception as e:
+                    if PyPDF2 is None:
+                        raise
+                    logger.warning(f"PyMuPDF could not read {path}, falling back to PyPDF2: {e}")
+                    pdf_reader = PyPDF2.PdfReader(str(path))
+                    text = "\n".join(page.extract_text() or "" for page in pdf_reader.pages)
+                cache.set(key, text)
+        return text
+
 
 class ResumeMatcherService:
     """Service for matching resumes with job listings."""
@@ -80,12 +453,27 @@ class ResumeMatcherService:
         """
         self.resume_profile = resume_profile or ResumeProfile()
         
-        # Initialize AI clients
-        self.openai_client = OpenAI(api_key=settings.openai_api_key)
-        self.groq_client = None
-        
-        if settings.groq_api_key:
-            self.groq_client = Groq(api_key=settings.groq_api_key)
+        # Analyses keyed by job and a hash of everything sent to the model
+        self.analysis_cache = Cache(settings.analysis_cache_dir)
+        # Candidate half of every prompt, built on first use
+        self._candidate_block: Optional[str] = None
+        # Normalized resume embedding for the similarity prefilter, built on first use
+        self.resume_embedding: Optional[np.ndarray] = None
+    
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """
+        OpenAI client for the running event loop.
+
+        Matchers share it, so rebuilding the matcher (e.g. after a profile
+        update) keeps the warm connection pool.
+        """
+        return _shared_client(AsyncOpenAI, settings.openai_api_key)
+
+    @property
+    def groq_client(self) -> Optional[AsyncGroq]:
+        """Groq client for the running event loop, None without an API key."""
+        return _shared_client(AsyncGroq, settings.groq_api_key) if settings.groq_api_key else None
     
     async def analyze_job_fit(self, job: JobListing) -> JobAnalysis:
         """
@@ -99,207 +487,160 @@ class ResumeMatcherService:
         """
         try:
             # Prepare job context
-            job_context = self._prepare_job_context(job)
-            
+            job_context = self._build_job_block(job)
+            model = settings.groq_model if self.groq_client else settings.openai_model
+            cache_key = self._analysis_cache_key(job, job_context, model)
+
+            analysis = self._get_cached_analysis(cache_key)
+            if analysis is not None:
+                logger.debug(f"Using cached analysis for job {job.job_id}")
             # Use Groq for fast analysis if available, otherwise OpenAI
-            if self.groq_client:
+            elif self.groq_client:
                 logger.info("Using Groq for fast AI analysis")
-                analysis = await self._analyze_with_groq(job_context)
+                analysis, produced_by = await self._analyze_with_groq(job_context)
+                # An OpenAI fallback is stored under OpenAI's key, not served as Groq output
+                if produced_by != model:
+                    cache_key = self._analysis_cache_key(job, job_context, produced_by)
+                self._cache_analysis(cache_key, analysis)
             else:
                 logger.info("Using OpenAI for AI analysis")
                 analysis = await self._analyze_with_openai(job_context)
+                self._cache_analysis(cache_key, analysis)
             
-            # Update job with match score
-            job.resume_match_score = analysis.overall_match_score
-            job.keywords = analysis.technical_skills + analysis.soft_skills
-            job.skills = analysis.technical_skills
-            
+            self._apply_analysis(job, analysis)
             return analysis
             
         except Exception as e:
             logger.error(f"Failed to analyze job fit: {e}")
             raise
-    
-    def _prepare_job_context(self, job: JobListing) -> str:
-        """Prepare job context for AI analysis."""
-        context = f"""
-        JOB DETAILS:
-        Title: {job.title}
-        Company: {job.company}
-        Location: {job.location}
-        Type: {job.job_type or 'Not specified'}
-        Experience Level: {job.experience_level or 'Not specified'}
-        
-        Description:
-        {job.description}
-        
-        Requirements:
-        {', '.join(job.requirements)}
-        
-        Qualifications:
-        {', '.join(job.qualifications)}
-        
-        Responsibilities:
-        {', '.join(job.responsibilities)}
-        
-        CANDIDATE PROFILE:
-        Resume:
-        {self.resume_profile.resume_text[:3000]}  # Limit to 3000 chars
-        
-        Known Skills:
-        {', '.join(self.resume_profile.skills)}
+
+    def _analysis_cache_key(self, job: JobListing, job_context: str, model: str) -> str:
         """
-        return context
+        Key an analysis by job ID and a hash of the model and full prompt context.
+
+        The context holds the resume text, skills and job details, so editing
+        any of them (or switching models) misses the cache.
+        """
+        prompt = f"{model}\n{self._build_candidate_block()}\n{job_context}"
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        return f"{job.job_id}:{digest}"
+
+    def _get_cached_analysis(self, cache_key: str) -> Optional[JobAnalysis]:
+        """Return the stored analysis for cache_key, if any."""
+        cached = self.analysis_cache.get(cache_key)
+        return JobAnalysis.model_validate_json(cached) if cached is not None else None
+
+    def _cache_analysis(self, cache_key: str, analysis: JobAnalysis):
+        """Store an LLM analysis; keyword-only fallbacks are left uncached."""
+        if analysis.ai_fit_assessment != BASIC_ANALYSIS_ASSESSMENT:
+            self.analysis_cache.set(cache_key, analysis.model_dump_json())
+
+    @staticmethod
+    def _apply_analysis(job: JobListing, analysis: JobAnalysis):
+        """Update job with match score."""
+        job.resume_match_score = analysis.overall_match_score
+        job.keywords = analysis.technical_skills + analysis.soft_skills
+        job.skills = analysis.technical_skills
     
+    def _build_job_block(self, job: JobListing) -> str:
+        """Job half of the analysis context, sent as the user message."""
+        return _job_block(
+            job.title, job.company, job.location, job.job_type, job.experience_level, job.description,
+            tuple(job.requirements), tuple(job.qualifications), tuple(job.responsibilities)
+        )
+
+    def _build_candidate_block(self) -> str:
+        """Candidate half of the analysis context, the same for every job."""
+        if self._candidate_block is None:
+            self._candidate_block = (
+                f"Candidate resume: {self.resume_profile.resume_text_truncated}\n"
+                f"Candidate skills: {self.resume_profile.skills_joined}"
+            )
+        return self._candidate_block
+    
+    def _system_prompt(self, instructions: str) -> str:
+        """
+        Instructions followed by the candidate block.
+
+        Identical for every job, so the provider can serve this prefix from
+        its prompt cache and only the job message is new input per call.
+        """
+        return f"{instructions}\n\n{self._build_candidate_block()}"
+
     async def _analyze_with_openai(self, job_context: str) -> JobAnalysis:
         """Analyze job fit using OpenAI."""
         try:
-            prompt = f"""
-            Analyze the job-candidate fit based on the following information:
-            
-            {job_context}
-            
-            Provide a detailed analysis in JSON format with:
-            1. technical_skills: List of technical skills required
-            2. soft_skills: List of soft skills required
-            3. tools_technologies: List of tools and technologies mentioned
-            4. certifications: List of required certifications
-            5. overall_match_score: Overall match percentage (0-100)
-            6. skills_match_score: Skills match percentage (0-100)
-            7. experience_match_score: Experience match percentage (0-100)
-            8. missing_skills: Skills the candidate is missing
-            9. matching_skills: Skills the candidate has
-            10. recommendations: List of 3-5 actionable recommendations
-            11. ai_summary: Brief summary of the job (100 words)
-            12. ai_fit_assessment: Assessment of candidate fit (100 words)
-            13. interview_tips: List of 3-5 interview preparation tips
-            
-            Be specific and accurate in your scoring.
-            """
-            
-            response = self.openai_client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert career advisor and resume analyst."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            # Create JobAnalysis object
-            analysis = JobAnalysis(
-                job_id=job_context[:50],  # Use part of context as ID
-                technical_skills=result.get("technical_skills", []),
-                soft_skills=result.get("soft_skills", []),
-                tools_technologies=result.get("tools_technologies", []),
-                certifications=result.get("certifications", []),
-                overall_match_score=result.get("overall_match_score", 0),
-                skills_match_score=result.get("skills_match_score", 0),
-                experience_match_score=result.get("experience_match_score", 0),
-                missing_skills=result.get("missing_skills", []),
-                matching_skills=result.get("matching_skills", []),
-                recommendations=result.get("recommendations", []),
-                ai_summary=result.get("ai_summary", ""),
-                ai_fit_assessment=result.get("ai_fit_assessment", ""),
-                interview_tips=result.get("interview_tips", [])
-            )
-            
-            return analysis
+            response = await _create_completion(self.openai_client, **self._openai_request(job_context))
+            result = orjson.loads(response.choices[0].message.content)
+            return self._analysis_from_result(job_context, result)
             
         except Exception as e:
             logger.error(f"OpenAI analysis failed: {e}")
             # Return a basic analysis on failure
             return self._create_basic_analysis(job_context)
+
+    def _openai_request(self, job_context: str) -> Dict[str, Any]:
+        """Build the chat completion request body for an OpenAI analysis."""
+        return {
+            "model": settings.openai_model,
+            "messages": [
+                {"role": "system", "content": self._system_prompt(ANALYSIS_INSTRUCTIONS)},
+                {"role": "user", "content": job_context}
+            ],
+            "temperature": 0.3,
+            "response_format": {"type": "json_schema", "json_schema": ANALYSIS_JSON_SCHEMA}
+        }
+
+    @staticmethod
+    def _analysis_from_result(job_context: str, result: Dict[str, Any]) -> JobAnalysis:
+        """Create a JobAnalysis from the JSON an LLM analysis returned; pydantic coerces the scores."""
+        return JobAnalysis(
+            job_id=job_context[:50],  # Use part of context as ID
+            **{**ANALYSIS_DEFAULTS, **{field: result[field] for field in ANALYSIS_DEFAULTS if field in result}}
+        )
     
-    async def _analyze_with_groq(self, job_context: str) -> JobAnalysis:
-        """Analyze job fit using Groq for faster inference."""
+    async def _analyze_with_groq(self, job_context: str) -> Tuple[JobAnalysis, str]:
+        """
+        Analyze job fit using Groq for faster inference.
+
+        Returns:
+            The analysis and the model that produced it (OpenAI's when Groq fails)
+        """
         try:
-            prompt = f"""
-            Analyze the job-candidate fit. Return ONLY valid JSON:
-            
-            {job_context}
-            
-            Required JSON structure:
-            {{
-                "technical_skills": [],
-                "soft_skills": [],
-                "tools_technologies": [],
-                "certifications": [],
-                "overall_match_score": 0-100,
-                "skills_match_score": 0-100,
-                "experience_match_score": 0-100,
-                "missing_skills": [],
-                "matching_skills": [],
-                "recommendations": [],
-                "ai_summary": "brief job summary",
-                "ai_fit_assessment": "fit assessment",
-                "interview_tips": []
-            }}
-            """
-            
-            response = self.groq_client.chat.completions.create(
+            response = await _create_completion(
+                self.groq_client,
                 model=settings.groq_model,
                 messages=[
-                    {"role": "system", "content": "You are a career advisor. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": self._system_prompt(GROQ_ANALYSIS_INSTRUCTIONS)},
+                    {"role": "user", "content": job_context}
                 ],
                 temperature=0.1,  # Lower for faster, more consistent results
-                max_tokens=1500  # Reduced for faster response
+                max_tokens=1500,  # Reduced for faster response
+                response_format={"type": "json_object"}
             )
             
-            # Extract JSON from response
-            content = response.choices[0].message.content
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            
-            if json_match:
-                result = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-            
-            # Create JobAnalysis object
-            analysis = JobAnalysis(
-                job_id=job_context[:50],
-                technical_skills=result.get("technical_skills", []),
-                soft_skills=result.get("soft_skills", []),
-                tools_technologies=result.get("tools_technologies", []),
-                certifications=result.get("certifications", []),
-                overall_match_score=float(result.get("overall_match_score", 0)),
-                skills_match_score=float(result.get("skills_match_score", 0)),
-                experience_match_score=float(result.get("experience_match_score", 0)),
-                missing_skills=result.get("missing_skills", []),
-                matching_skills=result.get("matching_skills", []),
-                recommendations=result.get("recommendations", []),
-                ai_summary=result.get("ai_summary", ""),
-                ai_fit_assessment=result.get("ai_fit_assessment", ""),
-                interview_tips=result.get("interview_tips", [])
-            )
+            result = _loads_llm_json(response.choices[0].message.content)
             
-            return analysis
+            return self._analysis_from_result(job_context, result), settings.groq_model
             
         except Exception as e:
             logger.error(f"Groq analysis failed: {e}")
             # Fall back to OpenAI if Groq fails
             if self.openai_client:
-                return await self._analyze_with_openai(job_context)
-            return self._create_basic_analysis(job_context)
+                return await self._analyze_with_openai(job_context), settings.openai_model
+            return self._create_basic_analysis(job_context), settings.groq_model
     
     def _create_basic_analysis(self, job_context: str) -> JobAnalysis:
         """Create a basic analysis when AI services fail."""
-        # Extract skills using regex
-        tech_keywords = ['python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker', 'kubernetes']
-        soft_keywords = ['communication', 'leadership', 'teamwork', 'problem-solving']
+        # Extract skills with one keyword scan of the job text
+        job_hits = _basic_keyword_hits(job_context.lower())
         
-        job_lower = job_context.lower()
-        
-        technical_skills = [skill for skill in tech_keywords if skill in job_lower]
-        soft_skills = [skill for skill in soft_keywords if skill in job_lower]
+        technical_skills = [skill for skill in BASIC_TECH_KEYWORDS if skill in job_hits]
+        soft_skills = [skill for skill in BASIC_SOFT_KEYWORDS if skill in job_hits]
         
         # Basic matching
-        resume_lower = self.resume_profile.resume_text.lower()
-        matching_skills = [skill for skill in technical_skills if skill in resume_lower]
+        resume_hits = _basic_keyword_hits(self.resume_profile.resume_text_lower)
+        matching_skills = [skill for skill in technical_skills if skill in resume_hits]
         
         match_percentage = (len(matching_skills) / len(technical_skills) * 100) if technical_skills else 50
         
@@ -316,7 +657,7 @@ class ResumeMatcherService:
             matching_skills=matching_skills,
             recommendations=["Review job requirements carefully", "Tailor your resume to match"],
             ai_summary="Job analysis unavailable",
-            ai_fit_assessment="Basic analysis only",
+            ai_fit_assessment=BASIC_ANALYSIS_ASSESSMENT,
             interview_tips=["Research the company", "Prepare examples of your work"]
         )
     
@@ -330,47 +671,239 @@ class ResumeMatcherService:
         Returns:
             List of keywords
         """
-        text = f"{job.title} {job.description} {' '.join(job.requirements)} {' '.join(job.qualifications)}"
-        
-        # Common tech keywords
-        keywords = []
-        tech_patterns = [
-            r'\b(python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|swift|kotlin)\b',
-            r'\b(react|angular|vue|node|django|flask|spring|rails|laravel)\b',
-            r'\b(aws|azure|gcp|docker|kubernetes|jenkins|ci/cd|devops)\b',
-            r'\b(sql|nosql|mongodb|postgresql|mysql|redis|elasticsearch)\b',
-            r'\b(machine learning|ai|data science|deep learning|nlp|computer vision)\b',
-            r'\b(agile|scrum|kanban|jira|git|github|gitlab)\b'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text_lower)
-            keywords.extend(matches)
-        
-        # Remove duplicates and return
-        return list(set(keywords))
+        # Common tech keywords, without duplicates
+        return list(set().union(*self.extract_keyword_categories(job).values()))
+
+    def extract_keyword_categories(self, job: JobListing) -> Dict[str, List[str]]:
+        """
+        Extract tech keywords from a job listing, grouped by category.
+
+        Args:
+            job: Job listing
+
+        Returns:
+            Keywords per TECH_KEYWORDS category, for categories with any hits
+        """
+        return {
+            category: sorted(keywords)
+            for category, keywords in _tech_keyword_hits(job.search_text_lower).items()
+        }
     
     async def batch_analyze_jobs(self, jobs: List[JobListing]) -> List[Tuple[JobListing, JobAnalysis]]:
         """
-        Analyze multiple jobs in batch.
+        Analyze multiple jobs concurrently, at most settings.llm_concurrency at a time.
+
+        With settings.prefilter_min_similarity set, jobs whose embedding is
+        too far from the resume are scored from cosine similarity instead.
         
         Args:
             jobs: List of job listings
             
         Returns:
-            List of tuples (job, analysis)
+            List of tuples (job, analysis), in input order, for jobs that could be analyzed
         """
+        to_analyze, prefiltered = jobs, []
+        if settings.prefilter_min_similarity > 0 and jobs:
+            to_analyze, prefiltered = await self._prefilter_jobs(jobs)
+
+        if settings.use_batch_api:
+            results = await self.batch_analyze_jobs_offline(to_analyze)
+        else:
+            results = await self._analyze_jobs_concurrently(to_analyze)
+
+        if prefiltered:
+            order = {id(job): index for index, job in enumerate(jobs)}
+            results = sorted(results + prefiltered, key=lambda pair: order[id(pair[0])])
+        return results
+
+    async def _analyze_jobs_concurrently(self, jobs: List[JobListing]) -> List[Tuple[JobListing, JobAnalysis]]:
+        """Run analyze_job_fit over jobs, at most settings.llm_concurrency at a time."""
+        semaphore = asyncio.Semaphore(settings.llm_concurrency or 16)
+
+        async def analyze(job: JobListing) -> JobAnalysis:
+            async with semaphore:
+                return await self.analyze_job_fit(job)
+
+        analyses = await asyncio.gather(*(analyze(job) for job in jobs), return_exceptions=True)
+
         results = []
+        for job, analysis in zip(jobs, analyses):
+            if isinstance(analysis, BaseException):
+                logger.error(f"Failed to analyze job {job.title}: {analysis}")
+                continue
+            results.append((job, analysis))
         
-        for job in jobs:
+        return results
+
+    async def _prefilter_jobs(
+        self, jobs: List[JobListing]
+    ) -> Tuple[List[JobListing], List[Tuple[JobListing, JobAnalysis]]]:
+        """
+        Split jobs by embedding similarity to the resume.
+
+        Jobs below settings.prefilter_min_similarity get a keyword analysis
+        scored from the cosine similarity instead of an LLM call.
+
+        Returns:
+            Jobs to send to the LLM, and (job, analysis) pairs for skipped jobs
+        """
+        job_contexts = [self._build_job_block(job) for job in jobs]
+        try:
+            similarities = await self._resume_similarities(job_contexts)
+        except Exception as e:
+            logger.warning(f"Embedding prefilter failed, analyzing every job: {e}")
+            return jobs, []
+
+        keep, skipped = [], []
+        for job, job_context, similarity in zip(jobs, job_contexts, similarities):
+            if similarity >= settings.prefilter_min_similarity:
+                keep.append(job)
+                continue
+            analysis = self._create_basic_analysis(job_context)
+            analysis.overall_match_score = round(max(float(similarity), 0.0) * 100, 1)
+            self._apply_analysis(job, analysis)
+            skipped.append((job, analysis))
+
+        logger.info(f"Embedding prefilter skipped {len(skipped)} of {len(jobs)} jobs")
+        return keep, skipped
+
+    async def _resume_similarities(self, texts: List[str]) -> np.ndarray:
+        """Cosine similarity of each text to the resume."""
+        if self.resume_embedding is None:
+            self.resume_embedding = (await self._embed([self._build_candidate_block()]))[0]
+        return await self._embed(texts) @ self.resume_embedding
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, reusing vectors cached by content hash.
+
+        Uncached texts go out in concurrent requests sized by
+        _embedding_chunks() to the endpoint's input and token limits.
+
+        Returns:
+            Matrix of L2-normalized embeddings, one row per text
+        """
+        keys = [
+            f"embedding:{settings.embedding_model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+            for text in texts
+        ]
+        vectors = [self.analysis_cache.get(key) for key in keys]
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+
+        if missing:
+            chunks = _embedding_chunks(texts, missing)
+            responses = await asyncio.gather(*(
+                _create_embeddings(
+                    self.openai_client,
+                    model=settings.embedding_model,
+                    input=[texts[index] for index in chunk]
+                )
+                for chunk in chunks
+            ))
+            for chunk, response in zip(chunks, responses):
+                for index, item in zip(chunk, sorted(response.data, key=lambda item: item.index)):
+                    vectors[index] = np.asarray(item.embedding, dtype=np.float32)
+                    self.analysis_cache.set(keys[index], vectors[index])
+
+        matrix = np.vstack(vectors)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    async def batch_analyze_jobs_offline(self, jobs: List[JobListing]) -> List[Tuple[JobListing, JobAnalysis]]:
+        """
+        Analyze multiple jobs through OpenAI's Batch API.
+
+        Costs half as much as live requests but may take up to 24 hours, so it
+        suits scheduled runs rather than interactive use.
+
+        Args:
+            jobs: List of job listings
+
+        Returns:
+            List of tuples (job, analysis), in input order, for jobs that could be analyzed
+        """
+        contexts = [self._build_job_block(job) for job in jobs]
+        cache_keys = [
+            self._analysis_cache_key(job, context, settings.openai_model)
+            for job, context in zip(jobs, contexts)
+        ]
+
+        analyses = {}
+        for index, cache_key in enumerate(cache_keys):
+            analysis = self._get_cached_analysis(cache_key)
+            if analysis is not None:
+                analyses[index] = analysis
+
+        pending = [index for index in range(len(jobs)) if index not in analyses]
+        if not pending:
+            return self._collect_batch_results(jobs, analyses)
+
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_request(contexts[index])
+            })
+            for index in pending
+        ]
+
+        try:
+            batch_file = await self.openai_client.files.create(
+                file=("jobs.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted {len(pending)} jobs as OpenAI batch {batch.id}")
+
+            delay = BATCH_POLL_MIN_SECONDS
+            while batch.status not in BATCH_FINAL_STATUSES:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+                batch = await self.openai_client.batches.retrieve(batch.id)
+
+            if not batch.output_file_id:
+                logger.error(f"OpenAI batch {batch.id} ended as {batch.status} with no output")
+                return self._collect_batch_results(jobs, analyses)
+            output = await self.openai_client.files.content(batch.output_file_id)
+
+        except Exception as e:
+            logger.error(f"OpenAI batch analysis failed: {e}")
+            return self._collect_batch_results(jobs, analyses)
+
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            response = record.get("response") or {}
             try:
-                analysis = await self.analyze_job_fit(job)
-                results.append((job, analysis))
+                if response.get("status_code") != 200:
+                    raise ValueError(record.get("error") or f"status {response.get('status_code')}")
+                content = response["body"]["choices"][0]["message"]["content"]
+                analyses[index] = self._analysis_from_result(contexts[index], orjson.loads(content))
+                self._cache_analysis(cache_keys[index], analyses[index])
             except Exception as e:
-                logger.error(f"Failed to analyze job {job.title}: {e}")
-                continue
-        
+                logger.error(f"Failed to analyze job {jobs[index].title}: {e}")
+
+        logger.info(f"OpenAI batch {batch.id} ({batch.status}) finished with {len(analyses)} of {len(jobs)} jobs analyzed")
+        return self._collect_batch_results(jobs, analyses)
+
+    def _collect_batch_results(
+        self,
+        jobs: List[JobListing],
+        analyses: Dict[int, JobAnalysis]
+    ) -> List[Tuple[JobListing, JobAnalysis]]:
+        """Apply analyses (keyed by position in jobs) and pair them with their jobs, in input order."""
+        results = []
+        for index, job in enumerate(jobs):
+            analysis = analyses.get(index)
+            if analysis is not None:
+                self._apply_analysis(job, analysis)
+                results.append((job, analysis))
         return results
 
 
@@ -408,7 +941,10 @@ def test_resume_matcher():
     # Test matching
     async def run_test():
         matcher = ResumeMatcherService(resume)
-        analysis = await matcher.analyze_job_fit(job)
+        try:
+            analysis = await matcher.analyze_job_fit(job)
+        finally:
+            await close_ai_clients()
         
         print(f"Overall Match: {analysis.overall_match_score}%")
         print(f"Matching Skills: {analysis.matching_skills}")